@@ -1,7 +1,11 @@
 import behave
 
-from features.support import with_aws_lambda_environment_variables
+from features.support import with_aws_lambda_environment_variables, with_cold_lambda_container
 
 
 def before_all(context):
     behave.use_fixture(with_aws_lambda_environment_variables, context)
+
+
+def before_scenario(context, scenario):
+    behave.use_fixture(with_cold_lambda_container, context)
@@ -16,8 +16,8 @@ def make_post_client_credentials() -> Response:
 def make_get_track_whispers_request() -> Response:
     return Response(
         method='GET',
-        url='https://api.spotify.com/v1/tracks/4rNGLh1y5Kkvr4bT28yfHU',
-        json=WHISPERS_SPOTIFY_TRACK
+        url='https://api.spotify.com/v1/tracks?ids=4rNGLh1y5Kkvr4bT28yfHU',
+        json={'tracks': [WHISPERS_SPOTIFY_TRACK]}
     )
 
 
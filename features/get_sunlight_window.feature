@@ -8,3 +8,30 @@ Feature: Request a sunlight window
     Then I get a sunlight window with the values
       | sunrise_utc         | sunset_utc          |
       | 2018-11-12T11:40:04 | 2018-11-12T21:40:26 |
+
+  Scenario: I request a sunlight window with a persisted query
+    Given I live in new york
+    And today's date is November 12th, 2018
+    And sunrise is at "2018-11-12T11:40:04" utc
+    And sunset is at "2018-11-12T21:40:26" utc
+    When I request today's sunlight window by the hash of its query
+    Then I get an error response that says "PersistedQueryNotFound"
+    When I request today's sunlight window with its query and the hash of its query
+    Then I get a sunlight window with the values
+      | sunrise_utc         | sunset_utc          |
+      | 2018-11-12T11:40:04 | 2018-11-12T21:40:26 |
+    When I request today's sunlight window again by the hash of its query
+    Then I get a sunlight window with the values
+      | sunrise_utc         | sunset_utc          |
+      | 2018-11-12T11:40:04 | 2018-11-12T21:40:26 |
+
+  Scenario: I request a sunlight window with a GET request
+    Given I live in new york
+    And today's date is November 12th, 2018
+    And sunrise is at "2018-11-12T11:40:04" utc
+    And sunset is at "2018-11-12T21:40:26" utc
+    When I request today's sunlight window with a GET request
+    Then I get a sunlight window with the values
+      | sunrise_utc         | sunset_utc          |
+      | 2018-11-12T11:40:04 | 2018-11-12T21:40:26 |
+    And the response can be cached forever, as november 12th 2018 has passed
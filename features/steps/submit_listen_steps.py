@@ -102,7 +102,10 @@ def step_impl(context):
 
 @then('a request is sent to the listens service to add my listen')  # noqa: F811
 def step_impl(context):
-    listens_service_call = context.mock_network_calls[1]
+    listens_service_call = next(
+        call for call in context.mock_network_calls
+        if call.request.url == 'https://micro.morningcd.com/listens'
+    )
 
     expected_request_body = {
         'song_id': context.song_id,
@@ -135,11 +138,6 @@ def steal_mock_calls(mock_network: responses.RequestsMock) -> List[responses.Cal
 def submit_listen_mock_network(context):
     with responses.RequestsMock() as mock_responses:
 
-        # spotify gateway eagerly fetches client credentials on creation
-        mock_responses.add(
-            make_post_client_credentials()
-        )
-
         if context.is_day:
             mock_responses.add(
                 make_post_listen_request_day(
@@ -152,6 +150,8 @@ def submit_listen_mock_network(context):
                 )
             )
 
+            # spotify gateway lazily fetches client credentials when we first request a song
+            mock_responses.add(make_post_client_credentials())
             mock_responses.add(make_get_track_whispers_request())
 
         else:
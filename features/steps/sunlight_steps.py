@@ -1,6 +1,8 @@
+import hashlib
 import json
 import os
 from contextlib import contextmanager
+from typing import Dict
 
 import behave
 from behave import given, then, when
@@ -9,8 +11,7 @@ from faaspact_maker import Interaction, PactMaker, RequestWithMatchers, Response
 
 import responses
 
-from features.fixtures.spotify import make_post_client_credentials
-from features.support.make_graphql_request import make_graphql_request
+from features.support.make_graphql_request import make_graphql_get_request, make_graphql_request
 
 from front.delivery.aws_lambda.graphql import handler as front_graphql_handler
 
@@ -25,22 +26,26 @@ def step_impl(context, sunset_utc: str):
     context.sunset_utc = sunset_utc
 
 
-@when('I request today\'s sunlight window')  # noqa: F811
-def step_impl(context):
-    query = """
-    query sunlight($ianaTimezone: String!, $onDate: Date!) {
-      sunlightWindow(ianaTimezone: $ianaTimezone, onDate: $onDate) {
-        sunriseUtc
-        sunsetUtc
-      }
-    }
-    """
-    variables = {
-        'ianaTimezone': context.iana_timezone,
-        'onDate': context.todays_date.isoformat()
+SUNLIGHT_QUERY = """
+query sunlight($ianaTimezone: String!, $onDate: Date!) {
+  sunlightWindow(ianaTimezone: $ianaTimezone, onDate: $onDate) {
+    sunriseUtc
+    sunsetUtc
+  }
+}
+"""
+
+SUNLIGHT_QUERY_EXTENSIONS = {
+    'persistedQuery': {
+        'version': 1,
+        'sha256Hash': hashlib.sha256(SUNLIGHT_QUERY.encode('utf-8')).hexdigest()
     }
+}
 
-    event = make_graphql_request(query, variables)
+
+@when('I request today\'s sunlight window')  # noqa: F811
+def step_impl(context):
+    event = make_graphql_request(SUNLIGHT_QUERY, sunlight_query_variables(context))
 
     with sunlight_service_mock_network(context) as mock_network:
         fetch_sunlight_window_response = front_graphql_handler(event, {})
@@ -49,6 +54,54 @@ def step_impl(context):
     context.mock_network = mock_network
 
 
+@when('I request today\'s sunlight window with a GET request')  # noqa: F811
+def step_impl(context):
+    event = make_graphql_get_request(SUNLIGHT_QUERY, sunlight_query_variables(context))
+
+    with sunlight_service_mock_network(context) as mock_network:
+        context.response = front_graphql_handler(event, {})
+
+    context.mock_network = mock_network
+
+
+@when('I request today\'s sunlight window by the hash of its query')  # noqa: F811
+def step_impl(context):
+    event = make_graphql_request(
+        None,
+        sunlight_query_variables(context),
+        extensions=SUNLIGHT_QUERY_EXTENSIONS
+    )
+
+    context.response = front_graphql_handler(event, {})
+
+
+@when('I request today\'s sunlight window with its query and the hash of its query')  # noqa: F811
+def step_impl(context):
+    event = make_graphql_request(
+        SUNLIGHT_QUERY,
+        sunlight_query_variables(context),
+        extensions=SUNLIGHT_QUERY_EXTENSIONS
+    )
+
+    with sunlight_service_mock_network(context) as mock_network:
+        context.response = front_graphql_handler(event, {})
+
+    context.mock_network = mock_network
+
+
+@when('I request today\'s sunlight window again by the hash of its query')  # noqa: F811
+def step_impl(context):
+    event = make_graphql_request(
+        None,
+        sunlight_query_variables(context),
+        extensions=SUNLIGHT_QUERY_EXTENSIONS
+    )
+
+    # the sunlight window was cached by the last request, so no requests should be made.
+    with responses.RequestsMock():
+        context.response = front_graphql_handler(event, {})
+
+
 @then('I get a sunlight window with the values')  # noqa: F811
 def step_impl(context):
     expected_sunrise_utc = context.table[0][0]
@@ -67,6 +120,18 @@ def step_impl(context):
     assert body == expected_sunlight_window_response
 
 
+@then('the response can be cached forever, as november 12th 2018 has passed')  # noqa: F811
+def step_impl(context):
+    assert context.response['headers']['Cache-Control'] == 'public, max-age=31536000, immutable'
+
+
+def sunlight_query_variables(context: behave.runner.Context) -> Dict[str, str]:
+    return {
+        'ianaTimezone': context.iana_timezone,
+        'onDate': context.todays_date.isoformat()
+    }
+
+
 @contextmanager
 def sunlight_service_mock_network(context: behave.runner.Context):
     pact_dir = os.environ.get('PACT_DIRECTORY', 'pacts')
@@ -91,11 +156,6 @@ def sunlight_service_mock_network(context: behave.runner.Context):
     ))
 
     with responses.RequestsMock() as mock_responses:
-        # spotify gateway eagerly fetches client credentials on creation
-        mock_responses.add(
-            make_post_client_credentials()
-        )
-
         # we check the date
         with pact.start_mocking(outer=mock_responses):
             yield mock_responses
@@ -1 +1,2 @@
 from .with_aws_lambda_environment_variables import with_aws_lambda_environment_variables
+from .with_cold_lambda_container import with_cold_lambda_container
@@ -1,11 +1,27 @@
 import json
-from typing import Dict
+from typing import Dict, Optional
 
 
-def make_graphql_request(query: str, variables: Dict) -> Dict[str, str]:
+def make_graphql_request(query: Optional[str],
+                         variables: Dict,
+                         extensions: Optional[Dict] = None) -> Dict[str, str]:
+    body = {
+        'query': query,
+        'variables': variables
+    }
+    if extensions:
+        body['extensions'] = extensions
+
+    return {
+        'body': json.dumps(body)
+    }
+
+
+def make_graphql_get_request(query: str, variables: Dict) -> Dict:
     return {
-        'body': json.dumps({
+        'httpMethod': 'GET',
+        'queryStringParameters': {
             'query': query,
-            'variables': variables
-        })
+            'variables': json.dumps(variables)
+        }
     }
@@ -0,0 +1,26 @@
+from typing import Generator
+from unittest.mock import patch
+
+import behave
+
+from front.delivery import gateways
+from front.gateways.music import spotify_token_manager
+
+
+@behave.fixture  # type: ignore
+def with_cold_lambda_container(context: behave.runner.Context) -> Generator:
+    """Run a scenario against a cold lambda container, so that module-level state kept around for
+    warm invocations (like spotify bearer tokens and caches) doesn't leak between scenarios.
+    """
+    gateways.song_cache.clear()
+    gateways.sunlight_window_cache.clear()
+    gateways.document_cache.clear()
+    gateways.persisted_query_cache.clear()
+    gateways.listens_feed_cache.clear()
+    gateways.listens_page_cache.clear()
+    gateways.listen_cache.clear()
+    gateways.listens_timeline.clear()
+    gateways.listens_feed_timezones.clear()
+
+    with patch.dict(spotify_token_manager._token_managers, clear=True):
+        yield
@@ -0,0 +1,4 @@
+from .codecs import Codec, song_codec, sunlight_window_codec, text_codec
+from .disk_cache import DiskBackedLruCache, DiskCache, create_lru_cache
+from .listens_timeline import ListensTimeline
+from .lru_cache import CacheStats, LruCache
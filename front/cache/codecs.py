@@ -0,0 +1,120 @@
+"""Compact binary encodings of the definitions we keep in disk caches. Strings are length-prefixed
+utf-8 and datetimes are microseconds since the unix epoch, so encoding and decoding is just a few
+`struct` calls.
+"""
+import struct
+from datetime import datetime, timedelta
+from typing import Callable, Generic, List, Tuple, TypeVar
+
+from front.definitions import MusicProvider, Song, SunlightWindow
+
+
+V = TypeVar('V')
+
+EPOCH = datetime(1970, 1, 1)
+
+
+class Codec(Generic[V]):
+
+    def __init__(self, encode: Callable[[V], bytes], decode: Callable[[bytes], V]) -> None:
+        self.encode = encode
+        self.decode = decode
+
+
+def encode_song(song: Song) -> bytes:
+    """
+    >>> song = Song(
+    ...     id='4rNGLh1y5Kkvr4bT28yfHU',
+    ...     music_provider=MusicProvider.SPOTIFY,
+    ...     name='Whispers',
+    ...     artist_name='DAP The Contract',
+    ...     album_name='Everybody Falls in the Summer',
+    ...     image_url_by_size={'large': 'https://i.scdn.co/image/8bc9'}
+    ... )
+    >>> decode_song(encode_song(song)) == song
+    True
+    """
+    strings = [song.id, song.name, song.artist_name, song.album_name]
+    for size, url in song.image_url_by_size.items():
+        strings += [size, url]
+
+    return struct.pack('<B', song.music_provider.value) + _pack_strings(strings)
+
+
+def decode_song(raw_song: bytes) -> Song:
+    music_provider_value, = struct.unpack_from('<B', raw_song)
+    id, name, artist_name, album_name, *image_strings = _unpack_strings(raw_song, offset=1)
+
+    return Song(
+        id=id,
+        music_provider=MusicProvider(music_provider_value),
+        name=name,
+        artist_name=artist_name,
+        album_name=album_name,
+        image_url_by_size=dict(zip(image_strings[::2], image_strings[1::2]))
+    )
+
+
+def encode_sunlight_window(sunlight_window: SunlightWindow) -> bytes:
+    """
+    >>> sunlight_window = SunlightWindow(
+    ...     sunrise_utc=datetime(2018, 11, 12, 11, 40, 4),
+    ...     sunset_utc=datetime(2018, 11, 12, 21, 40, 26)
+    ... )
+    >>> len(encode_sunlight_window(sunlight_window))
+    16
+    >>> decode_sunlight_window(encode_sunlight_window(sunlight_window)) == sunlight_window
+    True
+    """
+    return struct.pack(
+        '<qq',
+        _to_epoch_microseconds(sunlight_window.sunrise_utc),
+        _to_epoch_microseconds(sunlight_window.sunset_utc)
+    )
+
+
+def decode_sunlight_window(raw_sunlight_window: bytes) -> SunlightWindow:
+    sunrise_utc, sunset_utc = struct.unpack('<qq', raw_sunlight_window)
+    return SunlightWindow(
+        sunrise_utc=_from_epoch_microseconds(sunrise_utc),
+        sunset_utc=_from_epoch_microseconds(sunset_utc)
+    )
+
+
+song_codec: Codec[Song] = Codec(encode_song, decode_song)
+sunlight_window_codec: Codec[SunlightWindow] = Codec(
+    encode_sunlight_window,
+    decode_sunlight_window
+)
+text_codec: Codec[str] = Codec(str.encode, bytes.decode)
+
+
+def _pack_strings(strings: List[str]) -> bytes:
+    encoded_strings = [string.encode('utf-8') for string in strings]
+    return b''.join(
+        struct.pack('<H', len(encoded_string)) + encoded_string
+        for encoded_string in encoded_strings
+    )
+
+
+def _unpack_strings(raw: bytes, offset: int) -> List[str]:
+    strings = []
+    while offset < len(raw):
+        string, offset = _unpack_string(raw, offset)
+        strings.append(string)
+
+    return strings
+
+
+def _unpack_string(raw: bytes, offset: int) -> Tuple[str, int]:
+    length, = struct.unpack_from('<H', raw, offset)
+    start = offset + 2
+    return raw[start:start + length].decode('utf-8'), start + length
+
+
+def _to_epoch_microseconds(dt: datetime) -> int:
+    return (dt - EPOCH) // timedelta(microseconds=1)
+
+
+def _from_epoch_microseconds(microseconds: int) -> datetime:
+    return EPOCH + timedelta(microseconds=microseconds)
@@ -0,0 +1,317 @@
+import logging
+import sqlite3
+import threading
+import time
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+from front.cache.codecs import Codec
+from front.cache.lru_cache import CacheStats, LruCache
+
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache(Generic[V]):
+    """A sqlite-backed cache of encoded values, bounded to `max_bytes` of encoded values per
+    namespace. A lambda container keeps its `/tmp` directory for as long as the container lives, so
+    a disk cache there outlives the module-level state of a crashed or redeployed handler.
+
+    Several namespaces (i.e. one for songs and one for sunlight windows) can share one file.
+    Sqlite errors are logged and treated as misses; a broken disk cache never fails a request. An
+    entry that can't be decoded (i.e. one written by an older version of its codec) is deleted
+    and treated as a miss too, and a value that can't be encoded isn't cached. A connection waits
+    up to `timeout` seconds for a lock held by another connection to the file before giving up.
+
+    The bytes of a namespace are summed once, then kept as a running total by each `set`,
+    `invalidate` and eviction, so writing an entry doesn't scan the namespace. The total doesn't
+    see writes made by other connections to the file until it's summed again after an error.
+
+    >>> import tempfile, os
+    >>> from front.cache.codecs import Codec
+    >>> path = os.path.join(tempfile.mkdtemp(), 'cache.sqlite3')
+    >>> utf8 = Codec(str.encode, bytes.decode)
+    >>> cache = DiskCache(path, 'words', utf8, max_bytes=10)
+    >>> cache.set('a', 'hello')
+    >>> cache.set('b', 'world')
+    >>> cache.get('a')
+    'hello'
+    >>> cache.set('c', '!')  # evicts 'b', the least recently used entry
+    >>> cache.get('b') is None
+    True
+    >>> DiskCache(path, 'words', utf8, max_bytes=10).get('c')  # entries outlive the process
+    '!'
+    """
+
+    def __init__(self,
+                 path: str,
+                 namespace: str,
+                 codec: Codec[V],
+                 max_bytes: int,
+                 ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.time,
+                 timeout: float = 5.0) -> None:
+        self.namespace = namespace
+        self.codec = codec
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._total_bytes: Optional[int] = None
+
+        self._connection = sqlite3.connect(
+            path,
+            timeout=timeout,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                '  namespace TEXT NOT NULL,'
+                '  key TEXT NOT NULL,'
+                '  value BLOB NOT NULL,'
+                '  expires_at REAL NOT NULL,'
+                '  accessed_at REAL NOT NULL,'
+                '  PRIMARY KEY (namespace, key)'
+                ')'
+            )
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS entries_by_access ON entries (namespace, accessed_at)'
+            )
+
+    def get(self, key: str) -> Optional[V]:
+        entry = self.get_with_ttl(key)
+        return entry[0] if entry is not None else None
+
+    def get_with_ttl(self, key: str) -> Optional[Tuple[V, float]]:
+        """Get the value of `key` along with the seconds it has left to live, which are infinite
+        for an entry without a ttl.
+        """
+        now = self._clock()
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    'SELECT value, expires_at FROM entries'
+                    ' WHERE namespace = ? AND key = ? AND expires_at > ?',
+                    (self.namespace, key, now)
+                ).fetchone()
+
+                if row is None:
+                    self._misses += 1
+                    return None
+
+                try:
+                    value = self.codec.decode(row[0])
+                except Exception:
+                    logger.exception('Error decoding %s from disk cache %s.', key, self.namespace)
+                    self._misses += 1
+                    self._delete(key)
+                    return None
+
+                self._connection.execute(
+                    'UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?',
+                    (now, self.namespace, key)
+                )
+                self._hits += 1
+                return value, row[1] - now
+
+        except sqlite3.Error:
+            logger.exception('Error reading from disk cache %s.', self.namespace)
+            with self._lock:
+                self._misses += 1
+            return None
+
+    def set(self, key: str, value: V, ttl: Optional[float] = None) -> None:
+        now = self._clock()
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = now + ttl if ttl is not None else float('inf')
+
+        try:
+            encoded_value = self.codec.encode(value)
+        except Exception:
+            # the entry on disk, if any, is older than `value`, so it mustn't be served either
+            logger.exception('Error encoding %s for disk cache %s.', key, self.namespace)
+            self.invalidate(key)
+            return
+
+        try:
+            with self._lock:
+                total_bytes = self._namespace_bytes() - self._entry_bytes(key)
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)',
+                    (self.namespace, key, encoded_value, expires_at, now)
+                )
+                self._total_bytes = total_bytes + len(encoded_value)
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+
+        except sqlite3.Error:
+            logger.exception('Error writing to disk cache %s.', self.namespace)
+            self._total_bytes = None
+
+    def invalidate(self, key: str) -> None:
+        try:
+            with self._lock:
+                self._delete(key)
+
+        except sqlite3.Error:
+            logger.exception('Error invalidating %s in disk cache %s.', key, self.namespace)
+            self._total_bytes = None
+
+    def clear(self) -> None:
+        try:
+            with self._lock:
+                self._connection.execute(
+                    'DELETE FROM entries WHERE namespace = ?', (self.namespace,)
+                )
+                self._total_bytes = 0
+
+        except sqlite3.Error:
+            logger.exception('Error clearing disk cache %s.', self.namespace)
+            self._total_bytes = None
+
+    @property
+    def stats(self) -> CacheStats:
+        """The size of a disk cache that can't be read is reported as 0."""
+        with self._lock:
+            try:
+                size, = self._connection.execute(
+                    'SELECT COUNT(*) FROM entries WHERE namespace = ?', (self.namespace,)
+                ).fetchone()
+            except sqlite3.Error:
+                logger.exception('Error counting the entries of disk cache %s.', self.namespace)
+                size = 0
+
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=size
+            )
+
+    def _namespace_bytes(self) -> int:
+        if self._total_bytes is None:
+            self._total_bytes, = self._connection.execute(
+                'SELECT COALESCE(SUM(LENGTH(value)), 0) FROM entries WHERE namespace = ?',
+                (self.namespace,)
+            ).fetchone()
+
+        return self._total_bytes
+
+    def _entry_bytes(self, key: str) -> int:
+        row = self._connection.execute(
+            'SELECT LENGTH(value) FROM entries WHERE namespace = ? AND key = ?',
+            (self.namespace, key)
+        ).fetchone()
+        return int(row[0]) if row is not None else 0
+
+    def _delete(self, key: str) -> None:
+        total_bytes = self._namespace_bytes() - self._entry_bytes(key)
+        self._connection.execute(
+            'DELETE FROM entries WHERE namespace = ? AND key = ?', (self.namespace, key)
+        )
+        self._total_bytes = total_bytes
+
+    def _evict(self) -> None:
+        """Delete expired entries, then least recently accessed entries until the namespace fits in
+        `max_bytes`. Only called once the namespace is over `max_bytes`.
+        """
+        now = self._clock()
+        expired_bytes, = self._connection.execute(
+            'SELECT COALESCE(SUM(LENGTH(value)), 0) FROM entries'
+            ' WHERE namespace = ? AND expires_at <= ?',
+            (self.namespace, now)
+        ).fetchone()
+        self._connection.execute(
+            'DELETE FROM entries WHERE namespace = ? AND expires_at <= ?', (self.namespace, now)
+        )
+
+        total_bytes = self._namespace_bytes() - expired_bytes
+        self._total_bytes = total_bytes
+        if total_bytes <= self.max_bytes:
+            return
+
+        rows = self._connection.execute(
+            'SELECT key, LENGTH(value) FROM entries WHERE namespace = ? ORDER BY accessed_at',
+            (self.namespace,)
+        )
+        evicted_keys = []
+        for key, length in rows:
+            if total_bytes <= self.max_bytes:
+                break
+            evicted_keys.append((self.namespace, key))
+            total_bytes -= length
+
+        self._connection.executemany(
+            'DELETE FROM entries WHERE namespace = ? AND key = ?', evicted_keys
+        )
+        self._total_bytes = total_bytes
+        self._evictions += len(evicted_keys)
+
+
+class DiskBackedLruCache(LruCache[K, V]):
+    """An `LruCache` with a `DiskCache` tier underneath it. Misses in memory fall through to disk,
+    and entries found on disk are promoted back into memory for the rest of their ttl. `peek` only
+    looks in memory.
+    """
+
+    def __init__(self,
+                 max_size: int,
+                 disk_cache: DiskCache[V],
+                 disk_key: Callable[[K], str],
+                 ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        super().__init__(max_size, ttl, clock)
+        self.disk_cache = disk_cache
+        self.disk_key = disk_key
+
+    def get(self, key: K) -> Optional[V]:
+        value = super().get(key)
+        if value is not None:
+            return value
+
+        entry = self.disk_cache.get_with_ttl(self.disk_key(key))
+        if entry is None:
+            return None
+
+        value, ttl = entry
+        super().set(key, value, ttl)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        super().set(key, value, ttl)
+        self.disk_cache.set(self.disk_key(key), value, ttl)
+
+    def invalidate(self, key: K) -> None:
+        super().invalidate(key)
+        self.disk_cache.invalidate(self.disk_key(key))
+
+    def clear(self) -> None:
+        super().clear()
+        self.disk_cache.clear()
+
+
+def create_lru_cache(max_size: int,
+                     ttl: Optional[float],
+                     namespace: str,
+                     codec: Codec[V],
+                     disk_key: Callable[[K], str],
+                     disk_cache_path: Optional[str] = None,
+                     disk_cache_max_bytes: int = 16 * 1024 * 1024) -> LruCache[K, V]:
+    """Create an `LruCache`, with a disk tier at `disk_cache_path` if one is given."""
+    if not disk_cache_path:
+        return LruCache(max_size, ttl)
+
+    return DiskBackedLruCache(
+        max_size,
+        DiskCache(disk_cache_path, namespace, codec, disk_cache_max_bytes, ttl),
+        disk_key,
+        ttl
+    )
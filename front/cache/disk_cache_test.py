@@ -0,0 +1,191 @@
+import os
+import sqlite3
+import struct
+import tempfile
+
+from front.cache.codecs import Codec
+from front.cache.disk_cache import DiskBackedLruCache, DiskCache
+from front.cache.lru_cache import CacheStats
+from front.cache.lru_cache_test import FakeClock
+
+
+UTF8 = Codec(str.encode, bytes.decode)
+
+
+def encode_length_prefixed(string: str) -> bytes:
+    """Prefixes `string` with its length as a uint16, so it can't encode strings of 64KiB or more.
+    """
+    return struct.pack('<H', len(string)) + string.encode()
+
+
+def decode_length_prefixed(raw: bytes) -> str:
+    return raw[2:].decode()
+
+
+LENGTH_PREFIXED = Codec(encode_length_prefixed, decode_length_prefixed)
+
+
+def make_disk_cache_path() -> str:
+    return os.path.join(tempfile.mkdtemp(), 'cache.sqlite3')
+
+
+class TestCorruptEntries:
+
+    def test_treats_an_entry_that_cant_be_decoded_as_a_miss_and_deletes_it(self) -> None:
+        # Given a disk cache with an entry that isn't valid utf-8
+        path = make_disk_cache_path()
+        disk_cache = DiskCache(path, 'words', UTF8, max_bytes=100)
+        disk_cache.set('a', 'hello')
+        connection = sqlite3.connect(path, isolation_level=None)
+        connection.execute("UPDATE entries SET value = X'FF' WHERE key = 'a'")
+
+        # When we get the entry
+        value = disk_cache.get('a')
+
+        # Then it's a miss, and the entry is deleted
+        assert value is None
+        assert disk_cache.stats == CacheStats(hits=0, misses=1, evictions=0, size=0)
+
+        # And the key can be cached again
+        disk_cache.set('a', 'hello')
+        assert disk_cache.get('a') == 'hello'
+
+
+class TestEviction:
+
+    def test_keeps_count_of_the_bytes_of_replaced_and_invalidated_entries(self) -> None:
+        # Given a disk cache of 10 bytes, in which a 5 byte entry was replaced by a 2 byte one
+        disk_cache = DiskCache(make_disk_cache_path(), 'words', UTF8, max_bytes=10)
+        disk_cache.set('a', 'hello')
+        disk_cache.set('a', 'hi')
+
+        # And a 5 byte entry was set, then invalidated
+        disk_cache.set('b', 'world')
+        disk_cache.invalidate('b')
+
+        # When we set 8 more bytes of entries
+        disk_cache.set('c', 'hey')
+        disk_cache.set('d', 'there')
+
+        # Then they fit without evicting anything
+        assert [disk_cache.get(key) for key in 'acd'] == ['hi', 'hey', 'there']
+        assert disk_cache.stats.evictions == 0
+
+        # And the next byte evicts the least recently used entry
+        disk_cache.set('e', '!')
+        assert disk_cache.get('a') is None
+        assert disk_cache.stats.evictions == 1
+
+    def test_deletes_expired_entries_before_evicting_live_ones(self) -> None:
+        # Given a full disk cache of 10 bytes, in which a 5 byte entry has expired
+        clock = FakeClock()
+        disk_cache = DiskCache(make_disk_cache_path(), 'words', UTF8, max_bytes=10, clock=clock)
+        disk_cache.set('a', 'hello', ttl=10)
+        disk_cache.set('b', 'world')
+        clock.now = 10
+
+        # When we set another 5 byte entry
+        disk_cache.set('c', 'there')
+
+        # Then the expired entry makes room for it
+        assert [disk_cache.get(key) for key in 'abc'] == [None, 'world', 'there']
+        assert disk_cache.stats.evictions == 0
+
+    def test_counts_the_bytes_of_entries_written_before_it_was_created(self) -> None:
+        # Given a disk cache file with 8 bytes of entries
+        path = make_disk_cache_path()
+        DiskCache(path, 'words', UTF8, max_bytes=10).set('a', 'hello')
+        DiskCache(path, 'words', UTF8, max_bytes=10).set('b', 'hey')
+
+        # When a new disk cache on that file sets 3 more bytes
+        disk_cache = DiskCache(path, 'words', UTF8, max_bytes=10)
+        disk_cache.set('c', 'you')
+
+        # Then the least recently used entry is evicted
+        assert [disk_cache.get(key) for key in 'abc'] == [None, 'hey', 'you']
+
+
+class TestUnencodableValues:
+
+    def test_doesnt_cache_a_value_that_cant_be_encoded(self) -> None:
+        # Given a disk cache whose codec can't encode long strings, with an entry
+        disk_cache = DiskCache(make_disk_cache_path(), 'words', LENGTH_PREFIXED, max_bytes=10 ** 6)
+        disk_cache.set('a', 'hello')
+
+        # When we set the entry to a string that's too long to encode, then nothing raises
+        disk_cache.set('a', 'a' * 2 ** 16)
+
+        # And the entry is gone, rather than left with its old value
+        assert disk_cache.get('a') is None
+
+        # And short strings are still cached
+        disk_cache.set('a', 'hi')
+        assert disk_cache.get('a') == 'hi'
+
+
+class TestDiskBackedLruCache:
+
+    def test_promotes_an_entry_found_on_disk_for_the_rest_of_its_ttl(self) -> None:
+        # Given a disk-backed cache whose entries live for 60 seconds, with an entry set 50 seconds
+        # ago on disk only
+        memory_clock = FakeClock()
+        disk_clock = FakeClock()
+        disk_cache = DiskCache(
+            make_disk_cache_path(), 'words', UTF8, max_bytes=100, ttl=60, clock=disk_clock
+        )
+        disk_cache.set('a', 'hello')
+        disk_clock.now = 50
+        cache = DiskBackedLruCache(10, disk_cache, str, ttl=60, clock=memory_clock)
+
+        # When we get the entry, then it's found on disk
+        assert cache.get('a') == 'hello'
+        assert disk_cache.stats.hits == 1
+
+        # And it's kept in memory for the 10 seconds it has left, not another 60
+        memory_clock.now = 9
+        assert cache.get('a') == 'hello'
+        assert disk_cache.stats.hits == 1
+
+        memory_clock.now = 10
+        disk_clock.now = 60
+        assert cache.get('a') is None
+        assert disk_cache.stats.misses == 1
+
+
+class TestLockedDatabase:
+
+    def test_treats_a_locked_database_as_a_miss_without_raising(self) -> None:
+        # Given a disk cache with an entry
+        path = make_disk_cache_path()
+        disk_cache = DiskCache(path, 'words', UTF8, max_bytes=100, timeout=0.01)
+        disk_cache.set('a', 'hello')
+
+        # And another connection holding a lock on its database
+        connection = sqlite3.connect(path, isolation_level=None)
+        connection.execute('BEGIN EXCLUSIVE')
+        connection.execute("DELETE FROM entries WHERE key = 'nothing'")
+
+        # When we use the disk cache
+        disk_cache.set('b', 'world')
+        value = disk_cache.get('a')
+        disk_cache.invalidate('a')
+        disk_cache.clear()
+
+        # Then every read is a miss, and nothing raises
+        assert value is None
+        assert disk_cache.stats.misses == 1
+
+        # And once the lock is released, the disk cache works again
+        connection.execute('ROLLBACK')
+        assert disk_cache.get('a') == 'hello'
+        assert disk_cache.get('b') is None
+
+    def test_reports_an_unreadable_database_as_empty(self) -> None:
+        # Given a disk cache whose connection is broken
+        disk_cache = DiskCache(make_disk_cache_path(), 'words', UTF8, max_bytes=100)
+        disk_cache.set('a', 'hello')
+        disk_cache._connection.close()
+
+        # When we get its stats, then it's reported as empty
+        assert disk_cache.stats.size == 0
+        assert disk_cache.get('a') is None
@@ -0,0 +1,152 @@
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+from front.cache.lru_cache import CacheStats
+from front.definitions import Listen
+
+
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class ListensTimeline:
+    """A thread-safe store of the time segments of listens we've already fetched, along with every
+    listen inside them. A segment `[start, end]` (both inclusive) means that we know of every
+    listen timestamped from `start` to `end`, so any page of listens within it can be answered
+    without asking the listens service.
+
+    Segments are kept sorted and merged, and listens are kept in one array sorted by
+    `listen_time_utc`, so both are looked up with `bisect`. Once the timeline holds more than
+    `max_listens` listens, the least recently used segments are evicted.
+
+    >>> timeline = ListensTimeline(max_listens=10)
+    >>> timeline.add(datetime(2018, 11, 12, 9), datetime(2018, 11, 12, 12), [])
+    >>> timeline.add(datetime(2018, 11, 12, 12, 0, 0, 1), datetime(2018, 11, 12, 15), [])
+    >>> timeline.segments
+    [(datetime.datetime(2018, 11, 12, 9, 0), datetime.datetime(2018, 11, 12, 15, 0))]
+    >>> timeline.covered_listens(datetime(2018, 11, 12, 16), datetime.max, True, limit=10) is None
+    True
+    """
+
+    def __init__(self, max_listens: int) -> None:
+        self.max_listens = max_listens
+        self._lock = threading.Lock()
+        self._starts: List[datetime] = []
+        self._ends: List[datetime] = []
+        self._last_uses: List[int] = []
+        self._times: List[datetime] = []
+        self._listens: List[Listen] = []
+        self._uses = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def segments(self) -> List[Tuple[datetime, datetime]]:
+        with self._lock:
+            return list(zip(self._starts, self._ends))
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hits are lookups answered by a segment, and misses are lookups that fell in a gap."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._listens))
+
+    def covered_listens(self,
+                        cursor: datetime,
+                        bound: datetime,
+                        ascending: bool,
+                        limit: int) -> Optional[Tuple[List[Listen], datetime]]:
+        """If a segment covers `cursor`, return up to `limit` of its listens from `cursor` towards
+        `bound` (later listens if `ascending`, earlier ones otherwise) in that order, along with
+        the segment's edge in that direction. Otherwise return None.
+        """
+        with self._lock:
+            segment = bisect_right(self._starts, cursor) - 1
+            if segment < 0 or self._ends[segment] < cursor:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._uses += 1
+            self._last_uses[segment] = self._uses
+
+            if ascending:
+                edge = self._ends[segment]
+                first = bisect_left(self._times, cursor)
+                last = bisect_right(self._times, min(edge, bound))
+                return self._listens[first:min(last, first + limit)], edge
+
+            edge = self._starts[segment]
+            first = bisect_left(self._times, max(edge, bound))
+            last = bisect_right(self._times, cursor)
+            return self._listens[max(first, last - limit):last][::-1], edge
+
+    def gap_edge(self, cursor: datetime, ascending: bool) -> Optional[datetime]:
+        """The last moment before the next segment beyond `cursor` (after it if `ascending`,
+        before it otherwise), or None if there's no segment beyond it.
+        """
+        with self._lock:
+            if ascending:
+                segment = bisect_right(self._starts, cursor)
+                if segment < len(self._starts):
+                    return _before(self._starts[segment])
+                return None
+
+            segment = bisect_left(self._ends, cursor) - 1
+            if segment >= 0:
+                return _after(self._ends[segment])
+            return None
+
+    def add(self, start: datetime, end: datetime, listens: Sequence[Listen]) -> None:
+        """Record that `listens` are every listen from `start` to `end`, merging the segment with
+        any segments it overlaps or touches.
+        """
+        listens = sorted(
+            (listen for listen in listens if start <= listen.listen_time_utc <= end),
+            key=lambda listen: listen.listen_time_utc
+        )
+
+        with self._lock:
+            first_listen = bisect_left(self._times, start)
+            last_listen = bisect_right(self._times, end)
+            self._listens[first_listen:last_listen] = listens
+            self._times[first_listen:last_listen] = [
+                listen.listen_time_utc for listen in listens
+            ]
+
+            first = bisect_left(self._ends, _before(start))
+            last = bisect_right(self._starts, _after(end))
+            if first < last:
+                start = min(start, self._starts[first])
+                end = max(end, self._ends[last - 1])
+
+            self._uses += 1
+            self._starts[first:last] = [start]
+            self._ends[first:last] = [end]
+            self._last_uses[first:last] = [self._uses]
+
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            del self._starts[:], self._ends[:], self._last_uses[:]
+            del self._times[:], self._listens[:]
+
+    def _evict(self) -> None:
+        while len(self._listens) > self.max_listens and self._starts:
+            segment = self._last_uses.index(min(self._last_uses))
+            first_listen = bisect_left(self._times, self._starts[segment])
+            last_listen = bisect_right(self._times, self._ends[segment])
+            del self._times[first_listen:last_listen], self._listens[first_listen:last_listen]
+            del self._starts[segment], self._ends[segment], self._last_uses[segment]
+            self._evictions += 1
+
+
+def _before(moment: datetime) -> datetime:
+    return moment - ONE_MICROSECOND if moment > datetime.min else moment
+
+
+def _after(moment: datetime) -> datetime:
+    return moment + ONE_MICROSECOND if moment < datetime.max else moment
@@ -0,0 +1,116 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, NamedTuple, Optional, Tuple, TypeVar
+
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        >>> CacheStats(hits=3, misses=1, evictions=0, size=1).hit_rate
+        0.75
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LruCache(Generic[K, V]):
+    """A bounded, thread-safe least-recently-used cache whose entries expire `ttl` seconds after
+    they're set. A `ttl` of None means entries only leave the cache when they're evicted.
+
+    >>> cache = LruCache(max_size=2)
+    >>> cache.set('a', 1)
+    >>> cache.set('b', 2)
+    >>> cache.get('a')
+    1
+    >>> cache.set('c', 3)  # evicts 'b', the least recently used entry
+    >>> cache.get('b') is None
+    True
+    >>> cache.stats
+    CacheStats(hits=1, misses=1, evictions=1, size=2)
+    """
+
+    def __init__(self,
+                 max_size: int,
+                 ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[K, Tuple[V, float]]' = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[1] <= self._clock():
+                self._entries.pop(key, None)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def peek(self, key: K) -> Optional[V]:
+        """Get the value of `key` without counting a hit or a miss or making it more recently used,
+        for callers that only check whether a value happens to be cached.
+
+        >>> cache = LruCache(max_size=2)
+        >>> cache.set('a', 1)
+        >>> cache.peek('a'), cache.peek('b')
+        (1, None)
+        >>> cache.stats
+        CacheStats(hits=0, misses=0, evictions=0, size=1)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= self._clock():
+                return None
+
+            return entry[0]
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Set `key` to `value`. `ttl` overrides the cache's default ttl for this entry."""
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = self._clock() + ttl if ttl is not None else float('inf')
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries)
+            )
@@ -0,0 +1,149 @@
+import threading
+from typing import List
+
+from front.cache import CacheStats, LruCache
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTtl:
+
+    def test_expires_entries_ttl_seconds_after_theyre_set(self) -> None:
+        # Given a cache whose entries live for 10 seconds
+        clock = FakeClock()
+        cache: LruCache[str, int] = LruCache(max_size=10, ttl=10, clock=clock)
+        cache.set('a', 1)
+
+        # When 9 seconds pass, then the entry is still cached
+        clock.now = 9
+        assert cache.get('a') == 1
+
+        # When 10 seconds pass, then the entry has expired
+        clock.now = 10
+        assert cache.get('a') is None
+        assert cache.stats == CacheStats(hits=1, misses=1, evictions=0, size=0)
+
+    def test_overrides_the_default_ttl_per_entry(self) -> None:
+        # Given a cache whose entries live for 10 seconds
+        clock = FakeClock()
+        cache: LruCache[str, int] = LruCache(max_size=10, ttl=10, clock=clock)
+
+        # When we set an entry that lives for 60 seconds
+        cache.set('a', 1, ttl=60)
+
+        # Then it outlives the default ttl
+        clock.now = 59
+        assert cache.get('a') == 1
+        clock.now = 60
+        assert cache.get('a') is None
+
+    def test_keeps_entries_until_evicted_without_a_ttl(self) -> None:
+        # Given a cache without a ttl
+        clock = FakeClock()
+        cache: LruCache[str, int] = LruCache(max_size=10, clock=clock)
+        cache.set('a', 1)
+
+        # When a long time passes, then the entry is still cached
+        clock.now = 10 ** 9
+        assert cache.get('a') == 1
+
+
+class TestPeek:
+
+    def test_peeks_without_counting_or_reordering_entries(self) -> None:
+        # Given a full cache, in which 'a' was set first
+        cache: LruCache[str, int] = LruCache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        # When we peek at 'a' and at a missing key, then set another entry
+        assert cache.peek('a') == 1
+        assert cache.peek('c') is None
+        cache.set('c', 3)
+
+        # Then 'a' is still the least recently used entry, and no lookup was counted
+        assert cache.peek('a') is None
+        assert cache.stats == CacheStats(hits=0, misses=0, evictions=1, size=2)
+
+    def test_doesnt_peek_at_expired_entries(self) -> None:
+        # Given a cache with an entry that has expired
+        clock = FakeClock()
+        cache: LruCache[str, int] = LruCache(max_size=10, ttl=10, clock=clock)
+        cache.set('a', 1)
+        clock.now = 10
+
+        # When we peek at it, then it's not there
+        assert cache.peek('a') is None
+
+
+class TestEviction:
+
+    def test_evicts_the_least_recently_used_entries_first(self) -> None:
+        # Given a full cache, in which 'a' was set first but used last
+        cache: LruCache[str, int] = LruCache(max_size=3)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+        cache.get('a')
+
+        # When we set two more entries
+        cache.set('d', 4)
+        cache.set('e', 5)
+
+        # Then 'b' and 'c' are evicted, in that order
+        assert cache.get('b') is None
+        assert cache.get('c') is None
+        assert [cache.get(key) for key in ['a', 'd', 'e']] == [1, 4, 5]
+        assert cache.stats.evictions == 2
+
+    def test_setting_an_entry_again_makes_it_most_recently_used(self) -> None:
+        # Given a full cache in which 'a' is set again after 'b'
+        cache: LruCache[str, int] = LruCache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('a', 10)
+
+        # When we set another entry
+        cache.set('c', 3)
+
+        # Then 'b' is evicted, and 'a' has its new value
+        assert cache.get('b') is None
+        assert cache.get('a') == 10
+
+
+class TestConcurrency:
+
+    def test_concurrent_gets_and_sets_keep_the_cache_consistent(self) -> None:
+        # Given a small cache
+        cache: LruCache[int, int] = LruCache(max_size=50)
+
+        # When several threads get and set overlapping keys at once
+        wrong_values: List[int] = []
+
+        def get_and_set(offset: int) -> None:
+            for i in range(1000):
+                key = (offset + i) % 100
+                value = cache.get(key)
+                if value is not None and value != key * 2:
+                    wrong_values.append(value)
+                cache.set(key, key * 2)
+
+        threads = [threading.Thread(target=get_and_set, args=(offset,))
+                   for offset in range(0, 80, 10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then every value got was the one set, the cache stays within its size, and every lookup
+        # was counted
+        assert wrong_values == []
+        assert cache.stats.size == 50
+        assert cache.stats.hits + cache.stats.misses == 8 * 1000
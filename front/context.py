@@ -1,11 +1,17 @@
 from typing import NamedTuple
 
-from front.gateways.listens import ListensGatewayABC
-from front.gateways.music import MusicGatewayABC
-from front.gateways.sunlight import SunlightGatewayABC
+from front.gateways.listens import AsyncListensGatewayABC, ListensGatewayABC
+from front.gateways.music import AsyncMusicGatewayABC, MusicGatewayABC
+from front.gateways.sunlight import AsyncSunlightGatewayABC, SunlightGatewayABC
 
 
 class Context(NamedTuple):
     listens_gateway: ListensGatewayABC
     music_gateway: MusicGatewayABC
     sunlight_gateway: SunlightGatewayABC
+
+
+class AsyncContext(NamedTuple):
+    listens_gateway: AsyncListensGatewayABC
+    music_gateway: AsyncMusicGatewayABC
+    sunlight_gateway: AsyncSunlightGatewayABC
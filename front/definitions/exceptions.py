@@ -9,6 +9,10 @@ class ListensError(FrontException):
     """Exception raised upon encountering an error in the listens domain."""
 
 
+class ListenNotFoundError(ListensError):
+    """Exception raised when no listen exists with a requested id."""
+
+
 class MusicError(FrontException):
     """Exception raised upon encountering an error in the music domain."""
 
@@ -1,6 +1,7 @@
 import json
+import logging
 import os
-from typing import Dict
+from typing import Dict, Optional
 
 from aws_xray_sdk.core import patch
 
@@ -13,8 +14,16 @@ from sentry_sdk.integrations.aws_lambda import AwsLambdaIntegration
 from sentry_sdk.integrations.logging import ignore_logger
 
 from front.definitions import exceptions
-from front.delivery.aws_lambda import util
-from front.delivery.graphql import schema
+from front.delivery import gateways
+from front.delivery.graphql import create_graphql_context, schema
+from front.delivery.graphql.cache_control import cache_control_header
+from front.delivery.graphql.execution import (
+    ASYNC,
+    SYNC,
+    create_executor,
+    execution_thread_pool
+)
+from front.delivery.graphql.persisted_queries import PersistedQueryError, resolve_persisted_query
 
 
 if os.environ.get('AWS_EXECUTION_ENV'):
@@ -26,50 +35,113 @@ if os.environ.get('AWS_EXECUTION_ENV'):
     ignore_logger('graphql.execution.executor')
     ignore_logger('graphql.execution.utils')
 
+    # warm up outbound connections during the init phase (before xray patching, as there's no
+    # xray segment to record them in yet)
+    if os.environ.get('HTTP_PRECONNECT') == 'true':
+        gateways.preconnect()
+
     # setup xray patching
     libraries = ('requests', 'boto3', 'botocore')
     patch(libraries)
 
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
 def handler(event: Dict, context: Dict) -> Dict:
     listens_service_api_key = os.environ['LISTENS_SERVICE_API_KEY']
     sunlight_service_api_key = os.environ['SUNLIGHT_SERVICE_API_KEY']
     spotify_client_id = os.environ['SPOTIFY_CLIENT_ID']
     spotify_client_secret = os.environ['SPOTIFY_CLIENT_SECRET']
+    execution_mode = os.environ.get('GRAPHQL_EXECUTION_MODE', SYNC)
+    thread_pool_size = int(os.environ.get('GRAPHQL_THREAD_POOL_SIZE', 8))
+
+    request_method = event.get('httpMethod', 'POST').lower()
+    if request_method == 'get':
+        # variables and extensions are json-encoded strings in a query string
+        data = event.get('queryStringParameters') or {}
+    else:
+        data = json.loads(event['body'])
 
-    body = event['body']
-    query_data = json.loads(body)
+    try:
+        query_data = resolve_persisted_query(data, gateways.persisted_query_cache)
+    except PersistedQueryError as e:
+        return _response(event, e.status_code, {'errors': [e.to_dict()]})
 
-    front_context = util.create_default_context(
+    front_context = gateways.create_default_context(
         listens_service_api_key,
         sunlight_service_api_key,
         spotify_client_id,
         spotify_client_secret
     )
+    async_context = gateways.create_async_context(
+        listens_service_api_key,
+        sunlight_service_api_key,
+        spotify_client_id,
+        spotify_client_secret
+    ) if execution_mode == ASYNC else None
 
-    results, _ = graphql_server.run_http_query(
-        schema=schema,
-        request_method='post',
-        data={},
-        query_data=query_data,
-        context=front_context
+    graphql_context = create_graphql_context(
+        front_context,
+        async_context,
+        gateways.listens_prefetcher,
+        execution_thread_pool(execution_mode, thread_pool_size)
     )
 
+    try:
+        results, _ = graphql_server.run_http_query(
+            schema=schema,
+            request_method=request_method,
+            data={},
+            query_data=query_data,
+            context=graphql_context,
+            executor=create_executor(execution_mode, thread_pool_size),
+            backend=gateways.document_backend
+        )
+    except graphql_server.HttpQueryError as e:
+        return _response(
+            event,
+            e.status_code,
+            {'errors': [graphql_server.default_format_error(e)]},
+            headers=e.headers
+        )
+
     for error in (results[0].errors or []):
         if isinstance(error, GraphQLLocatedError):
             if not isinstance(error.original_error, exceptions.FrontException):
                 raise error.original_error
 
+    logger.info('cache stats: %s', json.dumps({
+        name: {**stats._asdict(), 'hit_rate': round(stats.hit_rate, 3)}
+        for name, stats in gateways.cache_stats().items()
+    }))
+    if gateways.listens_prefetcher:
+        logger.info('prefetch stats: %s', json.dumps(gateways.listens_prefetcher.stats._asdict()))
+
+    headers = {}
+    if request_method == 'get':
+        # only GET responses can be cached by api gateway, cloudfront or a browser
+        headers['Cache-Control'] = cache_control_header(results[0], graphql_context.cache_policy)
+
+    return _response(event, 200, results[0].to_dict(), headers)
+
+
+def _response(event: Dict,
+              status_code: int,
+              body: Dict,
+              headers: Optional[Dict[str, str]] = None) -> Dict:
     if _from_graphql_playground(event):
         access_control_allow_origin = 'https://www.graphqlbin.com'
     else:
         access_control_allow_origin = os.environ.get('ACCESS_CONTROL_ALLOW_ORIGIN', '*')
 
     return {
-        'statusCode': 200,
-        'body': json.dumps(results[0].to_dict()),
+        'statusCode': status_code,
+        'body': json.dumps(body),
         'headers': {
-            'Access-Control-Allow-Origin': access_control_allow_origin
+            'Access-Control-Allow-Origin': access_control_allow_origin,
+            **(headers or {})
         }
     }
 
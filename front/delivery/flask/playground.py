@@ -5,8 +5,25 @@ from flask import Flask, jsonify
 
 from flask_graphql import GraphQLView
 
-from front.delivery.flask.util import create_default_context, is_flask_reload
-from front.delivery.graphql import schema
+from graphql_server import HttpQueryError
+
+from front.delivery.flask.util import is_flask_reload
+from front.delivery.gateways import (
+    create_async_context,
+    create_default_context,
+    document_backend,
+    listens_prefetcher,
+    persisted_query_cache
+)
+from front.delivery.graphql import create_graphql_context, schema
+from front.delivery.graphql.execution import (
+    ASYNC,
+    SYNC,
+    create_executor,
+    execution_thread_pool,
+    shutdown_event_loop
+)
+from front.delivery.graphql.persisted_queries import PersistedQueryError, resolve_persisted_query
 from front.gateways.music import SpotifyGateway
 
 
@@ -14,6 +31,8 @@ listens_service_api_key = os.environ['LISTENS_SERVICE_API_KEY']
 sunlight_service_api_key = os.environ['SUNLIGHT_SERVICE_API_KEY']
 spotify_client_id = os.environ['SPOTIFY_CLIENT_ID']
 spotify_client_secret = os.environ['SPOTIFY_CLIENT_SECRET']
+execution_mode = os.environ.get('GRAPHQL_EXECUTION_MODE', SYNC)
+thread_pool_size = int(os.environ.get('GRAPHQL_THREAD_POOL_SIZE', 8))
 
 context = create_default_context(
     listens_service_api_key,
@@ -21,19 +40,57 @@ context = create_default_context(
     spotify_client_id,
     spotify_client_secret
 )
+async_context = create_async_context(
+    listens_service_api_key,
+    sunlight_service_api_key,
+    spotify_client_id,
+    spotify_client_secret
+) if execution_mode == ASYNC else None
+
+
+class PlaygroundGraphQLView(GraphQLView):
+    def get_executor(self):  # type: ignore
+        # flask may serve each request on a different thread, and each thread runs its own event
+        # loop, so the executor is created per request rather than once per view.
+        return create_executor(execution_mode, thread_pool_size)
+
+    def parse_body(self):  # type: ignore
+        data = super().parse_body()
+        if not isinstance(data, dict):
+            return data
+
+        try:
+            return resolve_persisted_query(data, persisted_query_cache)
+        except PersistedQueryError as e:
+            raise HttpQueryError(e.status_code, e.message)
+
 
 app = Flask(__name__)
 app.add_url_rule(
     '/graphql',
-    view_func=GraphQLView.as_view(
+    view_func=PlaygroundGraphQLView.as_view(
         'graphql',
         schema=schema,
-        get_context=lambda: context,
+        backend=document_backend,
+        get_context=lambda: create_graphql_context(
+            context,
+            async_context,
+            listens_prefetcher,
+            execution_thread_pool(execution_mode, thread_pool_size)
+        ),
         graphiql=True
     )
 )
 
 
+@app.teardown_request
+def shutdown_async_execution(error):  # type: ignore
+    # the development server may serve each request on a new thread, whose event loop would
+    # otherwise keep its async transport sessions open.
+    if execution_mode == ASYNC:
+        shutdown_event_loop()
+
+
 @app.route('/accesstoken')
 def access_token():  # type: ignore
     access_token = SpotifyGateway.fetch_bearer_token(spotify_client_id, spotify_client_secret)
@@ -1,20 +1,13 @@
 import os
+import tempfile
 
-from front.context import Context
-from front.gateways.listens import ListensServiceGateway
-from front.gateways.music import SpotifyGateway
-from front.gateways.sunlight import SunlightServiceGateway
 
-
-def create_default_context(listens_service_api_key: str,
-                           sunlight_service_api_key: str,
-                           spotify_client_id: str,
-                           spotify_client_secret: str) -> Context:
-    return Context(
-        listens_gateway=ListensServiceGateway(listens_service_api_key),
-        sunlight_gateway=SunlightServiceGateway(sunlight_service_api_key),
-        music_gateway=SpotifyGateway(spotify_client_id, spotify_client_secret)
-    )
+# the playground keeps a disk cache by default so that the caches survive flask reloads. this
+# module is imported before `front.delivery.gateways`, which reads it.
+os.environ.setdefault(
+    'DISK_CACHE_PATH',
+    os.path.join(tempfile.gettempdir(), 'morning-cd-front-cache.sqlite3')
+)
 
 
 def is_flask_reload(debug_environment: os._Environ) -> bool:
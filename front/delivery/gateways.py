@@ -0,0 +1,282 @@
+"""The gateways, caches and transports shared by every delivery. They're created at module level so
+that they're shared by every request a process serves (i.e. every invocation of a warm lambda),
+and configured with environment variables.
+"""
+import logging
+import os
+import struct
+from typing import Dict, List, Optional
+
+from graphql.backend import GraphQLDocument
+
+from front.cache import (
+    CacheStats,
+    ListensTimeline,
+    LruCache,
+    create_lru_cache,
+    song_codec,
+    sunlight_window_codec,
+    text_codec
+)
+from front.context import AsyncContext, Context
+from front.definitions import Listen, Song, SunlightWindow
+from front.delivery.graphql.document_cache import CachedDocumentBackend
+from front.delivery.graphql.prefetch import ListensPrefetcher
+from front.gateways.async_transport import AsyncHttpTransport
+from front.gateways.listens import (
+    ActiveTimezones,
+    AsyncCachedListensGateway,
+    AsyncListensServiceGateway,
+    AsyncTimelineListensGateway,
+    CachedListensGateway,
+    ListensServiceGateway,
+    TimelineListensGateway
+)
+from front.gateways.listens.cached_listens_gateway import CachedListen, PageKey
+from front.gateways.music import (
+    AsyncCachedMusicGateway,
+    AsyncSpotifyGateway,
+    CachedMusicGateway,
+    SpotifyGateway,
+    spotify_token_manager
+)
+from front.gateways.music.cached_music_gateway import SongKey, song_disk_key
+from front.gateways.sunlight import (
+    AsyncCachedSunlightGateway,
+    AsyncLocalSunlightGateway,
+    AsyncSunlightGatewayABC,
+    AsyncSunlightServiceGateway,
+    AsyncTableSunlightGateway,
+    CachedSunlightGateway,
+    LocalSunlightGateway,
+    SunlightGatewayABC,
+    SunlightServiceGateway,
+    TableSunlightGateway
+)
+from front.gateways.sunlight.cached_sunlight_gateway import (
+    SunlightWindowKey,
+    sunlight_window_disk_key
+)
+from front.gateways.sunlight.sunlight_table import SunlightTable, default_sunlight_table_path
+from front.gateways.transport import HttpTransport
+
+
+logger = logging.getLogger(__name__)
+
+
+http_pool_size_per_host = int(os.environ.get('HTTP_POOL_SIZE_PER_HOST', 4))
+http_connect_timeout = float(os.environ.get('HTTP_CONNECT_TIMEOUT_SECONDS', 3.05))
+http_read_timeout = float(os.environ.get('HTTP_READ_TIMEOUT_SECONDS', 10))
+
+transport = HttpTransport(http_pool_size_per_host, http_connect_timeout, http_read_timeout)
+async_transport = AsyncHttpTransport(
+    http_pool_size_per_host,
+    http_connect_timeout,
+    http_read_timeout
+)
+
+# setting DISK_CACHE_PATH (i.e. to a file in /tmp) adds a disk tier to the caches that outlives
+# the module. the flask playground sets one by default (see `front.delivery.flask.util`).
+disk_cache_path = os.environ.get('DISK_CACHE_PATH')
+disk_cache_max_bytes = int(os.environ.get('DISK_CACHE_MAX_BYTES', 16 * 1024 * 1024))
+
+song_cache: LruCache[SongKey, Song] = create_lru_cache(
+    max_size=int(os.environ.get('SONG_CACHE_SIZE', 2000)),
+    ttl=float(os.environ.get('SONG_CACHE_TTL_SECONDS', 24 * 60 * 60)),
+    namespace='songs',
+    codec=song_codec,
+    disk_key=song_disk_key,
+    disk_cache_path=disk_cache_path,
+    disk_cache_max_bytes=disk_cache_max_bytes
+)
+
+sunlight_window_cache: LruCache[SunlightWindowKey, SunlightWindow] = create_lru_cache(
+    max_size=int(os.environ.get('SUNLIGHT_WINDOW_CACHE_SIZE', 2000)),
+    ttl=None,
+    namespace='sunlight_windows',
+    codec=sunlight_window_codec,
+    disk_key=sunlight_window_disk_key,
+    disk_cache_path=disk_cache_path,
+    disk_cache_max_bytes=disk_cache_max_bytes
+)
+
+document_cache: LruCache[str, GraphQLDocument] = LruCache(
+    max_size=int(os.environ.get('DOCUMENT_CACHE_SIZE', 100))
+)
+document_backend = CachedDocumentBackend(document_cache)
+
+# persisted queries are keyed by the sha256 hash of their query text.
+persisted_query_cache: LruCache[str, str] = create_lru_cache(
+    max_size=int(os.environ.get('PERSISTED_QUERY_CACHE_SIZE', 1000)),
+    ttl=None,
+    namespace='persisted_queries',
+    codec=text_codec,
+    disk_key=str,
+    disk_cache_path=disk_cache_path,
+    disk_cache_max_bytes=disk_cache_max_bytes
+)
+
+
+# pages of listens that reach the present, and pages that end in the past. they're only kept in
+# memory, as a submitted listen clears the feed cache.
+listens_feed_cache: LruCache[PageKey, List[Listen]] = LruCache(
+    max_size=int(os.environ.get('LISTENS_FEED_CACHE_SIZE', 20))
+)
+listens_page_cache: LruCache[PageKey, List[Listen]] = LruCache(
+    max_size=int(os.environ.get('LISTENS_PAGE_CACHE_SIZE', 200))
+)
+# every listen we've fetched or submitted by its id, and ids of listens that don't exist.
+listen_cache: LruCache[str, CachedListen] = LruCache(
+    max_size=int(os.environ.get('LISTEN_CACHE_SIZE', 2000))
+)
+# pages that miss both caches are answered from the segments of listens we've already fetched.
+listens_timeline = ListensTimeline(
+    max_listens=int(os.environ.get('LISTENS_TIMELINE_SIZE', 2000))
+)
+# the timezones whose sunlight windows decide how long a cached feed page lives, shared by every
+# invocation. a feed page is only cached through the night when LISTENS_FEED_TIMEZONES
+# (comma-separated) names every timezone listens are submitted from.
+listens_feed_timezones = ActiveTimezones(
+    timezone
+    for timezone in os.environ.get('LISTENS_FEED_TIMEZONES', '').split(',')
+    if timezone
+)
+# LISTENS_PREFETCH=true prefetches the next page of listens (and its songs, unless
+# LISTENS_PREFETCH_SONGS=false) in the background after serving a page with more after it.
+listens_prefetcher = ListensPrefetcher(
+    max_in_flight=int(os.environ.get('LISTENS_PREFETCH_MAX_IN_FLIGHT', 2)),
+    prefetch_songs=os.environ.get('LISTENS_PREFETCH_SONGS') != 'false'
+) if os.environ.get('LISTENS_PREFETCH') == 'true' else None
+
+
+def open_sunlight_table(path: str) -> Optional[SunlightTable]:
+    """Open the sunlight table at `path`, or log why it can't be opened and return None.
+
+    >>> open_sunlight_table('/nonexistent/sunlight_table.bin') is None
+    True
+    """
+    try:
+        return SunlightTable(path)
+    except (OSError, ValueError, struct.error):
+        logger.exception('failed to open the sunlight table at %s', path)
+        return None
+
+
+# SUNLIGHT_GATEWAY=local computes sunlight windows in-process, and SUNLIGHT_GATEWAY=table looks
+# them up in a precomputed sunlight table. either only asks the sunlight service for the ones it
+# doesn't have. a table that's missing or corrupt falls back to the local gateway, rather than
+# failing the import, and so every request, of the process.
+sunlight_gateway_kind = os.environ.get('SUNLIGHT_GATEWAY', 'service')
+sunlight_table = (
+    open_sunlight_table(os.environ.get('SUNLIGHT_TABLE_PATH', default_sunlight_table_path))
+    if sunlight_gateway_kind == 'table'
+    else None
+)
+if sunlight_gateway_kind == 'table' and sunlight_table is None:
+    logger.warning('falling back to the local sunlight gateway')
+    sunlight_gateway_kind = 'local'
+
+
+def create_default_context(listens_service_api_key: str,
+                           sunlight_service_api_key: str,
+                           spotify_client_id: str,
+                           spotify_client_secret: str) -> Context:
+    sunlight_gateway = CachedSunlightGateway(
+        create_sunlight_gateway(sunlight_service_api_key),
+        sunlight_window_cache
+    )
+    return Context(
+        listens_gateway=CachedListensGateway(
+            TimelineListensGateway(
+                ListensServiceGateway(listens_service_api_key, transport),
+                listens_timeline
+            ),
+            listens_feed_cache,
+            listens_page_cache,
+            listen_cache,
+            sunlight_gateway,
+            listens_feed_timezones
+        ),
+        sunlight_gateway=sunlight_gateway,
+        music_gateway=CachedMusicGateway(
+            SpotifyGateway(spotify_client_id, spotify_client_secret, transport),
+            song_cache
+        )
+    )
+
+
+def create_async_context(listens_service_api_key: str,
+                         sunlight_service_api_key: str,
+                         spotify_client_id: str,
+                         spotify_client_secret: str) -> AsyncContext:
+    sunlight_gateway = AsyncCachedSunlightGateway(
+        create_async_sunlight_gateway(sunlight_service_api_key),
+        sunlight_window_cache
+    )
+    return AsyncContext(
+        listens_gateway=AsyncCachedListensGateway(
+            AsyncTimelineListensGateway(
+                AsyncListensServiceGateway(listens_service_api_key, async_transport),
+                listens_timeline
+            ),
+            listens_feed_cache,
+            listens_page_cache,
+            listen_cache,
+            sunlight_gateway,
+            listens_feed_timezones
+        ),
+        sunlight_gateway=sunlight_gateway,
+        music_gateway=AsyncCachedMusicGateway(
+            AsyncSpotifyGateway(spotify_client_id, spotify_client_secret, async_transport),
+            song_cache
+        )
+    )
+
+
+def create_sunlight_gateway(sunlight_service_api_key: str) -> SunlightGatewayABC:
+    sunlight_service_gateway = SunlightServiceGateway(sunlight_service_api_key, transport)
+    if sunlight_gateway_kind == 'local':
+        return LocalSunlightGateway(fallback_gateway=sunlight_service_gateway)
+
+    if sunlight_table is not None:
+        return TableSunlightGateway(sunlight_table, fallback_gateway=sunlight_service_gateway)
+
+    return sunlight_service_gateway
+
+
+def create_async_sunlight_gateway(sunlight_service_api_key: str) -> AsyncSunlightGatewayABC:
+    sunlight_service_gateway = AsyncSunlightServiceGateway(
+        sunlight_service_api_key,
+        async_transport
+    )
+    if sunlight_gateway_kind == 'local':
+        return AsyncLocalSunlightGateway(fallback_gateway=sunlight_service_gateway)
+
+    if sunlight_table is not None:
+        return AsyncTableSunlightGateway(sunlight_table, fallback_gateway=sunlight_service_gateway)
+
+    return sunlight_service_gateway
+
+
+def preconnect() -> None:
+    """Open a connection to every host that the graphql handler calls."""
+    transport.preconnect([
+        ListensServiceGateway.endpoint,
+        SunlightServiceGateway.endpoint,
+        SpotifyGateway.base_url,
+        spotify_token_manager.auth_url
+    ])
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """Stats of every module-level cache, for sizing the caches from production traffic."""
+    return {
+        'song_cache': song_cache.stats,
+        'sunlight_window_cache': sunlight_window_cache.stats,
+        'document_cache': document_cache.stats,
+        'persisted_query_cache': persisted_query_cache.stats,
+        'listens_feed_cache': listens_feed_cache.stats,
+        'listens_page_cache': listens_page_cache.stats,
+        'listen_cache': listen_cache.stats,
+        'listens_timeline': listens_timeline.stats
+    }
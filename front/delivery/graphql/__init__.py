@@ -1 +1,2 @@
+from .context import GraphQlContext, create_graphql_context
 from .schema import schema
@@ -0,0 +1,103 @@
+"""Resolvers declare how long their field's value can be cached with `CachePolicy.hint`. After an
+execution, `cache_control_header` combines the hints of every root field in the response into one
+`Cache-Control` header, so that GET requests can be served by a CDN or the browser cache without
+invoking the lambda.
+
+A response is only as cacheable as its least cacheable root field, and a root field that wasn't
+hinted (or a response with errors) isn't cacheable at all.
+"""
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+
+from graphql import ResolveInfo
+from graphql.execution import ExecutionResult
+
+
+ONE_MINUTE = 60
+ONE_HOUR = 60 * 60
+ONE_DAY = 24 * 60 * 60
+ONE_YEAR = 365 * ONE_DAY
+
+NO_STORE = 'no-store'
+
+
+class CachePolicy:
+    """Collects the cache hints of a single graphql execution.
+
+    >>> cache_policy = CachePolicy()
+    >>> cache_policy.max_age(['listen'])
+    0
+    >>> cache_policy.hint_field('listen', ONE_DAY)
+    >>> cache_policy.hint_field('sunlightWindow', ONE_YEAR)
+    >>> cache_policy.max_age(['listen', 'sunlightWindow'])
+    86400
+    >>> cache_policy.max_age(['listen', 'allListens'])
+    0
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._max_age_by_field: Dict[str, int] = {}
+
+    def hint(self, info: ResolveInfo, max_age: int) -> None:
+        """Hint that the root field being resolved by `info` can be cached for `max_age` seconds.
+        Hints of nested fields apply to the root field they're nested under.
+        """
+        self.hint_field(str(info.path[0]), max_age)
+
+    def hint_field(self, field: str, max_age: int) -> None:
+        with self._lock:
+            self._max_age_by_field[field] = min(max_age, self._max_age_by_field.get(field, max_age))
+
+    def max_age(self, fields: Iterable[str]) -> int:
+        with self._lock:
+            return min((self._max_age_by_field.get(field, 0) for field in fields), default=0)
+
+
+def cache_control_header(result: Optional[ExecutionResult], cache_policy: CachePolicy) -> str:
+    if result is None or result.errors or result.invalid or not result.data:
+        return NO_STORE
+
+    max_age = cache_policy.max_age(result.data.keys())
+    if max_age <= 0:
+        return NO_STORE
+
+    if max_age >= ONE_YEAR:
+        return f'public, max-age={max_age}, immutable'
+
+    return f'public, max-age={max_age}'
+
+
+def sunlight_window_max_age(on_date: date, now_utc: datetime) -> int:
+    """A sunlight window never changes once its date has passed everywhere on earth, i.e. once it's
+    more than a day before today's utc date.
+
+    >>> sunlight_window_max_age(date(2018, 11, 10), now_utc=datetime(2018, 11, 12, 15, 30))
+    31536000
+    >>> sunlight_window_max_age(date(2018, 11, 11), now_utc=datetime(2018, 11, 12, 15, 30))
+    3600
+    """
+    if on_date < now_utc.date() - timedelta(days=1):
+        return ONE_YEAR
+
+    return ONE_HOUR
+
+
+def listens_page_max_age(before_utc: Optional[datetime], now_utc: datetime) -> int:
+    """Listens are timestamped when they're submitted, so a page of listens before a time in the
+    past never changes. (We leave a minute's margin for listens still being submitted.) Pages that
+    reach the present aren't cacheable, as the feed should show new listens right away.
+
+    >>> listens_page_max_age(datetime(2018, 11, 12, 15, 0), now_utc=datetime(2018, 11, 12, 15, 30))
+    86400
+    >>> listens_page_max_age(None, now_utc=datetime(2018, 11, 12, 15, 30))
+    0
+    """
+    if before_utc is not None and before_utc.tzinfo is not None:
+        before_utc = before_utc.astimezone(timezone.utc).replace(tzinfo=None)
+
+    if before_utc is not None and before_utc <= now_utc - timedelta(seconds=ONE_MINUTE):
+        return ONE_DAY
+
+    return 0
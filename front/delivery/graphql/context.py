@@ -0,0 +1,50 @@
+from concurrent.futures import Executor
+from typing import NamedTuple, Optional
+
+from front.context import AsyncContext, Context
+from front.delivery.graphql.cache_control import CachePolicy
+from front.delivery.graphql.loaders import (
+    AsyncListenLoader,
+    AsyncSongLoader,
+    ListenLoader,
+    SongLoader
+)
+from front.delivery.graphql.prefetch import ListensPrefetcher
+
+
+class GraphQlContext(NamedTuple):
+    """The `info.context` handed to graphql resolvers. Wraps the front `Context` along with any
+    state that must only live for a single graphql execution.
+
+    When `async_context` is set, resolvers run their use cases against its async gateways and
+    return coroutines, which must be executed by an `AsyncioExecutor`. When `prefetcher` is set,
+    the next page of listens is prefetched after each page that has more after it. When
+    `thread_pool` is set, it's the pool the execution's resolvers run on, which resolvers may
+    submit their own concurrent work to.
+    """
+    front_context: Context
+    song_loader: SongLoader
+    listen_loader: ListenLoader
+    cache_policy: CachePolicy
+    async_context: Optional[AsyncContext] = None
+    async_song_loader: Optional[AsyncSongLoader] = None
+    async_listen_loader: Optional[AsyncListenLoader] = None
+    prefetcher: Optional[ListensPrefetcher] = None
+    thread_pool: Optional[Executor] = None
+
+
+def create_graphql_context(front_context: Context,
+                           async_context: Optional[AsyncContext] = None,
+                           prefetcher: Optional[ListensPrefetcher] = None,
+                           thread_pool: Optional[Executor] = None) -> GraphQlContext:
+    return GraphQlContext(
+        front_context=front_context,
+        song_loader=SongLoader(front_context, primed_songs={}),
+        listen_loader=ListenLoader(front_context),
+        cache_policy=CachePolicy(),
+        async_context=async_context,
+        async_song_loader=AsyncSongLoader(async_context) if async_context else None,
+        async_listen_loader=AsyncListenLoader(async_context) if async_context else None,
+        prefetcher=prefetcher,
+        thread_pool=thread_pool
+    )
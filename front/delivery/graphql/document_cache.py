@@ -0,0 +1,63 @@
+"""Our clients send the same handful of operations over and over, so there's no need to parse and
+validate every query we receive. `CachedDocumentBackend` keeps parsed, validated documents in an
+`LruCache` keyed by a hash of the query text. With a module-level cache, a warm lambda only parses
+and validates an operation on its first invocation.
+"""
+import hashlib
+from functools import partial
+from typing import Any, List
+
+from graphql import GraphQLSchema, parse, validate
+from graphql.backend import GraphQLBackend, GraphQLDocument
+from graphql.execution import ExecutionResult, execute
+
+from front.cache import LruCache
+
+
+class CachedDocumentBackend(GraphQLBackend):
+    """A graphql-core backend (see `graphql_server.run_http_query`'s `backend` option) that caches
+    documents in `document_cache`. Only valid documents are cached: a document that fails
+    validation is revalidated every time it's sent, which keeps junk queries from evicting the
+    operations we actually serve.
+    """
+
+    def __init__(self, document_cache: LruCache[str, GraphQLDocument]) -> None:
+        self.document_cache = document_cache
+
+    def document_from_string(self, schema: GraphQLSchema, request_string: str) -> GraphQLDocument:
+        key = document_key(request_string)
+
+        document = self.document_cache.get(key)
+        if document is not None and document.schema is schema:
+            return document
+
+        document_ast = parse(request_string)
+        validation_errors = validate(schema, document_ast)
+        if validation_errors:
+            return GraphQLDocument(
+                schema=schema,
+                document_string=request_string,
+                document_ast=document_ast,
+                execute=partial(_invalid, validation_errors)
+            )
+
+        document = GraphQLDocument(
+            schema=schema,
+            document_string=request_string,
+            document_ast=document_ast,
+            execute=partial(execute, schema, document_ast)
+        )
+        self.document_cache.set(key, document)
+        return document
+
+
+def document_key(request_string: str) -> str:
+    """
+    >>> document_key('{ listen(id: "1") { id } }')[:16]
+    '3ac63d572ed4a944'
+    """
+    return hashlib.sha256(request_string.encode('utf-8')).hexdigest()
+
+
+def _invalid(validation_errors: List[Exception], *args: Any, **kwargs: Any) -> ExecutionResult:
+    return ExecutionResult(errors=validation_errors, invalid=True)
@@ -0,0 +1,81 @@
+from typing import Any
+
+import graphene
+
+from graphql.backend import GraphQLDocument
+
+from front.cache import CacheStats, LruCache
+from front.delivery.graphql.document_cache import CachedDocumentBackend, document_key
+
+
+def make_schema(greeting: str) -> graphene.Schema:
+    class Query(graphene.ObjectType):
+        hello = graphene.String()
+
+        def resolve_hello(root: Any, info: Any) -> str:
+            return greeting
+
+    return graphene.Schema(query=Query)
+
+
+def make_document_cache() -> LruCache[str, GraphQLDocument]:
+    return LruCache(max_size=10)
+
+
+class TestDocumentFromString:
+
+    def test_returns_a_cached_document_without_parsing_or_validating_it(self) -> None:
+        # Given a backend that has cached a document
+        schema = make_schema('hi')
+        document_cache = make_document_cache()
+        backend = CachedDocumentBackend(document_cache)
+        document = backend.document_from_string(schema, '{ hello }')
+
+        # When we get the document for the same query again
+        cached_document = backend.document_from_string(schema, '{ hello }')
+
+        # Then it's the cached document
+        assert cached_document is document
+        assert cached_document.execute().data == {'hello': 'hi'}
+        assert document_cache.stats == CacheStats(hits=1, misses=1, evictions=0, size=1)
+
+    def test_doesnt_parse_a_cached_query(self) -> None:
+        # Given a backend whose cache has a document for a query that doesn't even parse
+        schema = make_schema('hi')
+        document_cache = make_document_cache()
+        document = CachedDocumentBackend(document_cache).document_from_string(schema, '{ hello }')
+        document_cache.set(document_key('{ hello'), document)
+
+        # When we get the document for that query, then it's the cached one
+        backend = CachedDocumentBackend(document_cache)
+        assert backend.document_from_string(schema, '{ hello') is document
+
+    def test_doesnt_cache_invalid_documents(self) -> None:
+        # Given a backend
+        schema = make_schema('hi')
+        document_cache = make_document_cache()
+        backend = CachedDocumentBackend(document_cache)
+
+        # When we get the document for a query that fails validation, twice
+        first_result = backend.document_from_string(schema, '{ goodbye }').execute()
+        second_result = backend.document_from_string(schema, '{ goodbye }').execute()
+
+        # Then it's invalid both times, and it's never cached
+        assert first_result.invalid and first_result.errors
+        assert second_result.invalid and second_result.errors
+        assert document_cache.stats == CacheStats(hits=0, misses=2, evictions=0, size=0)
+
+    def test_only_returns_a_cached_document_for_the_schema_it_was_made_for(self) -> None:
+        # Given a backend that has cached a document for one schema
+        schema = make_schema('hi')
+        other_schema = make_schema('hello')
+        backend = CachedDocumentBackend(make_document_cache())
+        document = backend.document_from_string(schema, '{ hello }')
+
+        # When we get the document for the same query for another schema
+        other_document = backend.document_from_string(other_schema, '{ hello }')
+
+        # Then it's a document for the other schema
+        assert other_document is not document
+        assert other_document.schema is other_schema
+        assert other_document.execute().data == {'hello': 'hello'}
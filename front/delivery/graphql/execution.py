@@ -0,0 +1,163 @@
+"""Graphql executions run in one of several modes, picked with the GRAPHQL_EXECUTION_MODE
+environment variable:
+
+- 'sync' (the default): resolvers run one after another on the calling thread.
+- 'async': resolvers run their use cases against async gateways on an asyncio event loop, so
+  independent fields (i.e. `sunlightWindow` and `allListens` in one operation) resolve
+  concurrently. Requires the graphql context to be created with an `AsyncContext`, and aiohttp
+  to be installed (it isn't one of the locked dependencies yet).
+- 'threads': resolvers marked `io_bound` run on a shared thread pool with the sync gateways, so
+  independent fields still resolve concurrently. Every other resolver runs on the calling thread.
+"""
+import asyncio
+import concurrent.futures
+import functools
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from graphql.execution.executors.asyncio import AsyncioExecutor
+
+from promise import Promise
+
+
+SYNC = 'sync'
+ASYNC = 'async'
+THREADS = 'threads'
+
+EXECUTION_MODES = (SYNC, ASYNC, THREADS)
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+_thread_local = threading.local()
+
+_thread_pools: Dict[int, concurrent.futures.ThreadPoolExecutor] = {}
+_thread_pools_lock = threading.Lock()
+
+
+def create_executor(execution_mode: str, thread_pool_size: int = 8) -> Optional[Any]:
+    """Create a graphql-core executor for `execution_mode`, or None for the default executor."""
+    if execution_mode == SYNC:
+        return None
+
+    elif execution_mode == ASYNC:
+        return AsyncioExecutor(loop=_event_loop())
+
+    elif execution_mode == THREADS:
+        return ThreadPoolExecutor(_thread_pool(thread_pool_size))
+
+    else:
+        raise ValueError(f'Unknown graphql execution mode "{execution_mode}".')
+
+
+def execution_thread_pool(execution_mode: str,
+                          thread_pool_size: int = 8
+                          ) -> Optional[concurrent.futures.ThreadPoolExecutor]:
+    """The thread pool that the executor of `execution_mode` runs resolvers on, if any. Resolvers
+    can submit their own concurrent work to it through the graphql context.
+    """
+    return _thread_pool(thread_pool_size) if execution_mode == THREADS else None
+
+
+def io_bound(resolver: F) -> F:
+    """Mark `resolver` as spending its time waiting on gateways, so that a `ThreadPoolExecutor`
+    runs it on its thread pool. Resolvers that only touch the graphql context's dataloaders must
+    not be marked: dataloaders batch on the thread that executes the query.
+    """
+    setattr(resolver, 'io_bound', True)
+    return resolver
+
+
+class ThreadPoolExecutor:
+    """A graphql-core executor that runs `io_bound` resolvers on `thread_pool` and every other
+    resolver inline. Promises are only ever resolved on the thread that executes the query (in
+    `wait_until_finished`), as dataloaders and promise callbacks aren't thread safe.
+
+    The number of concurrent requests to any one host is still bounded by the gateways' transport.
+    """
+
+    def __init__(self, thread_pool: concurrent.futures.ThreadPoolExecutor) -> None:
+        self.thread_pool = thread_pool
+        self.futures: List[Tuple['concurrent.futures.Future[Any]', Promise]] = []
+
+    def wait_until_finished(self) -> None:
+        while self.futures:
+            done, _ = concurrent.futures.wait(
+                [future for future, _ in self.futures],
+                return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            settled = [(future, promise) for future, promise in self.futures if future in done]
+            self.futures = [(future, promise) for future, promise in self.futures
+                            if future not in done]
+
+            # settling a promise may execute more resolvers, which can add to `self.futures`
+            for future, promise in settled:
+                _settle(promise, future)
+
+    def clean(self) -> None:
+        self.futures = []
+
+    def execute(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        if not _is_io_bound(fn):
+            return fn(*args, **kwargs)
+
+        promise: Promise = Promise()
+        self.futures.append((self.thread_pool.submit(fn, *args, **kwargs), promise))
+        return promise
+
+
+def _is_io_bound(fn: Callable) -> bool:
+    """Graphene wraps connection field resolvers in a partial, i.e.
+    `partial(connection_resolver, resolve_all_listens, ListenConnection)`.
+    """
+    if isinstance(fn, functools.partial):
+        return _is_io_bound(fn.func) or any(_is_io_bound(arg) for arg in fn.args[:1])
+
+    return getattr(fn, 'io_bound', False) is True
+
+
+def _settle(promise: Promise, future: 'concurrent.futures.Future[Any]') -> None:
+    error = future.exception()
+    if isinstance(error, Exception):
+        promise.do_reject(error, traceback=error.__traceback__)
+    else:
+        promise.do_resolve(future.result())
+
+
+def _thread_pool(size: int) -> concurrent.futures.ThreadPoolExecutor:
+    """Thread pools are shared by every execution in the process, so a warm lambda container
+    reuses its threads across invocations.
+    """
+    with _thread_pools_lock:
+        if size not in _thread_pools:
+            _thread_pools[size] = concurrent.futures.ThreadPoolExecutor(
+                max_workers=size,
+                thread_name_prefix='graphql-resolver'
+            )
+
+        return _thread_pools[size]
+
+
+def shutdown_event_loop() -> None:
+    """Shut down the calling thread's event loop, if it has one, closing anything its async
+    generators hold open (i.e. the async transports' sessions). Threads that don't outlive a single
+    request (i.e. a development server's) should call this when they're done.
+    """
+    event_loop: Optional[asyncio.AbstractEventLoop] = getattr(_thread_local, 'event_loop', None)
+    if event_loop is None:
+        return
+
+    del _thread_local.event_loop
+    event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+    event_loop.close()
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Each thread reuses a single event loop across executions, which lets the async gateways
+    keep their connections alive between requests.
+    """
+    if not hasattr(_thread_local, 'event_loop'):
+        _thread_local.event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_thread_local.event_loop)
+
+    event_loop: asyncio.AbstractEventLoop = _thread_local.event_loop
+    return event_loop
@@ -0,0 +1,118 @@
+import concurrent.futures
+import functools
+import threading
+from typing import Any, Callable, Dict
+
+import graphene
+
+from promise import Promise
+
+from front.delivery.graphql.execution import (
+    ASYNC,
+    SYNC,
+    THREADS,
+    ThreadPoolExecutor,
+    create_executor,
+    execution_thread_pool,
+    io_bound
+)
+
+
+def make_schema(thread_names: Dict[str, str]) -> graphene.Schema:
+    """A schema whose resolvers record the name of the thread they're run on in `thread_names`."""
+
+    class Query(graphene.ObjectType):
+        waits = graphene.String()
+        computes = graphene.String()
+        fails = graphene.String()
+
+        @io_bound
+        def resolve_waits(root: Any, info: Any) -> str:
+            thread_names['waits'] = threading.current_thread().name
+            return 'waited'
+
+        def resolve_computes(root: Any, info: Any) -> str:
+            thread_names['computes'] = threading.current_thread().name
+            return 'computed'
+
+        @io_bound
+        def resolve_fails(root: Any, info: Any) -> str:
+            raise ValueError('Failed.')
+
+    return graphene.Schema(query=Query)
+
+
+@io_bound
+def waits() -> str:
+    return threading.current_thread().name
+
+
+def computes() -> str:
+    return threading.current_thread().name
+
+
+def connection_resolver(resolver: Callable[[], str], connection_type: Any) -> str:
+    return resolver()
+
+
+class TestThreadPoolExecutor:
+
+    def test_runs_io_bound_resolvers_on_the_thread_pool_and_others_inline(self) -> None:
+        # Given a schema with an io bound resolver and one that isn't
+        thread_names: Dict[str, str] = {}
+        schema = make_schema(thread_names)
+
+        # When we execute a query of both with the threads executor
+        result = schema.execute('{ waits computes }', executor=create_executor(THREADS))
+
+        # Then the io bound resolver runs on the thread pool, and the other on this thread
+        assert result.errors is None
+        assert result.data == {'waits': 'waited', 'computes': 'computed'}
+        assert thread_names['waits'].startswith('graphql-resolver')
+        assert thread_names['computes'] == threading.current_thread().name
+
+    def test_reports_the_errors_of_io_bound_resolvers_as_field_errors(self) -> None:
+        # Given a schema with an io bound resolver that fails
+        schema = make_schema({})
+
+        # When we execute a query of it and another field with the threads executor
+        result = schema.execute('{ fails computes }', executor=create_executor(THREADS))
+
+        # Then only the failing field errors
+        assert result.data == {'fails': None, 'computes': 'computed'}
+        assert [str(error) for error in result.errors] == ['Failed.']
+
+    def test_dispatches_connection_resolvers_by_the_resolver_they_wrap(self) -> None:
+        # Given a threads executor
+        executor = ThreadPoolExecutor(
+            concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='resolvers')
+        )
+
+        # When it executes an io bound resolver and one that isn't, each wrapped as graphene wraps
+        # connection field resolvers
+        waited = executor.execute(functools.partial(connection_resolver, waits, None))
+        computed = executor.execute(functools.partial(connection_resolver, computes, None))
+        executor.wait_until_finished()
+
+        # Then the io bound resolver is run on the thread pool, and the other inline
+        assert isinstance(waited, Promise)
+        assert waited.get().startswith('resolvers')
+        assert computed == threading.current_thread().name
+
+
+class TestExecutionThreadPool:
+
+    def test_shares_one_thread_pool_per_size(self) -> None:
+        # When we get the threads execution mode's thread pool of several sizes
+        thread_pool = execution_thread_pool(THREADS, thread_pool_size=3)
+
+        # Then each size has one thread pool, which the threads executor of that size runs on
+        assert execution_thread_pool(THREADS, thread_pool_size=3) is thread_pool
+        assert execution_thread_pool(THREADS, thread_pool_size=4) is not thread_pool
+        executor = create_executor(THREADS, thread_pool_size=3)
+        assert isinstance(executor, ThreadPoolExecutor) and executor.thread_pool is thread_pool
+
+    def test_only_has_a_thread_pool_in_the_threads_execution_mode(self) -> None:
+        # When we get the thread pool of the other execution modes, then there isn't one
+        assert execution_thread_pool(SYNC) is None
+        assert execution_thread_pool(ASYNC) is None
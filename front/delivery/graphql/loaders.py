@@ -0,0 +1,152 @@
+"""Dataloaders batch the lookups made by sibling resolvers in a single graphql execution pass into
+one gateway call. A loader also memoizes its results, so a new set of loaders must be created for
+every execution (see `front.delivery.graphql.context`).
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast
+)
+
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from front import use_listens
+from front.context import AsyncContext, Context
+from front.definitions import Listen, MusicProvider, Song
+
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class SongLoader(DataLoader):
+    """Loads the song of a listen. Listens of the same song share a single lookup.
+
+    A `DataLoader` keeps its state per thread (and is initialized again, with the same arguments,
+    on each thread that uses it), so songs primed by resolvers running on a thread pool are kept
+    in the shared `primed_songs` until they're loaded on the thread executing the query.
+    """
+
+    def __init__(self, context: Context, primed_songs: Dict[Hashable, Song]) -> None:
+        super().__init__(get_cache_key=_song_key)
+        self.context = context
+        self.primed_songs = primed_songs
+
+    def prime_from_any_thread(self, listen: Listen, song: Song) -> None:
+        self.primed_songs.setdefault(_song_key(listen), song)
+
+    def load(self, key: Optional[Hashable] = None) -> Promise:
+        song = self.primed_songs.get(_song_key(cast(Listen, key)))
+        if song is not None:
+            self.prime(key, song)
+
+        return super().load(key)
+
+    def batch_load_fn(self, listens: List[Listen]) -> Promise:
+        return Promise.resolve(use_listens.get_songs_of_listens(self.context, listens))
+
+
+class ListenLoader(DataLoader):
+    """Loads a listen by its id. Every listen loaded in one pass is fetched in a single batch."""
+
+    def __init__(self, context: Context) -> None:
+        super().__init__()
+        self.context = context
+
+    def batch_load_fn(self, listen_ids: List[str]) -> Promise:
+        return Promise.resolve(use_listens.get_listens_by_ids(self.context, listen_ids))
+
+
+class _AsyncLoader(ABC, Generic[K, V]):
+    """The asyncio counterpart of a `DataLoader`. Every key loaded before the event loop's next
+    iteration (i.e. by every edge of a listens page, as graphql completes a list in one pass) is
+    loaded in a single call of `batch_load`.
+    """
+
+    def __init__(self, get_cache_key: Callable[[K], Hashable]) -> None:
+        self.get_cache_key = get_cache_key
+        self._futures: Dict[Hashable, 'asyncio.Future[V]'] = {}
+        self._queue: List[Tuple[K, 'asyncio.Future[V]']] = []
+
+    @abstractmethod
+    async def batch_load(self, keys: List[K]) -> Sequence[Union[V, Exception]]:
+        ...
+
+    def load(self, key: K) -> 'asyncio.Future[V]':
+        cache_key = self.get_cache_key(key)
+        if cache_key in self._futures:
+            return self._futures[cache_key]
+
+        loop = asyncio.get_event_loop()
+        future: 'asyncio.Future[V]' = loop.create_future()
+        self._futures[cache_key] = future
+
+        self._queue.append((key, future))
+        if len(self._queue) == 1:
+            loop.call_soon(self._dispatch)
+
+        return future
+
+    def prime(self, key: K, value: V) -> None:
+        """Load `key` as `value`, unless it's already being loaded."""
+        cache_key = self.get_cache_key(key)
+        if cache_key not in self._futures:
+            future: 'asyncio.Future[V]' = asyncio.get_event_loop().create_future()
+            future.set_result(value)
+            self._futures[cache_key] = future
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        asyncio.ensure_future(self._load_batch(queue))
+
+    async def _load_batch(self, queue: List[Tuple[K, 'asyncio.Future[V]']]) -> None:
+        keys = [key for key, _ in queue]
+        try:
+            values = await self.batch_load(keys)
+        except Exception as e:
+            for _, future in queue:
+                future.set_exception(e)
+            return
+
+        for (_, future), value in zip(queue, values):
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+
+class AsyncSongLoader(_AsyncLoader[Listen, Song]):
+    """The asyncio counterpart of `SongLoader`."""
+
+    def __init__(self, context: AsyncContext) -> None:
+        super().__init__(get_cache_key=_song_key)
+        self.context = context
+
+    async def batch_load(self, listens: List[Listen]) -> Sequence[Union[Song, Exception]]:
+        return await use_listens.get_songs_of_listens_async(self.context, listens)
+
+
+class AsyncListenLoader(_AsyncLoader[str, Listen]):
+    """The asyncio counterpart of `ListenLoader`."""
+
+    def __init__(self, context: AsyncContext) -> None:
+        super().__init__(get_cache_key=lambda listen_id: listen_id)
+        self.context = context
+
+    async def batch_load(self, listen_ids: List[str]) -> Sequence[Union[Listen, Exception]]:
+        return await use_listens.get_listens_by_ids_async(self.context, listen_ids)
+
+
+def _song_key(listen: Listen) -> Tuple[MusicProvider, str]:
+    return (listen.song_provider, listen.song_id)
@@ -0,0 +1,92 @@
+"""Support for apollo's automatic persisted queries protocol
+(https://github.com/apollographql/apollo-link-persisted-queries).
+
+A client first sends just the sha256 hash of its query in `extensions.persistedQuery`. If we
+haven't seen the query before we respond with a `PersistedQueryNotFound` error, and the client
+retries with both the hash and the query, which we register under the hash. From then on every
+request with that hash is served without the client sending its query.
+"""
+import json
+from typing import Any, Dict
+
+from front.cache import LruCache
+from front.delivery.graphql.document_cache import document_key
+
+
+class PersistedQueryError(Exception):
+    """A request that breaks the persisted query protocol. Apollo clients look for the error's
+    message (or its `extensions.code`) to decide whether to retry with the full query.
+    """
+
+    def __init__(self, message: str, code: str, status_code: int = 400) -> None:
+        super().__init__(message)
+        self.message = message
+        self.code = code
+        self.status_code = status_code
+
+    def to_dict(self) -> Dict:
+        return {'message': self.message, 'extensions': {'code': self.code}}
+
+
+class PersistedQueryNotFound(PersistedQueryError):
+
+    def __init__(self) -> None:
+        super().__init__('PersistedQueryNotFound', 'PERSISTED_QUERY_NOT_FOUND', status_code=200)
+
+
+def resolve_persisted_query(data: Dict[str, Any],
+                            persisted_queries: LruCache[str, str]) -> Dict[str, Any]:
+    """Fill in the `query` of a request that uses a persisted query, registering the request's
+    query in `persisted_queries` if it has one. Requests that don't use a persisted query are
+    returned as they are.
+
+    >>> persisted_queries = LruCache(max_size=10)
+    >>> extensions = {'persistedQuery': {'version': 1, 'sha256Hash': document_key('{ a }')}}
+    >>> resolve_persisted_query({'extensions': extensions}, persisted_queries)
+    Traceback (most recent call last):
+    ...
+    front.delivery.graphql.persisted_queries.PersistedQueryNotFound: PersistedQueryNotFound
+    >>> registration = {'query': '{ a }', 'extensions': extensions}
+    >>> resolve_persisted_query(registration, persisted_queries) == registration
+    True
+    >>> resolve_persisted_query({'extensions': extensions}, persisted_queries)['query']
+    '{ a }'
+    """
+    persisted_query = _extensions(data).get('persistedQuery')
+    if not persisted_query:
+        return data
+
+    if not isinstance(persisted_query, dict) or persisted_query.get('version') != 1:
+        raise PersistedQueryError(
+            'Unsupported persisted query version',
+            'PERSISTED_QUERY_NOT_SUPPORTED'
+        )
+
+    sha256_hash = persisted_query.get('sha256Hash')
+    query = data.get('query')
+
+    if query:
+        if document_key(query) != sha256_hash:
+            raise PersistedQueryError('provided sha does not match query', 'BAD_USER_INPUT')
+
+        persisted_queries.set(sha256_hash, query)
+        return data
+
+    query = persisted_queries.get(sha256_hash) if isinstance(sha256_hash, str) else None
+    if query is None:
+        raise PersistedQueryNotFound()
+
+    return {**data, 'query': query}
+
+
+def _extensions(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extensions are an object in POST bodies, but a json-encoded string in GET query strings."""
+    extensions = data.get('extensions') or {}
+
+    if isinstance(extensions, str):
+        try:
+            extensions = json.loads(extensions)
+        except ValueError:
+            raise PersistedQueryError('Extensions are invalid JSON.', 'BAD_USER_INPUT')
+
+    return extensions if isinstance(extensions, dict) else {}
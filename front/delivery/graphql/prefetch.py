@@ -0,0 +1,96 @@
+"""The listens feed is an infinite scroll, so after serving a page of listens that has more after
+it, we can be fairly sure the client will ask for the next page soon. `ListensPrefetcher` fetches
+that page (and optionally its songs) in the background, through the same cached gateways the next
+request will use, so that request is served from memory.
+
+A lambda container is frozen once it returns a response, so a prefetch that hasn't finished by
+then finishes at the start of the container's next invocation.
+"""
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from front import use_listens
+from front.context import Context
+from front.definitions import SortOrder
+
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchStats(NamedTuple):
+    prefetched: int
+    dropped: int
+    failed: int
+
+
+class ListensPrefetcher:
+    """Prefetches pages of listens on a background thread pool. At most `max_in_flight` prefetches
+    run at once per process; a prefetch requested while that many are running is dropped rather
+    than queued, so a spike in traffic can't turn into a spike of prefetches.
+    """
+
+    def __init__(self, max_in_flight: int = 2, prefetch_songs: bool = True) -> None:
+        self.max_in_flight = max_in_flight
+        self.prefetch_songs = prefetch_songs
+        self._budget = threading.BoundedSemaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(max_in_flight, thread_name_prefix='prefetch')
+        self._lock = threading.Lock()
+        self._prefetched = 0
+        self._dropped = 0
+        self._failed = 0
+
+    @property
+    def stats(self) -> PrefetchStats:
+        with self._lock:
+            return PrefetchStats(self._prefetched, self._dropped, self._failed)
+
+    def prefetch_listens(self,
+                         context: Context,
+                         limit: int,
+                         sort_order: SortOrder,
+                         before_utc: Optional[datetime],
+                         after_utc: Optional[datetime]) -> Optional[Future]:
+        """Fetch a page of listens in the background, or return None if the budget is spent."""
+        if not self._budget.acquire(blocking=False):
+            with self._lock:
+                self._dropped += 1
+            return None
+
+        return self._executor.submit(
+            self._prefetch_listens,
+            context,
+            limit,
+            sort_order,
+            before_utc,
+            after_utc
+        )
+
+    def _prefetch_listens(self,
+                          context: Context,
+                          limit: int,
+                          sort_order: SortOrder,
+                          before_utc: Optional[datetime],
+                          after_utc: Optional[datetime]) -> None:
+        try:
+            listens = use_listens.get_listens(
+                context,
+                limit=limit,
+                sort_order=sort_order,
+                before_utc=before_utc,
+                after_utc=after_utc
+            )
+            if self.prefetch_songs and listens:
+                use_listens.get_songs_of_listens(context, listens)
+        except Exception:
+            logger.exception('Error prefetching listens.')
+            with self._lock:
+                self._failed += 1
+            return
+        finally:
+            self._budget.release()
+
+        with self._lock:
+            self._prefetched += 1
@@ -0,0 +1,94 @@
+import threading
+from datetime import datetime
+from typing import List, Optional, Sequence, Union
+
+from front.context import Context
+from front.definitions import Listen, ListenInput, MusicProvider, Song, SortOrder
+from front.definitions.exceptions import MusicError
+from front.delivery.graphql.prefetch import ListensPrefetcher, PrefetchStats
+from front.gateways.listens import ListensGatewayABC
+from front.gateways.listens.cached_listens_gateway_test import LISTEN
+from front.gateways.music import MusicGatewayABC
+from front.gateways.sunlight import LocalSunlightGateway
+
+
+class BlockingListensGateway(ListensGatewayABC):
+
+    def __init__(self) -> None:
+        self.unblock = threading.Event()
+        self.requests: List[Optional[datetime]] = []
+
+    def fetch_listen(self, listen_id: str) -> Listen:
+        return LISTEN
+
+    def fetch_listens(self,
+                      limit: int,
+                      sort_order: SortOrder,
+                      before_utc: Optional[datetime] = None,
+                      after_utc: Optional[datetime] = None) -> List[Listen]:
+        self.requests.append(after_utc)
+        self.unblock.wait(timeout=5)
+        return [LISTEN]
+
+    def submit_listen(self, listen_input: ListenInput) -> Listen:
+        return LISTEN
+
+
+class FakeMusicGateway(MusicGatewayABC):
+
+    def __init__(self) -> None:
+        self.requests: List[Sequence[Listen]] = []
+
+    def fetch_song(self, song_provider: MusicProvider, song_id: str) -> Song:
+        raise MusicError('Not implemented.')
+
+    def fetch_songs(self, listens: Sequence[Listen]) -> List[Union[Song, MusicError]]:
+        self.requests.append(listens)
+        return []
+
+
+def make_context(listens_gateway: ListensGatewayABC, music_gateway: MusicGatewayABC) -> Context:
+    return Context(listens_gateway, music_gateway, LocalSunlightGateway())
+
+
+class TestPrefetchListens:
+
+    def test_prefetches_the_page_and_its_songs(self) -> None:
+        # Given a prefetcher
+        listens_gateway = BlockingListensGateway()
+        listens_gateway.unblock.set()
+        music_gateway = FakeMusicGateway()
+        prefetcher = ListensPrefetcher(max_in_flight=1)
+
+        # When we prefetch a page of listens
+        future = prefetcher.prefetch_listens(
+            make_context(listens_gateway, music_gateway),
+            limit=11,
+            sort_order=SortOrder.ASCENDING,
+            before_utc=None,
+            after_utc=LISTEN.listen_time_utc
+        )
+        assert future is not None
+        future.result(timeout=5)
+
+        # Then the page and the songs of its listens are fetched
+        assert listens_gateway.requests == [LISTEN.listen_time_utc]
+        assert music_gateway.requests == [[LISTEN]]
+        assert prefetcher.stats == PrefetchStats(prefetched=1, dropped=0, failed=0)
+
+    def test_drops_prefetches_beyond_the_budget(self) -> None:
+        # Given a prefetcher with a budget of one prefetch, which is in flight
+        listens_gateway = BlockingListensGateway()
+        context = make_context(listens_gateway, FakeMusicGateway())
+        prefetcher = ListensPrefetcher(max_in_flight=1, prefetch_songs=False)
+        in_flight = prefetcher.prefetch_listens(context, 11, SortOrder.ASCENDING, None, None)
+
+        # When we prefetch another page
+        dropped = prefetcher.prefetch_listens(context, 11, SortOrder.DESCENDING, None, None)
+
+        # Then it's dropped
+        assert dropped is None
+        listens_gateway.unblock.set()
+        assert in_flight is not None
+        in_flight.result(timeout=5)
+        assert prefetcher.stats == PrefetchStats(prefetched=1, dropped=1, failed=0)
@@ -45,20 +45,54 @@ From the docs:
 'NOTE: The resolvers on a ObjectType are always treated as staticmethods, so the first argument to
 the resolver method self (or root) need not be an actual instance of the ObjectType.'
 """
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import date, datetime
-from typing import List, Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast
+)
 
 import graphene
 
 from graphql import ResolveInfo
 
+from promise import Promise
+
 from front import use_listens, use_sunlight_windows
+from front.context import AsyncContext
 from front.definitions import Listen, ListenInput, MusicProvider, Song, SortOrder, SunlightWindow
-from front.delivery.graphql.util import RelayPaginationArguments, build_page_info
+from front.definitions.exceptions import ListensError
+from front.delivery.graphql import cache_control
+from front.delivery.graphql.context import GraphQlContext
+from front.delivery.graphql.execution import io_bound
+from front.delivery.graphql.util import (
+    RelayPaginationArguments,
+    build_page_info,
+    selected_fields
+)
+
 
+T = TypeVar('T')
 
 GraphQlMusicProvider = graphene.Enum.from_enum(MusicProvider)
 
+# the fields of a listen's song that are known from the listen itself
+LISTEN_SONG_FIELDS = frozenset({'id', 'songProvider', '__typename'})
+
+# sync executions have no thread pool of their own, so resolvers overlap their lookups on this
+# small one, shared by every execution in the process
+_lookup_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='graphql-lookup')
+
 
 class GraphQlSong(graphene.ObjectType):
     """A song from a given music provider."""
@@ -74,6 +108,9 @@ class GraphQlSong(graphene.ObjectType):
     image_medium_url = graphene.String()
     image_small_url = graphene.String()
 
+    def resolve_song_provider(root: Song, info: ResolveInfo) -> MusicProvider:
+        return root.music_provider
+
     def resolve_image_large_url(root: Song, info: ResolveInfo) -> str:
         return root.image_url_by_size['large']
 
@@ -96,8 +133,25 @@ class GraphQlListen(graphene.ObjectType):
     note = graphene.String()
     iana_timezone = graphene.String()
 
-    def resolve_song(root: Listen, info: ResolveInfo) -> Song:
-        return use_listens.get_song_of_listen(info.context, root)
+    def resolve_song(root: Listen, info: ResolveInfo) -> Union[Song, Promise, Awaitable[Song]]:
+        """A listen already knows its song's id and provider, so when nothing else of the song is
+        selected (i.e. by list views that only dedupe songs) it isn't looked up.
+        """
+        if selected_fields(info) <= LISTEN_SONG_FIELDS:
+            return Song(
+                id=root.song_id,
+                music_provider=root.song_provider,
+                name='',
+                artist_name='',
+                album_name='',
+                image_url_by_size={}
+            )
+
+        context = _graphql_context(info)
+        if context.async_song_loader:
+            return context.async_song_loader.load(root)
+
+        return context.song_loader.load(root)
 
 
 class ListenConnection(graphene.relay.Connection):
@@ -123,6 +177,13 @@ class Query(graphene.ObjectType):
     """Root query type for morning cd."""
     listen = graphene.Field(GraphQlListen, args={'id': graphene.ID(required=True)})
 
+    listens_by_ids = graphene.List(
+        GraphQlListen,
+        required=True,
+        args={'ids': graphene.List(graphene.NonNull(graphene.ID), required=True)},
+        description='The listen of each id, or null (with an error) if it could not be fetched.'
+    )
+
     all_listens = graphene.relay.ConnectionField(
         ListenConnection,
         before=graphene.DateTime(),
@@ -134,15 +195,50 @@ class Query(graphene.ObjectType):
         'on_date': graphene.Date(required=True)
     })
 
-    def resolve_listen(root, info: ResolveInfo, id: str) -> Listen:
-        return use_listens.get_listen(info.context, id)
+    sunlight_windows = graphene.List(
+        graphene.NonNull(GraphQlSunlightWindow),
+        required=True,
+        args={
+            'iana_timezone': graphene.String(required=True),
+            'from_date': graphene.Date(required=True),
+            'to_date': graphene.Date(required=True)
+        },
+        description='The sunlight windows of every date from fromDate to toDate, inclusive.'
+    )
+
+    def resolve_listen(root, info: ResolveInfo, id: str) -> Union[Promise, Awaitable[Listen]]:
+        """Every `listen` field in an operation (i.e. under different aliases) is fetched in a
+        single batch by the listen loader.
+        """
+        context = _graphql_context(info)
+        # listens can't be edited once they're submitted
+        context.cache_policy.hint(info, cache_control.ONE_DAY)
+
+        if context.async_listen_loader:
+            return context.async_listen_loader.load(id)
+
+        return context.listen_loader.load(id)
+
+    def resolve_listens_by_ids(root,
+                               info: ResolveInfo,
+                               ids: List[str]) -> List[Union[Promise, Awaitable[Listen]]]:
+        context = _graphql_context(info)
+        context.cache_policy.hint(info, cache_control.ONE_DAY)
+
+        # each id resolves on its own, so one missing listen doesn't fail the others
+        if context.async_listen_loader:
+            return [context.async_listen_loader.load(listen_id) for listen_id in ids]
+
+        return [context.listen_loader.load(listen_id) for listen_id in ids]
 
+    @io_bound
     def resolve_all_listens(root,
                             info: ResolveInfo,
                             before: Optional[datetime] = None,
                             after: Optional[datetime] = None,
                             first: Optional[int] = None,
-                            last: Optional[int] = None) -> ListenConnection:
+                            last: Optional[int] = None) -> Union[ListenConnection,
+                                                                 Awaitable[ListenConnection]]:
         """Resolver for allListens that returns a ListenConnection. Graphene is super confusing
         and therefore so is this (at the moment).
         """
@@ -160,43 +256,212 @@ class Query(graphene.ObjectType):
         sort_order = SortOrder.DESCENDING if pagination_args.last_is_set else SortOrder.ASCENDING
         limit = pagination_args.first if pagination_args.first_is_set else pagination_args.last
 
+        context = _graphql_context(info)
+        context.cache_policy.hint(
+            info,
+            cache_control.listens_page_max_age(before, now_utc=datetime.utcnow())
+        )
+        behind_page = Query._cursor_behind_page(pagination_args, selected_fields(info))
+
+        if context.async_context:
+            return Query._resolve_all_listens_async(
+                context,
+                context.async_context,
+                before,
+                after,
+                sort_order,
+                limit,
+                pagination_args,
+                behind_page
+            )
+
+        has_more_behind = (
+            _overlap(context, use_listens.has_listens_beyond, context.front_context, *behind_page)
+            if behind_page is not None
+            else lambda: False
+        )
         listens_plus_one = use_listens.get_listens(
-            info.context,
+            context.front_context,
             before_utc=before,
             after_utc=after,
             sort_order=sort_order,
             limit=limit + 1  # + 1, to see if the db 'has more'
         )
+        Query._prefetch_next_page(context, listens_plus_one, limit, sort_order, before, after)
+
+        return Query._build_listen_connection_from_listens_plus_one(
+            listens_plus_one,
+            limit,
+            pagination_args,
+            has_more_behind()
+        )
+
+    async def _resolve_all_listens_async(graphql_context: GraphQlContext,
+                                         context: AsyncContext,
+                                         before: Optional[datetime],
+                                         after: Optional[datetime],
+                                         sort_order: SortOrder,
+                                         limit: int,
+                                         pagination_args: RelayPaginationArguments,
+                                         behind_page: Optional[Tuple[datetime, SortOrder]]
+                                         ) -> ListenConnection:
+        listens_plus_one, has_more_behind = await asyncio.gather(
+            use_listens.get_listens_async(
+                context,
+                before_utc=before,
+                after_utc=after,
+                sort_order=sort_order,
+                limit=limit + 1
+            ),
+            Query._has_more_behind_page_async(context, behind_page)
+        )
+        Query._prefetch_next_page(
+            graphql_context,
+            listens_plus_one,
+            limit,
+            sort_order,
+            before,
+            after
+        )
+
+        return Query._build_listen_connection_from_listens_plus_one(
+            listens_plus_one,
+            limit,
+            pagination_args,
+            has_more_behind
+        )
+
+    async def _has_more_behind_page_async(
+            context: AsyncContext,
+            behind_page: Optional[Tuple[datetime, SortOrder]]) -> bool:
+        if behind_page is None:
+            return False
+
+        return await use_listens.has_listens_beyond_async(context, *behind_page)
+
+    def _cursor_behind_page(pagination_args: RelayPaginationArguments,
+                            fields: Set[str]) -> Optional[Tuple[datetime, SortOrder]]:
+        """The cursor on the side of the page that it's paging away from, if there is one and
+        the page info field it decides is selected, and the order of the listens behind it:
+        `after` and the listens up to it when paging `first`, or `before` and the listens from it
+        when paging `last`.
+        """
+        if (pagination_args.first_is_set and pagination_args.after is not None
+                and 'pageInfo.hasPreviousPage' in fields):
+            return pagination_args.after, SortOrder.DESCENDING
+
+        if (pagination_args.last_is_set and pagination_args.before is not None
+                and 'pageInfo.hasNextPage' in fields):
+            return pagination_args.before, SortOrder.ASCENDING
+
+        return None
+
+    def _prefetch_next_page(context: GraphQlContext,
+                            listens_plus_one: List[Listen],
+                            limit: int,
+                            sort_order: SortOrder,
+                            before: Optional[datetime],
+                            after: Optional[datetime]) -> None:
+        """Prefetch the page a client scrolling on asks for next: the page after this page's end
+        cursor when paging `first`, or before its start cursor when paging `last`. Either way, that
+        cursor is the last listen of the page in the order it was fetched.
+        """
+        if context.prefetcher is None or limit <= 0 or len(listens_plus_one) <= limit:
+            return
+
+        cursor = listens_plus_one[limit - 1].listen_time_utc
+        if sort_order == SortOrder.ASCENDING:
+            after = cursor
+        else:
+            before = cursor
+
+        context.prefetcher.prefetch_listens(
+            context.front_context,
+            limit=limit + 1,
+            sort_order=sort_order,
+            before_utc=before,
+            after_utc=after
+        )
+
+    def _build_listen_connection_from_listens_plus_one(
+            listens_plus_one: List[Listen],
+            limit: int,
+            pagination_args: RelayPaginationArguments,
+            has_more_behind: bool) -> ListenConnection:
         has_more = len(listens_plus_one) == limit + 1
         listens = listens_plus_one[:limit]
 
         if pagination_args.last_is_set:
             listens = list(reversed(listens))
 
-        return Query._build_listen_connection(listens, has_more, pagination_args)
+        return Query._build_listen_connection(listens, has_more, pagination_args, has_more_behind)
 
     def _build_listen_connection(listens: List[Listen],
                                  has_more: bool,
-                                 pagination_args: RelayPaginationArguments) -> ListenConnection:
+                                 pagination_args: RelayPaginationArguments,
+                                 has_more_behind: bool) -> ListenConnection:
         return ListenConnection(
             edges=Query._build_listen_edges(listens),
-            page_info=build_page_info(has_more, pagination_args)
+            page_info=build_page_info(has_more, pagination_args, has_more_behind)
         )
 
     def _build_listen_edges(listens: List[Listen]) -> List[ListenConnection.Edge]:
         return [ListenConnection.Edge(node=listen, cursor=listen.listen_time_utc)  # type: ignore
                 for listen in listens]
 
+    @io_bound
     def resolve_sunlight_window(root,
                                 info: ResolveInfo,
                                 iana_timezone: str,
-                                on_date: date) -> SunlightWindow:
+                                on_date: date) -> Union[SunlightWindow, Awaitable[SunlightWindow]]:
+        context = _graphql_context(info)
+        context.cache_policy.hint(
+            info,
+            cache_control.sunlight_window_max_age(on_date, now_utc=datetime.utcnow())
+        )
+
+        if context.async_context:
+            return use_sunlight_windows.get_sunlight_window_async(
+                context.async_context,
+                iana_timezone,
+                on_date=on_date
+            )
+
         return use_sunlight_windows.get_sunlight_window(
-            info.context,
+            context.front_context,
             iana_timezone,
             on_date=on_date
         )
 
+    @io_bound
+    def resolve_sunlight_windows(root,
+                                 info: ResolveInfo,
+                                 iana_timezone: str,
+                                 from_date: date,
+                                 to_date: date) -> Union[List[SunlightWindow],
+                                                         Awaitable[List[SunlightWindow]]]:
+        context = _graphql_context(info)
+        # the range is only as cacheable as its latest date
+        context.cache_policy.hint(
+            info,
+            cache_control.sunlight_window_max_age(to_date, now_utc=datetime.utcnow())
+        )
+
+        if context.async_context:
+            return use_sunlight_windows.get_sunlight_windows_async(
+                context.async_context,
+                iana_timezone,
+                from_date=from_date,
+                to_date=to_date
+            )
+
+        return use_sunlight_windows.get_sunlight_windows(
+            context.front_context,
+            iana_timezone,
+            from_date=from_date,
+            to_date=to_date
+        )
+
 
 class GraphQlListenInput(graphene.InputObjectType):
     """Input for submitting a listen to morning cd."""
@@ -217,20 +482,159 @@ class SubmitListen(graphene.Mutation):
 
     Output = GraphQlListen
 
-    def mutate(root, info: ResolveInfo, input: GraphQlListenInput) -> Listen:
-        listen = ListenInput(
-            song_id=input.song_id,
-            song_provider=MusicProvider(input.song_provider),
-            listener_name=input.listener_name,
-            note=input.note,
-            iana_timezone=input.iana_timezone
+    @io_bound
+    def mutate(root,
+               info: ResolveInfo,
+               input: GraphQlListenInput) -> Union[Listen, Awaitable[Listen]]:
+        """The song of a submitted listen only depends on the input, so when it's selected it's
+        looked up while the listen is submitted and primed in the song loader.
+        """
+        listen = _listen_input(input)
+        context = _graphql_context(info)
+        looks_up_song = _looks_up_song(selected_fields(info))
+        if context.async_context:
+            return SubmitListen._submit_listen_async(
+                context,
+                context.async_context,
+                listen,
+                looks_up_song
+            )
+
+        if not looks_up_song:
+            return use_listens.submit_listen(context.front_context, listen)
+
+        use_listens.reject_nighttime_listen(context.front_context, listen)
+        song_future = _executor(context).submit(
+            use_listens.get_song,
+            context.front_context,
+            listen.song_provider,
+            listen.song_id
+        )
+        submitted_listen = use_listens.submit_validated_listen(context.front_context, listen)
+
+        # a lookup still queued behind other resolvers is dropped rather than waited on, and a
+        # failed lookup isn't primed: either way the song resolver looks the song up itself.
+        if not song_future.cancel() and song_future.exception() is None:
+            context.song_loader.prime_from_any_thread(submitted_listen, song_future.result())
+
+        return submitted_listen
+
+    async def _submit_listen_async(graphql_context: GraphQlContext,
+                                   context: AsyncContext,
+                                   listen: ListenInput,
+                                   looks_up_song: bool) -> Listen:
+        if not looks_up_song:
+            return await use_listens.submit_listen_async(context, listen)
+
+        use_listens.reject_nighttime_listen(context, listen)
+        submitted_listen, song = await asyncio.gather(
+            use_listens.submit_validated_listen_async(context, listen),
+            use_listens.get_song_async(context, listen.song_provider, listen.song_id),
+            return_exceptions=True
         )
-        return use_listens.submit_listen(info.context, listen)
+        if isinstance(submitted_listen, BaseException):
+            raise submitted_listen
+
+        if graphql_context.async_song_loader and not isinstance(song, BaseException):
+            graphql_context.async_song_loader.prime(submitted_listen, song)
+
+        return submitted_listen
+
+
+class SubmitListenResult(NamedTuple):
+    listen: Optional[Listen]
+    error_message: Optional[str]
+
+
+class GraphQlSubmitListenResult(graphene.ObjectType):
+    """The listen submitted for one input of `submitListens`, or why it couldn't be submitted."""
+    class Meta:
+        name = 'SubmitListenResult'
+
+    listen = graphene.Field(GraphQlListen)
+    error_message = graphene.String()
+
+
+class SubmitListens(graphene.Mutation):
+    """Mutation for submitting many listens at once, i.e. from an import. Each listen is submitted
+    (or rejected) on its own, and its result is returned in the order of `inputs`.
+    """
+    class Arguments:
+        inputs = graphene.List(graphene.NonNull(GraphQlListenInput), required=True)
+
+    Output = graphene.NonNull(graphene.List(graphene.NonNull(GraphQlSubmitListenResult)))
+
+    @io_bound
+    def mutate(root,
+               info: ResolveInfo,
+               inputs: List[GraphQlListenInput]) -> Union[List[SubmitListenResult],
+                                                          Awaitable[List[SubmitListenResult]]]:
+        listen_inputs = [_listen_input(input) for input in inputs]
+        context = _graphql_context(info)
+        if context.async_context:
+            return SubmitListens._submit_listens_async(context.async_context, listen_inputs)
+
+        listens = use_listens.submit_listens(context.front_context, listen_inputs)
+        return SubmitListens._build_results(listens)
+
+    async def _submit_listens_async(context: AsyncContext,
+                                    listen_inputs: List[ListenInput]) -> List[SubmitListenResult]:
+        listens = await use_listens.submit_listens_async(context, listen_inputs)
+        return SubmitListens._build_results(listens)
+
+    def _build_results(listens: List[Union[Listen, ListensError]]) -> List[SubmitListenResult]:
+        """Errors are returned as data, as graphql treats an exception anywhere in a list as an
+        error of the whole list.
+        """
+        return [SubmitListenResult(listen=None, error_message=str(listen))
+                if isinstance(listen, ListensError)
+                else SubmitListenResult(listen=listen, error_message=None)
+                for listen in listens]
 
 
 class Mutation(graphene.ObjectType):
     """Root mutation type for morning cd."""
     submit_listen = SubmitListen.Field()
+    submit_listens = SubmitListens.Field()
+
+
+def _looks_up_song(listen_fields: Set[str]) -> bool:
+    """Whether `listen_fields` select anything of the listen's song that it doesn't already know.
+
+    >>> _looks_up_song({'id', 'song', 'song.id', 'song.songProvider'})
+    False
+    >>> _looks_up_song({'id', 'song', 'song.name'})
+    True
+    """
+    return any(field.startswith('song.') and field[len('song.'):] not in LISTEN_SONG_FIELDS
+               for field in listen_fields)
+
+
+def _listen_input(input: GraphQlListenInput) -> ListenInput:
+    return ListenInput(
+        song_id=input.song_id,
+        song_provider=MusicProvider(input.song_provider),
+        listener_name=input.listener_name,
+        note=input.note,
+        iana_timezone=input.iana_timezone
+    )
+
+
+def _graphql_context(info: ResolveInfo) -> GraphQlContext:
+    return cast(GraphQlContext, info.context)
+
+
+def _executor(context: GraphQlContext) -> Executor:
+    """The thread pool to overlap a resolver's lookups on: the execution's own, if it has one."""
+    return context.thread_pool or _lookup_pool
+
+
+def _overlap(context: GraphQlContext, fn: Callable[..., T], *args: Any) -> Callable[[], T]:
+    """Start `fn(*args)` on the thread pool, returning a function that waits for its result. A
+    call still queued behind other resolvers is run by that function instead of waited on.
+    """
+    future = _executor(context).submit(fn, *args)
+    return lambda: fn(*args) if future.cancel() else future.result()
 
 
 schema = graphene.Schema(query=Query, mutation=Mutation)
@@ -0,0 +1,612 @@
+import concurrent.futures
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
+
+from front.context import AsyncContext, Context
+from front.definitions import Listen, ListenInput, MusicProvider, Song, SortOrder, SunlightWindow
+from front.definitions.exceptions import ListenNotFoundError, ListensError, MusicError
+from front.delivery.graphql import create_graphql_context, schema
+from front.delivery.graphql.execution import (
+    ASYNC,
+    SYNC,
+    THREADS,
+    create_executor,
+    execution_thread_pool
+)
+from front.delivery.graphql.prefetch_test import FakeMusicGateway
+from front.gateways.listens import AsyncListensGatewayABC, ListensGatewayABC
+from front.gateways.listens.cached_listens_gateway_test import FakeListensGateway, LISTEN
+from front.gateways.music import AsyncMusicGatewayABC, MusicGatewayABC
+from front.gateways.sunlight import (
+    AsyncLocalSunlightGateway,
+    LocalSunlightGateway,
+    SunlightGatewayABC
+)
+from front.use_listens import MAX_LISTENS_PER_SUBMISSION
+
+
+SONG = Song(
+    id=LISTEN.song_id,
+    music_provider=LISTEN.song_provider,
+    name='Whispers',
+    artist_name='DAP The Contract',
+    album_name='Everybody Falls in the Summer',
+    image_url_by_size={}
+)
+
+
+class AsyncFakeListensGateway(AsyncListensGatewayABC):
+
+    def __init__(self) -> None:
+        self.requests: List[int] = []
+
+    async def fetch_listen(self, listen_id: str) -> Listen:
+        return LISTEN
+
+    async def fetch_listens(self,
+                            limit: int,
+                            sort_order: SortOrder,
+                            before_utc: Optional[datetime] = None,
+                            after_utc: Optional[datetime] = None) -> List[Listen]:
+        self.requests.append(limit)
+        return [LISTEN]
+
+    async def submit_listen(self, listen_input: ListenInput) -> Listen:
+        return LISTEN
+
+
+class AsyncFakeMusicGateway(AsyncMusicGatewayABC):
+
+    def __init__(self) -> None:
+        self.requests: List[Sequence[Listen]] = []
+
+    async def fetch_song(self, song_provider: MusicProvider, song_id: str) -> Song:
+        return SONG
+
+    async def fetch_songs(self, listens: Sequence[Listen]) -> List[Union[Song, MusicError]]:
+        self.requests.append(listens)
+        return [SONG for _ in listens]
+
+
+SUBMIT_LISTEN = '''
+mutation {
+    submitListen(input: {
+        songId: "58yFroDNbzHpYzvicaC0de",
+        listenerName: "Andre 3",
+        ianaTimezone: "America/New_York"
+    }) {
+        id
+        song { name }
+    }
+}
+'''
+
+
+class UnknownSunlightGateway(SunlightGatewayABC):
+    """Knows no sunlight window without a network call, so no listen is clearly submitted at night.
+    """
+
+    def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        raise NotImplementedError
+
+
+class LookupMusicGateway(MusicGatewayABC):
+    """Records its lookups, and signals `song_looked_up` once a song is fetched."""
+
+    def __init__(self) -> None:
+        self.song_looked_up = threading.Event()
+        self.song_requests: List[Tuple[MusicProvider, str]] = []
+        self.songs_requests: List[Sequence[Listen]] = []
+
+    def fetch_song(self, song_provider: MusicProvider, song_id: str) -> Song:
+        self.song_requests.append((song_provider, song_id))
+        self.song_looked_up.set()
+        return SONG
+
+    def fetch_songs(self, listens: Sequence[Listen]) -> List[Union[Song, MusicError]]:
+        self.songs_requests.append(listens)
+        return [SONG for _ in listens]
+
+
+class OverlappingListensGateway(FakeListensGateway):
+    """Waits up to `timeout` seconds for the song of a listen to be looked up while submitting it,
+    recording whether it was.
+    """
+
+    def __init__(self, music_gateway: LookupMusicGateway, timeout: float = 5) -> None:
+        super().__init__()
+        self.music_gateway = music_gateway
+        self.timeout = timeout
+        self.overlapped: List[bool] = []
+
+    def submit_listen(self, listen_input: ListenInput) -> Listen:
+        self.overlapped.append(self.music_gateway.song_looked_up.wait(timeout=self.timeout))
+        return super().submit_listen(listen_input)
+
+
+class TestSubmitListen:
+
+    def test_looks_up_the_song_while_submitting_without_a_thread_pool(self) -> None:
+        # Given a graphql context without a thread pool
+        music_gateway = LookupMusicGateway()
+        listens_gateway = OverlappingListensGateway(music_gateway)
+        graphql_context = create_graphql_context(
+            Context(listens_gateway, music_gateway, UnknownSunlightGateway())
+        )
+
+        # When we submit a listen, selecting its song's name
+        result = schema.execute(SUBMIT_LISTEN, context=graphql_context)
+
+        # Then the song is looked up while the listen is submitted
+        assert result.errors is None
+        assert result.data == {'submitListen': {'id': '1', 'song': {'name': 'Whispers'}}}
+        assert listens_gateway.overlapped == [True]
+
+        # And it's primed in the song loader, so the song resolver doesn't look it up again
+        assert music_gateway.song_requests == [(MusicProvider.SPOTIFY, LISTEN.song_id)]
+        assert music_gateway.songs_requests == []
+
+    def test_looks_up_the_song_on_the_executions_thread_pool(self) -> None:
+        # Given a graphql context with the threads execution mode's thread pool
+        music_gateway = LookupMusicGateway()
+        listens_gateway = OverlappingListensGateway(music_gateway)
+        graphql_context = create_graphql_context(
+            Context(listens_gateway, music_gateway, UnknownSunlightGateway()),
+            thread_pool=execution_thread_pool(THREADS)
+        )
+
+        # When we submit a listen with the threads executor
+        result = schema.execute(
+            SUBMIT_LISTEN,
+            context=graphql_context,
+            executor=create_executor(THREADS)
+        )
+
+        # Then the song is looked up while the listen is submitted, once
+        assert result.errors is None
+        assert result.data == {'submitListen': {'id': '1', 'song': {'name': 'Whispers'}}}
+        assert listens_gateway.overlapped == [True]
+        assert music_gateway.song_requests == [(MusicProvider.SPOTIFY, LISTEN.song_id)]
+        assert music_gateway.songs_requests == []
+
+    def test_drops_a_lookup_still_queued_once_the_listen_is_submitted(self) -> None:
+        # Given a graphql context whose thread pool's only thread is busy
+        thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        unblock = threading.Event()
+        thread_pool.submit(unblock.wait, 5)
+        music_gateway = LookupMusicGateway()
+        listens_gateway = OverlappingListensGateway(music_gateway, timeout=0)
+        graphql_context = create_graphql_context(
+            Context(listens_gateway, music_gateway, UnknownSunlightGateway()),
+            thread_pool=thread_pool
+        )
+
+        # When we submit a listen, selecting its song's name
+        result = schema.execute(SUBMIT_LISTEN, context=graphql_context)
+        unblock.set()
+        thread_pool.shutdown()
+
+        # Then the queued lookup is cancelled, and the song resolver looks the song up itself
+        assert result.errors is None
+        assert result.data == {'submitListen': {'id': '1', 'song': {'name': 'Whispers'}}}
+        assert listens_gateway.overlapped == [False]
+        assert music_gateway.song_requests == []
+        assert music_gateway.songs_requests == [[LISTEN]]
+
+    def test_doesnt_look_up_a_song_thats_not_selected(self) -> None:
+        # Given a graphql context
+        music_gateway = LookupMusicGateway()
+        listens_gateway = OverlappingListensGateway(music_gateway, timeout=0)
+        graphql_context = create_graphql_context(
+            Context(listens_gateway, music_gateway, UnknownSunlightGateway())
+        )
+
+        # When we submit a listen, selecting only its song's id
+        result = schema.execute(
+            SUBMIT_LISTEN.replace('song { name }', 'song { id }'),
+            context=graphql_context
+        )
+
+        # Then the song isn't looked up
+        assert result.errors is None
+        assert result.data == {'submitListen': {'id': '1', 'song': {'id': LISTEN.song_id}}}
+        assert music_gateway.song_requests == []
+        assert music_gateway.songs_requests == []
+
+
+class TimelineListensGateway(ListensGatewayABC):
+    """Has a listen on every hour from 10:00 to 14:00 on 2018-11-12. Fetching a page (of more than
+    one listen) waits up to 5 seconds for a single listen to be fetched, recording whether it was.
+    """
+
+    def __init__(self) -> None:
+        self.listens = [LISTEN._replace(id=str(hour), listen_time_utc=datetime(2018, 11, 12, hour))
+                        for hour in range(10, 15)]
+        self.probed = threading.Event()
+        self.overlapped: List[bool] = []
+
+    def fetch_listen(self, listen_id: str) -> Listen:
+        raise NotImplementedError
+
+    def fetch_listens(self,
+                      limit: int,
+                      sort_order: SortOrder,
+                      before_utc: Optional[datetime] = None,
+                      after_utc: Optional[datetime] = None) -> List[Listen]:
+        if limit == 1:
+            self.probed.set()
+        else:
+            self.overlapped.append(self.probed.wait(timeout=5))
+
+        listens = [listen for listen in self.listens
+                   if (before_utc is None or listen.listen_time_utc < before_utc)
+                   and (after_utc is None or listen.listen_time_utc > after_utc)]
+        if sort_order == SortOrder.DESCENDING:
+            listens.reverse()
+        return listens[:limit]
+
+    def submit_listen(self, listen_input: ListenInput) -> Listen:
+        raise NotImplementedError
+
+
+def page_info_of(listens_gateway: ListensGatewayABC,
+                 arguments: str,
+                 execution_mode: str = SYNC) -> Dict[str, Any]:
+    graphql_context = create_graphql_context(
+        Context(listens_gateway, FakeMusicGateway(), LocalSunlightGateway()),
+        thread_pool=execution_thread_pool(execution_mode)
+    )
+    result = schema.execute(
+        f'{{ allListens({arguments}) {{ pageInfo {{ hasNextPage hasPreviousPage }} }} }}',
+        context=graphql_context,
+        executor=create_executor(execution_mode)
+    )
+    assert result.errors is None
+    return cast(Dict[str, Any], result.data['allListens']['pageInfo'])
+
+
+class TestAllListens:
+
+    def test_pages_first_after_a_cursor_with_listens_on_both_sides(self) -> None:
+        # Given a timeline of listens from 10:00 to 14:00
+        listens_gateway = TimelineListensGateway()
+
+        # When we get the first two listens after 11:00
+        page_info = page_info_of(listens_gateway, 'first: 2, after: "2018-11-12T11:00:00"')
+
+        # Then there are pages on both sides, and the listen at the cursor is looked up while the
+        # page is fetched
+        assert page_info == {'hasNextPage': True, 'hasPreviousPage': True}
+        assert listens_gateway.overlapped == [True]
+
+    def test_pages_last_before_a_cursor_with_listens_on_both_sides(self) -> None:
+        # Given a timeline of listens from 10:00 to 14:00
+        listens_gateway = TimelineListensGateway()
+
+        # When we get the last two listens before 13:00
+        page_info = page_info_of(listens_gateway, 'last: 2, before: "2018-11-12T13:00:00"')
+
+        # Then there are pages on both sides, and the listen at the cursor is looked up while the
+        # page is fetched
+        assert page_info == {'hasNextPage': True, 'hasPreviousPage': True}
+        assert listens_gateway.overlapped == [True]
+
+    def test_pages_away_from_a_cursor_with_no_listens_behind_it(self) -> None:
+        # Given a timeline of listens from 10:00 to 14:00
+        listens_gateway = TimelineListensGateway()
+        listens_gateway.probed.set()
+
+        # When we page first after 09:00 and last before 15:00
+        first_page_info = page_info_of(listens_gateway, 'first: 2, after: "2018-11-12T09:00:00"')
+        last_page_info = page_info_of(listens_gateway, 'last: 2, before: "2018-11-12T15:00:00"')
+
+        # Then there's no page behind either cursor
+        assert first_page_info == {'hasNextPage': True, 'hasPreviousPage': False}
+        assert last_page_info == {'hasNextPage': False, 'hasPreviousPage': True}
+
+    def test_looks_up_the_listens_behind_the_cursor_on_the_executions_thread_pool(self) -> None:
+        # Given a timeline of listens from 10:00 to 14:00
+        listens_gateway = TimelineListensGateway()
+
+        # When we get the first two listens after 11:00 with the threads executor
+        page_info = page_info_of(
+            listens_gateway,
+            'first: 2, after: "2018-11-12T11:00:00"',
+            execution_mode=THREADS
+        )
+
+        # Then the listen at the cursor is looked up while the page is fetched
+        assert page_info == {'hasNextPage': True, 'hasPreviousPage': True}
+        assert listens_gateway.overlapped == [True]
+
+
+class NighttimeSunlightGateway(UnknownSunlightGateway):
+    """Knows that it's always night in 'Antarctica/McMurdo', and nothing about anywhere else."""
+
+    def peek_sunlight_window(self, iana_timezone: str, on_date: date) -> Optional[SunlightWindow]:
+        if iana_timezone != 'Antarctica/McMurdo':
+            return None
+
+        return SunlightWindow(sunrise_utc=datetime(2000, 1, 1), sunset_utc=datetime(2000, 1, 1))
+
+
+class SubmissionRecordingListensGateway(FakeListensGateway):
+    """Submits each listen with its listener's name as its id, except for listener 'Broken',
+    recording the listeners of the listens submitted.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.submitted: List[str] = []
+
+    def submit_listen(self, listen_input: ListenInput) -> Listen:
+        self.submitted.append(listen_input.listener_name)
+        if listen_input.listener_name == 'Broken':
+            raise ListensError('The listens service is down')
+        return LISTEN._replace(id=listen_input.listener_name)
+
+
+def submit_listens_of(listener_names: List[str]) -> str:
+    """A `submitListens` mutation of a listen by each of `listener_names`. Listener 'Night' listens
+    in 'Antarctica/McMurdo', and the others in 'America/New_York'.
+    """
+    inputs = ', '.join(
+        f'{{songId: "{LISTEN.song_id}", listenerName: "{listener_name}", ianaTimezone: "'
+        + ('Antarctica/McMurdo' if listener_name == 'Night' else 'America/New_York')
+        + '"}'
+        for listener_name in listener_names
+    )
+    return f'mutation {{ submitListens(inputs: [{inputs}]) {{ listen {{ id }} errorMessage }} }}'
+
+
+class TestSubmitListens:
+
+    def test_returns_each_listens_result_in_order(self) -> None:
+        # Given a graphql context
+        listens_gateway = SubmissionRecordingListensGateway()
+        graphql_context = create_graphql_context(
+            Context(listens_gateway, FakeMusicGateway(), NighttimeSunlightGateway())
+        )
+
+        # When we submit four listens, one at night and one that the listens service fails
+        result = schema.execute(
+            submit_listens_of(['Zach', 'Night', 'Broken', 'Sam']),
+            context=graphql_context
+        )
+
+        # Then the listen at night is rejected without being sent to the listens service
+        assert listens_gateway.submitted == ['Zach', 'Broken', 'Sam']
+
+        # And each listen's result, or its error, is returned in order
+        assert result.errors is None
+        assert result.data == {'submitListens': [
+            {'listen': {'id': 'Zach'}, 'errorMessage': None},
+            {'listen': None, 'errorMessage': 'Listens can only be submitted during the day'},
+            {'listen': None, 'errorMessage': 'The listens service is down'},
+            {'listen': {'id': 'Sam'}, 'errorMessage': None}
+        ]}
+
+    def test_rejects_more_listens_than_can_be_submitted_at_a_time(self) -> None:
+        # Given a graphql context
+        listens_gateway = SubmissionRecordingListensGateway()
+        graphql_context = create_graphql_context(
+            Context(listens_gateway, FakeMusicGateway(), NighttimeSunlightGateway())
+        )
+
+        # When we submit one more listen than can be submitted at a time
+        result = schema.execute(
+            submit_listens_of([str(i) for i in range(MAX_LISTENS_PER_SUBMISSION + 1)]),
+            context=graphql_context
+        )
+
+        # Then none of them are submitted, and the mutation fails
+        assert listens_gateway.submitted == []
+        assert result.data is None
+        assert [error.message for error in result.errors] == [
+            f'Only up to {MAX_LISTENS_PER_SUBMISSION} listens can be submitted at a time'
+        ]
+
+
+class BatchRecordingListensGateway(FakeListensGateway):
+    """Only has listen '1', and records each batch of ids fetched."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: List[List[str]] = []
+
+    def fetch_listens_by_ids(self,
+                             listen_ids: Sequence[str]) -> List[Union[Listen, ListensError]]:
+        self.batches.append(list(listen_ids))
+        return super().fetch_listens_by_ids(listen_ids)
+
+
+class AsyncBatchRecordingListensGateway(AsyncFakeListensGateway):
+    """Only has listen '1', and records each batch of ids fetched."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: List[List[str]] = []
+
+    async def fetch_listen(self, listen_id: str) -> Listen:
+        if listen_id != LISTEN.id:
+            raise ListenNotFoundError(f'No listen exists with id {listen_id}')
+        return LISTEN
+
+    async def fetch_listens_by_ids(self,
+                                   listen_ids: Sequence[str]) -> List[Union[Listen, ListensError]]:
+        self.batches.append(list(listen_ids))
+        return await super().fetch_listens_by_ids(listen_ids)
+
+
+LISTENS_BY_IDS = '''
+{
+    listensByIds(ids: ["1", "2", "1"]) { id }
+    listen(id: "1") { id }
+}
+'''
+
+
+class TestListensByIds:
+
+    def test_fetches_every_id_in_one_batch(self) -> None:
+        # Given a graphql context
+        listens_gateway = BatchRecordingListensGateway()
+        graphql_context = create_graphql_context(
+            Context(listens_gateway, FakeMusicGateway(), LocalSunlightGateway())
+        )
+
+        # When we query listens by ids, and a listen by id, where listen '2' doesn't exist
+        result = schema.execute(LISTENS_BY_IDS, context=graphql_context)
+
+        # Then every distinct id is fetched in one batch
+        assert listens_gateway.batches == [['1', '2']]
+
+        # And the missing listen is null, with its own error
+        assert result.data == {
+            'listensByIds': [{'id': '1'}, None, {'id': '1'}],
+            'listen': {'id': '1'}
+        }
+        assert [(error.message, error.path) for error in result.errors] == [
+            ('No listen exists with id 2', ['listensByIds', 1])
+        ]
+
+    def test_fetches_every_id_in_one_batch_with_the_async_gateways(self) -> None:
+        # Given a graphql context with async gateways
+        async_listens_gateway = AsyncBatchRecordingListensGateway()
+        graphql_context = create_graphql_context(
+            Context(FakeListensGateway(), FakeMusicGateway(), LocalSunlightGateway()),
+            AsyncContext(
+                async_listens_gateway,
+                AsyncFakeMusicGateway(),
+                AsyncLocalSunlightGateway()
+            )
+        )
+
+        # When we query listens by ids with the async executor, where listen '2' doesn't exist
+        result = schema.execute(
+            LISTENS_BY_IDS,
+            context=graphql_context,
+            executor=create_executor(ASYNC)
+        )
+
+        # Then every distinct id is fetched in one batch, and the missing listen has its own error
+        assert async_listens_gateway.batches == [['1', '2']]
+        assert result.data == {
+            'listensByIds': [{'id': '1'}, None, {'id': '1'}],
+            'listen': {'id': '1'}
+        }
+        assert [(error.message, error.path) for error in result.errors] == [
+            ('No listen exists with id 2', ['listensByIds', 1])
+        ]
+
+
+class TestResolveSong:
+
+    def test_doesnt_look_up_a_song_when_only_its_ids_are_selected(self) -> None:
+        # Given a graphql context
+        music_gateway = LookupMusicGateway()
+        graphql_context = create_graphql_context(
+            Context(FakeListensGateway(), music_gateway, LocalSunlightGateway())
+        )
+
+        # When we query a listen's song, selecting only what the listen knows of it
+        result = schema.execute(
+            '{ listen(id: "1") { song { id songProvider __typename } } }',
+            context=graphql_context
+        )
+
+        # Then the song is resolved from the listen, and isn't looked up
+        assert result.errors is None
+        assert result.data == {'listen': {'song': {
+            'id': LISTEN.song_id,
+            'songProvider': 'SPOTIFY',
+            '__typename': 'Song'
+        }}}
+        assert music_gateway.song_requests == []
+        assert music_gateway.songs_requests == []
+
+    def test_looks_up_a_song_when_its_name_is_selected(self) -> None:
+        # Given a graphql context
+        music_gateway = LookupMusicGateway()
+        graphql_context = create_graphql_context(
+            Context(FakeListensGateway(), music_gateway, LocalSunlightGateway())
+        )
+
+        # When we query a listen's song, selecting its name
+        result = schema.execute(
+            '{ listen(id: "1") { song { id name } } }',
+            context=graphql_context
+        )
+
+        # Then the song is looked up through the song loader
+        assert result.errors is None
+        assert result.data == {'listen': {'song': {'id': LISTEN.song_id, 'name': 'Whispers'}}}
+        assert music_gateway.songs_requests == [[LISTEN]]
+
+    def test_doesnt_look_up_songs_when_only_their_ids_are_selected_with_the_async_gateways(
+            self) -> None:
+        # Given a graphql context with async gateways
+        async_music_gateway = AsyncFakeMusicGateway()
+        graphql_context = create_graphql_context(
+            Context(FakeListensGateway(), FakeMusicGateway(), LocalSunlightGateway()),
+            AsyncContext(
+                AsyncFakeListensGateway(),
+                async_music_gateway,
+                AsyncLocalSunlightGateway()
+            )
+        )
+
+        # When we query the songs of a page of listens with the async executor, selecting only
+        # their ids
+        result = schema.execute(
+            '{ allListens(first: 10) { edges { node { song { id } } } } }',
+            context=graphql_context,
+            executor=create_executor(ASYNC)
+        )
+
+        # Then the songs aren't looked up
+        assert result.errors is None
+        assert result.data == {
+            'allListens': {'edges': [{'node': {'song': {'id': LISTEN.song_id}}}]}
+        }
+        assert async_music_gateway.requests == []
+
+
+class TestAsyncExecution:
+
+    def test_resolves_a_query_with_the_async_gateways(self) -> None:
+        # Given a graphql context with sync and async gateways
+        listens_gateway = FakeListensGateway()
+        music_gateway = FakeMusicGateway()
+        async_listens_gateway = AsyncFakeListensGateway()
+        async_music_gateway = AsyncFakeMusicGateway()
+        graphql_context = create_graphql_context(
+            Context(listens_gateway, music_gateway, LocalSunlightGateway()),
+            AsyncContext(async_listens_gateway, async_music_gateway, AsyncLocalSunlightGateway())
+        )
+
+        # When we execute a query with the async executor
+        result = schema.execute(
+            '''
+            {
+                allListens(first: 10) { edges { node { id song { name } } } }
+                sunlightWindow(ianaTimezone: "America/New_York", onDate: "2018-11-12") {
+                    sunsetUtc
+                }
+            }
+            ''',
+            context=graphql_context,
+            executor=create_executor(ASYNC)
+        )
+
+        # Then each field is resolved through the async gateways, and the sync ones go unused
+        assert result.errors is None
+        assert result.data == {
+            'allListens': {'edges': [{'node': {'id': '1', 'song': {'name': 'Whispers'}}}]},
+            'sunlightWindow': {'sunsetUtc': '2018-11-12T21:40:35'}
+        }
+        assert async_music_gateway.requests == [[LISTEN]]
+        assert len(async_listens_gateway.requests) == 1
+        assert listens_gateway.requests == []
+        assert music_gateway.requests == []
@@ -1,4 +1,7 @@
-from typing import Any, NamedTuple, Optional
+from typing import Any, Dict, NamedTuple, Optional, Set
+
+from graphql import ResolveInfo
+from graphql.language import ast
 
 
 class PageInfo(NamedTuple):
@@ -49,19 +52,25 @@ class RelayPaginationArguments(NamedTuple):
 
 
 def build_page_info(has_more: bool,
-                    pagination_args: RelayPaginationArguments) -> PageInfo:
+                    pagination_args: RelayPaginationArguments,
+                    has_more_behind: bool = False) -> PageInfo:
     """According to the relay connection spec, if `first` is set and the connection has more
     elements than the first n elements returned, set `hasNextPage` is true. If `first` _and_
     `after` are set, you can set `hasPreviousPage` to True _if_ 'the server can efficiently
-    determine that elements exist prior to after', which would be a pain so we set to False.
-    Same applies to last/before.
+    determine that elements exist prior to after', which is what `has_more_behind` says. Same
+    applies to last/before.
+
+    >>> build_page_info(True, RelayPaginationArguments(first=10, after='cursor'), True)
+    PageInfo(has_next_page=True, has_previous_page=True)
+    >>> build_page_info(True, RelayPaginationArguments(last=10), has_more_behind=False)
+    PageInfo(has_next_page=False, has_previous_page=True)
     """
     if pagination_args.first_is_set:
         has_next_page = has_more
-        has_previous_page = False
+        has_previous_page = has_more_behind
 
     elif pagination_args.last_is_set:
-        has_next_page = False
+        has_next_page = has_more_behind
         has_previous_page = has_more
 
     else:
@@ -73,6 +82,53 @@ def build_page_info(has_more: bool,
     )
 
 
+def selected_fields(info: ResolveInfo) -> Set[str]:
+    """The dotted paths of every field selected under the field being resolved, following named
+    and inline fragments, so that resolvers can skip work on fields that weren't selected.
+
+    >>> import graphene
+    >>> class Person(graphene.ObjectType):
+    ...     name = graphene.String()
+    ...     friend = graphene.Field(lambda: Person)
+    >>> class Query(graphene.ObjectType):
+    ...     person = graphene.Field(Person)
+    ...
+    ...     def resolve_person(root, info):
+    ...         print(sorted(selected_fields(info)))
+    >>> _ = graphene.Schema(query=Query).execute('''
+    ... { person { name ...on Person { friend { ...Friend } } } }
+    ... fragment Friend on Person { name }
+    ... ''')
+    ['friend', 'friend.name', 'name']
+    """
+    fields: Set[str] = set()
+    for field_ast in info.field_asts:
+        _collect_fields(field_ast.selection_set, info.fragments, '', fields)
+
+    return fields
+
+
+def _collect_fields(selection_set: Optional[ast.SelectionSet],
+                    fragments: Dict[str, ast.FragmentDefinition],
+                    prefix: str,
+                    fields: Set[str]) -> None:
+    if selection_set is None:
+        return
+
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            path = prefix + selection.name.value
+            fields.add(path)
+            _collect_fields(selection.selection_set, fragments, path + '.', fields)
+
+        elif isinstance(selection, ast.FragmentSpread):
+            fragment = fragments[selection.name.value]
+            _collect_fields(fragment.selection_set, fragments, prefix, fields)
+
+        elif isinstance(selection, ast.InlineFragment):
+            _collect_fields(selection.selection_set, fragments, prefix, fields)
+
+
 def _xor(left: Optional[Any], right: Optional[Any]) -> bool:
     """Return True if either `left` or `right` is not None, otherwise return False.
 
@@ -0,0 +1,84 @@
+"""The asyncio counterpart of `front.gateways.transport`. Async gateways make their http requests
+through an `AsyncHttpTransport`, which keeps one keep-alive aiohttp session per event loop. A
+session is closed when its event loop shuts down its async generators (as `asyncio.run` and
+`front.delivery.graphql.execution.shutdown_event_loop` do).
+
+aiohttp is only needed by the async execution path, and isn't one of the locked dependencies, so
+it's imported when a session is first created rather than when this module is imported.
+"""
+import asyncio
+import json
+import weakref
+from typing import Any, AsyncIterator, NamedTuple, Tuple
+
+
+SessionAndCloser = Tuple[Any, AsyncIterator[None]]
+
+
+class HttpResponse(NamedTuple):
+    status_code: int
+    content: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncHttpTransport:
+    """Like `HttpTransport`, allows up to `pool_size_per_host` concurrent connections per host and
+    times out requests after `connect_timeout` seconds waiting for a connection and
+    `read_timeout` seconds waiting for a response.
+    """
+
+    def __init__(self,
+                 pool_size_per_host: int = 4,
+                 connect_timeout: float = 3.05,
+                 read_timeout: float = 10.0) -> None:
+        self.pool_size_per_host = pool_size_per_host
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        # each session is kept with the suspended async generator that closes it on shutdown, as
+        # event loops only hold weak references to their async generators.
+        self._sessions: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SessionAndCloser]' = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def get(self, url: str, **kwargs: Any) -> HttpResponse:
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> HttpResponse:
+        return await self.request('POST', url, **kwargs)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> HttpResponse:
+        session = await self._session()
+        async with session.request(method, url, **kwargs) as r:
+            return HttpResponse(status_code=r.status, content=await r.read())
+
+    async def _session(self) -> Any:
+        import aiohttp
+
+        loop = asyncio.get_event_loop()
+        if loop not in self._sessions:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.pool_size_per_host),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.connect_timeout,
+                    sock_read=self.read_timeout
+                )
+            )
+            closer = _close_on_shutdown(session)
+            await closer.__anext__()
+            self._sessions[loop] = (session, closer)
+
+        session, _ = self._sessions[loop]
+        return session
+
+
+async def _close_on_shutdown(session: Any) -> AsyncIterator[None]:
+    """Suspends until its event loop shuts down its async generators, then closes `session`."""
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+default_async_transport = AsyncHttpTransport()
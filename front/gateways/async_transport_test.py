@@ -0,0 +1,46 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from front.gateways.async_transport import AsyncHttpTransport
+
+
+# aiohttp isn't one of the locked dependencies yet.
+pytest.importorskip('aiohttp')
+
+
+class TestSessions:
+
+    def test_reuses_one_session_per_event_loop(self) -> None:
+        # Given an async transport
+        transport = AsyncHttpTransport()
+        loop = asyncio.new_event_loop()
+
+        # When we get its session twice on one event loop, and once on another
+        first_session = loop.run_until_complete(transport._session())
+        second_session = loop.run_until_complete(transport._session())
+        other_loop = asyncio.new_event_loop()
+        other_session = other_loop.run_until_complete(transport._session())
+
+        # Then the event loop's session is reused, and the other event loop gets its own
+        assert first_session is second_session
+        assert other_session is not first_session
+
+        for event_loop in (loop, other_loop):
+            event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+            event_loop.close()
+
+    def test_closes_the_session_when_its_event_loop_shuts_down(self) -> None:
+        # Given an async transport with a session on an event loop
+        transport = AsyncHttpTransport()
+        loop = asyncio.new_event_loop()
+        session: Any = loop.run_until_complete(transport._session())
+        assert not session.closed
+
+        # When the event loop shuts down
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+        # Then the session is closed
+        assert session.closed
@@ -1,5 +1,12 @@
 # abc
-from .abc import ListensGatewayABC
+from .abc import AsyncListensGatewayABC, ListensGatewayABC
 
 # implementations
+from .async_listens_service_gateway import AsyncListensServiceGateway
+from .cached_listens_gateway import (
+    ActiveTimezones,
+    AsyncCachedListensGateway,
+    CachedListensGateway
+)
 from .listens_service_gateway import ListensServiceGateway
+from .timeline_listens_gateway import AsyncTimelineListensGateway, TimelineListensGateway
@@ -1,8 +1,14 @@
+import asyncio
+import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
 from front.definitions import Listen, ListenInput, SortOrder
+from front.definitions.exceptions import ListensError
+
+
+logger = logging.getLogger(__name__)
 
 
 class ListensGatewayABC(ABC):
@@ -11,6 +17,21 @@ class ListensGatewayABC(ABC):
     def fetch_listen(self, listen_id: str) -> Listen:
         ...
 
+    def fetch_listens_by_ids(self,
+                             listen_ids: Sequence[str]) -> List[Union[Listen, ListensError]]:
+        """Fetch the listen of each id in `listen_ids`, or the `ListensError` raised fetching it.
+        Gateways that can fetch many listens at once should override this, as by default each
+        distinct id is fetched on its own.
+        """
+        listen_by_id: Dict[str, Union[Listen, ListensError]] = {}
+        for listen_id in distinct_ids(listen_ids):
+            try:
+                listen_by_id[listen_id] = self.fetch_listen(listen_id)
+            except Exception as e:
+                listen_by_id[listen_id] = as_listens_error(e)
+
+        return [listen_by_id[listen_id] for listen_id in listen_ids]
+
     @abstractmethod
     def fetch_listens(self,
                       limit: int,
@@ -22,3 +43,94 @@ class ListensGatewayABC(ABC):
     @abstractmethod
     def submit_listen(self, listen_input: ListenInput) -> Listen:
         ...
+
+    def submit_listens(self,
+                       listen_inputs: Sequence[ListenInput]) -> List[Union[Listen, ListensError]]:
+        """Submit each of `listen_inputs`, returning the submitted listen or the `ListensError`
+        raised submitting it, in order. Gateways that can submit many listens at once should
+        override this, as by default each listen is submitted on its own.
+        """
+        listens: List[Union[Listen, ListensError]] = []
+        for listen_input in listen_inputs:
+            try:
+                listens.append(self.submit_listen(listen_input))
+            except Exception as e:
+                listens.append(as_listens_error(e))
+
+        return listens
+
+
+class AsyncListensGatewayABC(ABC):
+
+    @abstractmethod
+    async def fetch_listen(self, listen_id: str) -> Listen:
+        ...
+
+    async def fetch_listens_by_ids(self,
+                                   listen_ids: Sequence[str]) -> List[Union[Listen, ListensError]]:
+        unique_ids = distinct_ids(listen_ids)
+        listens = await asyncio.gather(
+            *(self.fetch_listen(listen_id) for listen_id in unique_ids),
+            return_exceptions=True
+        )
+
+        listen_by_id = dict(zip(unique_ids, _listens_or_errors(listens)))
+        return [listen_by_id[listen_id] for listen_id in listen_ids]
+
+    @abstractmethod
+    async def fetch_listens(self,
+                            limit: int,
+                            sort_order: SortOrder,
+                            before_utc: Optional[datetime],
+                            after_utc: Optional[datetime]) -> List[Listen]:
+        ...
+
+    @abstractmethod
+    async def submit_listen(self, listen_input: ListenInput) -> Listen:
+        ...
+
+    async def submit_listens(self,
+                             listen_inputs: Sequence[ListenInput]
+                             ) -> List[Union[Listen, ListensError]]:
+        listens = await asyncio.gather(
+            *(self.submit_listen(listen_input) for listen_input in listen_inputs),
+            return_exceptions=True
+        )
+        return _listens_or_errors(listens)
+
+
+def distinct_ids(listen_ids: Iterable[str]) -> List[str]:
+    """
+    >>> distinct_ids(['2', '1', '2'])
+    ['2', '1']
+    """
+    return list(dict.fromkeys(listen_ids))
+
+
+def as_listens_error(error: Exception) -> ListensError:
+    """`error` as the `ListensError` of a single listen in a batch, so one listen failing
+    unexpectedly doesn't fail the listens around it. Errors that aren't a `ListensError` are
+    logged, as they're otherwise lost.
+
+    >>> as_listens_error(ListensError('Listen is invalid.'))
+    ListensError('Listen is invalid.')
+    """
+    if isinstance(error, ListensError):
+        return error
+
+    logger.error('Unexpected error in a batch of listens.', exc_info=error)
+    return ListensError('Unexpected error reaching the listens service.')
+
+
+def _listens_or_errors(results: Iterable[Any]) -> List[Union[Listen, ListensError]]:
+    """The results of gathering listens with `return_exceptions`, with each exception as a
+    `ListensError`. Cancellation is re-raised.
+    """
+    listens: List[Union[Listen, ListensError]] = []
+    for result in results:
+        if isinstance(result, asyncio.CancelledError) or (
+                isinstance(result, BaseException) and not isinstance(result, Exception)):
+            raise result
+        listens.append(as_listens_error(result) if isinstance(result, Exception) else result)
+
+    return listens
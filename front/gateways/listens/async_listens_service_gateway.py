@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import List, Optional
+
+import requests
+
+from front.definitions import Listen, ListenInput, SortOrder
+from front.definitions.exceptions import ListenNotFoundError, ListensError
+from front.gateways.async_transport import AsyncHttpTransport, default_async_transport
+from front.gateways.listens import AsyncListensGatewayABC
+from front.gateways.listens.listens_service_gateway import (
+    ListensServiceGateway,
+    _build_fetch_listens_params,
+    _build_submit_listen_body,
+    _pluck_listen,
+    _pluck_listens
+)
+
+
+class AsyncListensServiceGateway(AsyncListensGatewayABC):
+    endpoint = ListensServiceGateway.endpoint
+
+    def __init__(self,
+                 api_key: str,
+                 transport: AsyncHttpTransport = default_async_transport) -> None:
+        self.api_key = api_key
+        self.transport = transport
+
+    async def fetch_listen(self, listen_id: str) -> Listen:
+        r = await self.transport.get(
+            f'{self.endpoint}/{listen_id}',
+            headers={'x-api-key': self.api_key}
+        )
+
+        if not r.status_code == requests.codes.ok:
+            message = r.json().get('message', '')
+            if r.status_code == requests.codes.not_found:
+                raise ListenNotFoundError(message)
+            raise ListensError(message)
+
+        return _pluck_listen(r.json())
+
+    async def fetch_listens(self,
+                            limit: int,
+                            sort_order: SortOrder,
+                            before_utc: Optional[datetime] = None,
+                            after_utc: Optional[datetime] = None) -> List[Listen]:
+        params = _build_fetch_listens_params(limit, sort_order, before_utc, after_utc)
+        r = await self.transport.get(
+            self.endpoint,
+            params=params,
+            headers={'x-api-key': self.api_key}
+        )
+
+        if not r.status_code == requests.codes.ok:
+            message = r.json().get('message', '')
+            raise ListensError(message)
+
+        return _pluck_listens(r.json()['items'])
+
+    async def submit_listen(self, listen_input: ListenInput) -> Listen:
+        body = _build_submit_listen_body(listen_input)
+        r = await self.transport.post(
+            self.endpoint,
+            json=body,
+            headers={'x-api-key': self.api_key}
+        )
+
+        if not r.status_code == requests.codes.ok:
+            message = r.json().get('message', '')
+            raise ListensError(message)
+
+        return _pluck_listen(r.json())
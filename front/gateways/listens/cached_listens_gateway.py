@@ -0,0 +1,448 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union
+)
+
+from front.cache import LruCache
+from front.definitions import Listen, ListenInput, SortOrder
+from front.definitions.exceptions import ListenNotFoundError, ListensError
+from front.gateways.listens import AsyncListensGatewayABC, ListensGatewayABC
+from front.gateways.listens.abc import distinct_ids
+from front.gateways.sunlight import AsyncSunlightGatewayABC, SunlightGatewayABC
+from front.gateways.sunlight.timezones import canonical_timezone
+
+
+PageKey = Tuple[Optional[datetime], Optional[datetime], SortOrder, int]
+CachedListen = Union[Listen, ListenNotFoundError]
+ListenById = Dict[str, Union[Listen, ListensError]]
+AnySunlightGateway = Union[SunlightGatewayABC, AsyncSunlightGatewayABC]
+
+
+class ActiveTimezones:
+    """The timezones listens are submitted from, whose sunlight windows decide how long a cached
+    feed page lives. Every cached listens gateway in a process shares one (i.e. at module level),
+    so each invocation allows for the timezones of listens seen by earlier ones.
+
+    Listens are also submitted through other processes (i.e. other lambda containers), from
+    timezones this one may never have seen. So unless some timezones are `configured`, we can't
+    tell that it's night everywhere listens come from, and there are no active timezones at all.
+    Once they are, the timezones of listens we see are added to them.
+
+    >>> active_timezones = ActiveTimezones([])
+    >>> active_timezones.add(['Europe/London'])
+    >>> sorted(active_timezones)
+    []
+    >>> active_timezones = ActiveTimezones(['US/Eastern'])
+    >>> active_timezones.add(['Europe/London'])
+    >>> sorted(active_timezones)
+    ['America/New_York', 'Europe/London']
+    """
+
+    def __init__(self, configured: Iterable[str]) -> None:
+        self.configured = _canonical_timezones(configured)
+        self._timezones = self.configured
+        self._lock = threading.Lock()
+
+    def add(self, timezones: Iterable[str]) -> None:
+        if not self.configured:
+            return
+
+        with self._lock:
+            self._timezones |= _canonical_timezones(timezones)
+
+    def clear(self) -> None:
+        """Forget every timezone that isn't configured."""
+        with self._lock:
+            self._timezones = self.configured
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._timezones)
+
+
+class CachedListensGateway(ListensGatewayABC):
+    """Serves pages of listens, keyed by `(before_utc, after_utc, sort_order, limit)`, from a cache
+    before falling back to another listens gateway.
+
+    Listens are timestamped when they're submitted, so a page before a time in the past never
+    changes: those are kept in `page_cache` for `past_ttl` seconds. Pages that reach the present
+    (i.e. the first page of the feed, which has no `before_utc`) are kept in `feed_cache`, which is
+    cleared whenever a listen is submitted through this gateway.
+
+    Listens can only be submitted while the sun is up where they're submitted from, so while it's
+    night in every active timezone the feed can't change. A page in `feed_cache` lives until the
+    next sunrise in any active timezone (at most `max_ttl` seconds), or for `daytime_ttl` seconds
+    while the sun is up somewhere (or there are no active timezones). The timezones of listens
+    this gateway sees are added to `active_timezones`.
+
+    Listens never change once they're submitted, so every listen in a fetched page or a submitted
+    listen is also kept in `listen_cache` by its id, to serve `fetch_listen` without a round trip.
+    Ids of listens that don't exist are kept for `not_found_ttl` seconds, as a listen may yet be
+    submitted with that id.
+    """
+    daytime_ttl = 30.0
+    max_ttl = 6 * 60 * 60.0
+    past_ttl = 24 * 60 * 60.0
+    not_found_ttl = 60.0
+
+    def __init__(self,
+                 listens_gateway: ListensGatewayABC,
+                 feed_cache: LruCache[PageKey, List[Listen]],
+                 page_cache: LruCache[PageKey, List[Listen]],
+                 listen_cache: LruCache[str, CachedListen],
+                 sunlight_gateway: AnySunlightGateway,
+                 active_timezones: ActiveTimezones,
+                 clock: Callable[[], datetime] = datetime.utcnow) -> None:
+        self.listens_gateway = listens_gateway
+        self.feed_cache = feed_cache
+        self.page_cache = page_cache
+        self.listen_cache = listen_cache
+        self.sunlight_gateway = sunlight_gateway
+        self.active_timezones = active_timezones
+        self._clock = clock
+
+    def fetch_listen(self, listen_id: str) -> Listen:
+        listen = _cached_listen(self.listen_cache, listen_id)
+
+        if listen is None:
+            try:
+                listen = self.listens_gateway.fetch_listen(listen_id)
+            except ListenNotFoundError as e:
+                self.listen_cache.set(listen_id, e, self.not_found_ttl)
+                raise
+            self.listen_cache.set(listen_id, listen)
+
+        return listen
+
+    def fetch_listens_by_ids(self,
+                             listen_ids: Sequence[str]) -> List[Union[Listen, ListensError]]:
+        listen_by_id, uncached_ids = _get_cached_listens(self.listen_cache, listen_ids)
+
+        if uncached_ids:
+            fetched_listens = self.listens_gateway.fetch_listens_by_ids(uncached_ids)
+            _cache_fetched_listens(
+                self.listen_cache,
+                listen_by_id,
+                uncached_ids,
+                fetched_listens,
+                self.not_found_ttl
+            )
+
+        return [listen_by_id[listen_id] for listen_id in listen_ids]
+
+    def fetch_listens(self,
+                      limit: int,
+                      sort_order: SortOrder,
+                      before_utc: Optional[datetime] = None,
+                      after_utc: Optional[datetime] = None) -> List[Listen]:
+        key = _page_key(limit, sort_order, before_utc, after_utc)
+        now_utc = self._clock()
+        cache = self.page_cache if _is_past(key, now_utc) else self.feed_cache
+        listens = cache.get(key)
+
+        if listens is None:
+            listens = self.listens_gateway.fetch_listens(
+                limit=limit,
+                sort_order=sort_order,
+                before_utc=before_utc,
+                after_utc=after_utc
+            )
+            self.active_timezones.add(_listen_timezones(listens))
+            cache.set(key, listens, self._ttl(key, now_utc))
+            _cache_listens(self.listen_cache, listens)
+
+        return listens
+
+    def submit_listen(self, listen_input: ListenInput) -> Listen:
+        listen = self.listens_gateway.submit_listen(listen_input)
+        self.feed_cache.clear()
+        self.active_timezones.add(_listen_timezones([listen]))
+        _cache_listens(self.listen_cache, [listen])
+        return listen
+
+    def submit_listens(self,
+                       listen_inputs: Sequence[ListenInput]) -> List[Union[Listen, ListensError]]:
+        listens = self.listens_gateway.submit_listens(listen_inputs)
+        self._record_submitted_listens(listens)
+        return listens
+
+    def _record_submitted_listens(self, listens: List[Union[Listen, ListensError]]) -> None:
+        submitted_listens = [listen for listen in listens if isinstance(listen, Listen)]
+        if submitted_listens:
+            self.feed_cache.clear()
+            self.active_timezones.add(_listen_timezones(submitted_listens))
+            _cache_listens(self.listen_cache, submitted_listens)
+
+    def _ttl(self, key: PageKey, now_utc: datetime) -> float:
+        if _is_past(key, now_utc):
+            return self.past_ttl
+
+        return feed_ttl(
+            self.sunlight_gateway,
+            self.active_timezones,
+            now_utc,
+            self.daytime_ttl,
+            self.max_ttl
+        )
+
+
+class AsyncCachedListensGateway(AsyncListensGatewayABC):
+    """The async counterpart of `CachedListensGateway`. Both can share the same caches."""
+    daytime_ttl = CachedListensGateway.daytime_ttl
+    max_ttl = CachedListensGateway.max_ttl
+    past_ttl = CachedListensGateway.past_ttl
+    not_found_ttl = CachedListensGateway.not_found_ttl
+
+    def __init__(self,
+                 listens_gateway: AsyncListensGatewayABC,
+                 feed_cache: LruCache[PageKey, List[Listen]],
+                 page_cache: LruCache[PageKey, List[Listen]],
+                 listen_cache: LruCache[str, CachedListen],
+                 sunlight_gateway: AnySunlightGateway,
+                 active_timezones: ActiveTimezones,
+                 clock: Callable[[], datetime] = datetime.utcnow) -> None:
+        self.listens_gateway = listens_gateway
+        self.feed_cache = feed_cache
+        self.page_cache = page_cache
+        self.listen_cache = listen_cache
+        self.sunlight_gateway = sunlight_gateway
+        self.active_timezones = active_timezones
+        self._clock = clock
+
+    async def fetch_listen(self, listen_id: str) -> Listen:
+        listen = _cached_listen(self.listen_cache, listen_id)
+
+        if listen is None:
+            try:
+                listen = await self.listens_gateway.fetch_listen(listen_id)
+            except ListenNotFoundError as e:
+                self.listen_cache.set(listen_id, e, self.not_found_ttl)
+                raise
+            self.listen_cache.set(listen_id, listen)
+
+        return listen
+
+    async def fetch_listens_by_ids(self,
+                                   listen_ids: Sequence[str]) -> List[Union[Listen, ListensError]]:
+        listen_by_id, uncached_ids = _get_cached_listens(self.listen_cache, listen_ids)
+
+        if uncached_ids:
+            fetched_listens = await self.listens_gateway.fetch_listens_by_ids(uncached_ids)
+            _cache_fetched_listens(
+                self.listen_cache,
+                listen_by_id,
+                uncached_ids,
+                fetched_listens,
+                self.not_found_ttl
+            )
+
+        return [listen_by_id[listen_id] for listen_id in listen_ids]
+
+    async def fetch_listens(self,
+                            limit: int,
+                            sort_order: SortOrder,
+                            before_utc: Optional[datetime] = None,
+                            after_utc: Optional[datetime] = None) -> List[Listen]:
+        key = _page_key(limit, sort_order, before_utc, after_utc)
+        now_utc = self._clock()
+        cache = self.page_cache if _is_past(key, now_utc) else self.feed_cache
+        listens = cache.get(key)
+
+        if listens is None:
+            listens = await self.listens_gateway.fetch_listens(
+                limit=limit,
+                sort_order=sort_order,
+                before_utc=before_utc,
+                after_utc=after_utc
+            )
+            self.active_timezones.add(_listen_timezones(listens))
+            cache.set(key, listens, self._ttl(key, now_utc))
+            _cache_listens(self.listen_cache, listens)
+
+        return listens
+
+    async def submit_listen(self, listen_input: ListenInput) -> Listen:
+        listen = await self.listens_gateway.submit_listen(listen_input)
+        self.feed_cache.clear()
+        self.active_timezones.add(_listen_timezones([listen]))
+        _cache_listens(self.listen_cache, [listen])
+        return listen
+
+    async def submit_listens(self,
+                             listen_inputs: Sequence[ListenInput]
+                             ) -> List[Union[Listen, ListensError]]:
+        listens = await self.listens_gateway.submit_listens(listen_inputs)
+        self._record_submitted_listens(listens)
+        return listens
+
+    def _record_submitted_listens(self, listens: List[Union[Listen, ListensError]]) -> None:
+        submitted_listens = [listen for listen in listens if isinstance(listen, Listen)]
+        if submitted_listens:
+            self.feed_cache.clear()
+            self.active_timezones.add(_listen_timezones(submitted_listens))
+            _cache_listens(self.listen_cache, submitted_listens)
+
+    def _ttl(self, key: PageKey, now_utc: datetime) -> float:
+        if _is_past(key, now_utc):
+            return self.past_ttl
+
+        return feed_ttl(
+            self.sunlight_gateway,
+            self.active_timezones,
+            now_utc,
+            self.daytime_ttl,
+            self.max_ttl
+        )
+
+
+# the sunlight windows we know of may differ slightly from the listens service's own.
+SUNLIGHT_MARGIN = timedelta(minutes=5)
+
+# listens still being submitted may be timestamped a moment before they show up.
+SUBMISSION_MARGIN = timedelta(minutes=1)
+
+
+def feed_ttl(sunlight_gateway: AnySunlightGateway,
+             timezones: Iterable[str],
+             now_utc: datetime,
+             daytime_ttl: float,
+             max_ttl: float) -> float:
+    """Seconds until the sun rises in any of `timezones`, or `daytime_ttl` if it's up in one of
+    them (or there are none, or we can't tell without a network call).
+
+    >>> from front.gateways.sunlight import LocalSunlightGateway
+    >>> gateway = LocalSunlightGateway()  # sunrise is at 11:40:28 utc on the 13th
+    >>> feed_ttl(gateway, ['America/New_York'], datetime(2018, 11, 13, 6, 0), 30, max_ttl=86400)
+    20128.0
+    >>> feed_ttl(gateway, ['America/New_York'], datetime(2018, 11, 13, 15, 30), 30, max_ttl=86400)
+    30
+    >>> feed_ttl(gateway, [], datetime(2018, 11, 13, 6, 0), 30, max_ttl=86400)
+    30
+    """
+    next_sunrises = [_next_sunrise(sunlight_gateway, iana_timezone, now_utc)
+                     for iana_timezone in timezones]
+    if not next_sunrises or None in next_sunrises:
+        return daytime_ttl
+
+    seconds_until_sunrise = (min(filter(None, next_sunrises)) - now_utc).total_seconds()
+    if seconds_until_sunrise <= daytime_ttl:
+        return daytime_ttl
+
+    return min(seconds_until_sunrise, max_ttl)
+
+
+def _next_sunrise(sunlight_gateway: AnySunlightGateway,
+                  iana_timezone: str,
+                  now_utc: datetime) -> Optional[datetime]:
+    """The next time at or after `now_utc` at which listens can be submitted from `iana_timezone`,
+    allowing for `SUNLIGHT_MARGIN`. A timezone's local date is within a day of the utc date, so
+    its next sunrise is in one of the sunlight windows of the utc dates around `now_utc`.
+    """
+    for days in (-1, 0, 1, 2):
+        sunlight_window = sunlight_gateway.peek_sunlight_window(
+            iana_timezone,
+            (now_utc + timedelta(days=days)).date()
+        )
+        if sunlight_window is None:
+            return None
+
+        if now_utc <= sunlight_window.sunset_utc + SUNLIGHT_MARGIN:
+            return max(now_utc, sunlight_window.sunrise_utc - SUNLIGHT_MARGIN)
+
+    return None
+
+
+def _page_key(limit: int,
+              sort_order: SortOrder,
+              before_utc: Optional[datetime],
+              after_utc: Optional[datetime]) -> PageKey:
+    return (_naive_utc(before_utc), _naive_utc(after_utc), sort_order, limit)
+
+
+def _is_past(key: PageKey, now_utc: datetime) -> bool:
+    """Whether the page of `key` ends before the present, in which case it never changes.
+
+    >>> _is_past((datetime(2018, 11, 12, 15, 0), None, SortOrder.DESCENDING, 10),
+    ...          now_utc=datetime(2018, 11, 12, 15, 30))
+    True
+    >>> _is_past((None, datetime(2018, 11, 12, 15, 0), SortOrder.ASCENDING, 10),
+    ...          now_utc=datetime(2018, 11, 12, 15, 30))
+    False
+    """
+    before_utc, *_ = key
+    return before_utc is not None and before_utc <= now_utc - SUBMISSION_MARGIN
+
+
+def _cached_listen(listen_cache: LruCache[str, CachedListen], listen_id: str) -> Optional[Listen]:
+    """The cached listen of `listen_id`, or None if it isn't cached. Raises `ListenNotFoundError`
+    if we know there's no such listen.
+    """
+    listen = listen_cache.get(listen_id)
+    if isinstance(listen, ListenNotFoundError):
+        raise ListenNotFoundError(*listen.args)
+
+    return listen
+
+
+def _get_cached_listens(listen_cache: LruCache[str, CachedListen],
+                        listen_ids: Sequence[str]) -> Tuple[ListenById, List[str]]:
+    """Look up each distinct id of `listen_ids` in `listen_cache`. Returns the cached listens (and
+    errors of listens we know don't exist) by id, along with the ids that aren't cached.
+    """
+    listen_by_id: ListenById = {}
+    uncached_ids: List[str] = []
+    for listen_id in distinct_ids(listen_ids):
+        listen = listen_cache.get(listen_id)
+        if listen is None:
+            uncached_ids.append(listen_id)
+        elif isinstance(listen, ListenNotFoundError):
+            listen_by_id[listen_id] = ListenNotFoundError(*listen.args)
+        else:
+            listen_by_id[listen_id] = listen
+
+    return listen_by_id, uncached_ids
+
+
+def _cache_fetched_listens(listen_cache: LruCache[str, CachedListen],
+                           listen_by_id: ListenById,
+                           listen_ids: List[str],
+                           fetched_listens: List[Union[Listen, ListensError]],
+                           not_found_ttl: float) -> None:
+    """Add `fetched_listens` to `listen_by_id`, caching each listen, and each error of a listen
+    that doesn't exist. Other errors (i.e. the listens service being down) aren't cached.
+    """
+    for listen_id, listen in zip(listen_ids, fetched_listens):
+        listen_by_id[listen_id] = listen
+        if isinstance(listen, ListenNotFoundError):
+            listen_cache.set(listen_id, listen, not_found_ttl)
+        elif isinstance(listen, Listen):
+            listen_cache.set(listen_id, listen)
+
+
+def _cache_listens(listen_cache: LruCache[str, CachedListen], listens: Iterable[Listen]) -> None:
+    for listen in listens:
+        listen_cache.set(listen.id, listen)
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return value
+
+
+def _canonical_timezones(timezones: Iterable[str]) -> FrozenSet[str]:
+    return frozenset(canonical_timezone(iana_timezone) for iana_timezone in timezones)
+
+
+def _listen_timezones(listens: Iterable[Listen]) -> FrozenSet[str]:
+    return _canonical_timezones(listen.iana_timezone for listen in listens)
@@ -0,0 +1,311 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import pytest
+
+from front.cache import LruCache
+from front.definitions import Listen, ListenInput, MusicProvider, SortOrder
+from front.definitions.exceptions import ListenNotFoundError
+from front.gateways.listens import ActiveTimezones, CachedListensGateway, ListensGatewayABC
+from front.gateways.sunlight import LocalSunlightGateway
+
+
+LISTEN = Listen(
+    id='1',
+    song_id='58yFroDNbzHpYzvicaC0de',
+    song_provider=MusicProvider.SPOTIFY,
+    listener_name='Andre 3',
+    listen_time_utc=datetime(2018, 11, 12, 15, 0),
+    iana_timezone='America/New_York',
+    note='I like this song!'
+)
+
+LISTEN_INPUT = ListenInput(
+    song_id=LISTEN.song_id,
+    song_provider=LISTEN.song_provider,
+    listener_name=LISTEN.listener_name,
+    note='I like this song!',
+    iana_timezone=LISTEN.iana_timezone
+)
+
+
+class FakeListensGateway(ListensGatewayABC):
+
+    def __init__(self, listen: Listen = LISTEN) -> None:
+        self.listen = listen
+        self.requests: List[Tuple[Optional[datetime], Optional[datetime]]] = []
+        self.listen_requests: List[str] = []
+
+    def fetch_listen(self, listen_id: str) -> Listen:
+        self.listen_requests.append(listen_id)
+        if listen_id != LISTEN.id:
+            raise ListenNotFoundError(f'No listen exists with id {listen_id}')
+        return LISTEN
+
+    def fetch_listens(self,
+                      limit: int,
+                      sort_order: SortOrder,
+                      before_utc: Optional[datetime] = None,
+                      after_utc: Optional[datetime] = None) -> List[Listen]:
+        self.requests.append((before_utc, after_utc))
+        return [self.listen]
+
+    def submit_listen(self, listen_input: ListenInput) -> Listen:
+        return self.listen
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cached_listens_gateway(listens_gateway: ListensGatewayABC,
+                                cache_clock: FakeClock,
+                                now_utc: datetime,
+                                active_timezones: Optional[ActiveTimezones] = None
+                                ) -> CachedListensGateway:
+    return CachedListensGateway(
+        listens_gateway,
+        LruCache(max_size=10, clock=cache_clock),
+        LruCache(max_size=10, clock=cache_clock),
+        LruCache(max_size=10, clock=cache_clock),
+        LocalSunlightGateway(),
+        active_timezones=active_timezones or ActiveTimezones(['US/Eastern']),
+        clock=lambda: now_utc
+    )
+
+
+class TestFetchListens:
+
+    def test_serves_the_feed_from_cache_until_sunrise(self) -> None:
+        # Given a cached listens gateway at 1am in new york, where the sun rises at 6:40am
+        listens_gateway = FakeListensGateway()
+        cache_clock = FakeClock()
+        cached_listens_gateway = make_cached_listens_gateway(
+            listens_gateway,
+            cache_clock,
+            now_utc=datetime(2018, 11, 13, 6, 0)
+        )
+
+        # When we fetch the feed, and fetch it again an hour later
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+        cache_clock.now = 60 * 60.0
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+
+        # Then the feed is only fetched once
+        assert listens_gateway.requests == [(None, None)]
+
+    def test_serves_the_feed_from_cache_until_sunrise_where_other_gateways_saw_listens(
+            self) -> None:
+        # Given two cached listens gateways sharing their active timezones at 10pm in new york,
+        # one of which has seen a listen from london, where the sun rises at 7:15am
+        active_timezones = ActiveTimezones(['US/Eastern'])
+        now_utc = datetime(2018, 11, 13, 3, 0)
+        make_cached_listens_gateway(
+            FakeListensGateway(LISTEN._replace(iana_timezone='Europe/London')),
+            FakeClock(),
+            now_utc,
+            active_timezones
+        ).fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+
+        listens_gateway = FakeListensGateway()
+        cache_clock = FakeClock()
+        cached_listens_gateway = make_cached_listens_gateway(
+            listens_gateway,
+            cache_clock,
+            now_utc,
+            active_timezones
+        )
+
+        # When the other gateway fetches the feed, and fetches it again after sunrise in london
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+        cache_clock.now = 5 * 60 * 60.0
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+
+        # Then the feed is fetched again
+        assert listens_gateway.requests == [(None, None), (None, None)]
+
+    def test_serves_the_feed_from_cache_briefly_without_configured_timezones(self) -> None:
+        # Given a cached listens gateway without configured timezones at 1am in new york
+        listens_gateway = FakeListensGateway()
+        cache_clock = FakeClock()
+        cached_listens_gateway = make_cached_listens_gateway(
+            listens_gateway,
+            cache_clock,
+            now_utc=datetime(2018, 11, 13, 6, 0),
+            active_timezones=ActiveTimezones([])
+        )
+
+        # When we fetch the feed, and fetch it again after the daytime ttl has passed
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+        cache_clock.now = CachedListensGateway.daytime_ttl + 1
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+
+        # Then the feed is fetched again, as listens may be coming from where the sun is up
+        assert listens_gateway.requests == [(None, None), (None, None)]
+
+    def test_serves_the_feed_from_cache_briefly_during_the_day(self) -> None:
+        # Given a cached listens gateway at 10:30am in new york
+        listens_gateway = FakeListensGateway()
+        cache_clock = FakeClock()
+        cached_listens_gateway = make_cached_listens_gateway(
+            listens_gateway,
+            cache_clock,
+            now_utc=datetime(2018, 11, 13, 15, 30)
+        )
+
+        # When we fetch the feed, and fetch it again after the daytime ttl has passed
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+        cache_clock.now = CachedListensGateway.daytime_ttl + 1
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+
+        # Then the feed is fetched again once the daytime ttl has passed
+        assert listens_gateway.requests == [(None, None), (None, None)]
+
+    def test_caches_pages_that_end_in_the_past(self) -> None:
+        # Given a cached listens gateway at 10:30am in new york
+        listens_gateway = FakeListensGateway()
+        cache_clock = FakeClock()
+        cached_listens_gateway = make_cached_listens_gateway(
+            listens_gateway,
+            cache_clock,
+            now_utc=datetime(2018, 11, 13, 15, 30)
+        )
+
+        # When we fetch yesterday's page of listens, and fetch it again after a listen is submitted
+        # and the daytime ttl has passed
+        before_utc = datetime(2018, 11, 12, 15, 30)
+        cached_listens_gateway.fetch_listens(10, SortOrder.DESCENDING, before_utc=before_utc)
+        cached_listens_gateway.submit_listen(LISTEN_INPUT)
+        cache_clock.now = CachedListensGateway.daytime_ttl + 1
+        cached_listens_gateway.fetch_listens(10, SortOrder.DESCENDING, before_utc=before_utc)
+
+        # Then the page is only fetched once
+        assert listens_gateway.requests == [(before_utc, None)]
+        assert cached_listens_gateway.page_cache.stats.hits == 1
+
+    def test_pages_that_reach_the_present_are_cached_briefly(self) -> None:
+        # Given a cached listens gateway at 10:30am in new york
+        listens_gateway = FakeListensGateway()
+        cache_clock = FakeClock()
+        cached_listens_gateway = make_cached_listens_gateway(
+            listens_gateway,
+            cache_clock,
+            now_utc=datetime(2018, 11, 13, 15, 30)
+        )
+
+        # When we fetch the page of listens after yesterday twice, with the daytime ttl between
+        after_utc = datetime(2018, 11, 12, 15, 30)
+        cached_listens_gateway.fetch_listens(10, SortOrder.ASCENDING, after_utc=after_utc)
+        cache_clock.now = CachedListensGateway.daytime_ttl + 1
+        cached_listens_gateway.fetch_listens(10, SortOrder.ASCENDING, after_utc=after_utc)
+
+        # Then the page is fetched both times
+        assert listens_gateway.requests == [(None, after_utc), (None, after_utc)]
+
+
+class TestFetchListen:
+
+    def test_serves_listens_of_fetched_pages(self) -> None:
+        # Given a cached listens gateway that has fetched a page of listens
+        listens_gateway = FakeListensGateway()
+        cached_listens_gateway = make_cached_listens_gateway(
+            listens_gateway,
+            FakeClock(),
+            now_utc=datetime(2018, 11, 13, 15, 30)
+        )
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+
+        # When we fetch a listen of that page by its id
+        listen = cached_listens_gateway.fetch_listen(LISTEN.id)
+
+        # Then it's served from cache
+        assert listen == LISTEN
+        assert listens_gateway.listen_requests == []
+
+    def test_caches_listens_that_dont_exist_briefly(self) -> None:
+        # Given a cached listens gateway
+        listens_gateway = FakeListensGateway()
+        cache_clock = FakeClock()
+        cached_listens_gateway = make_cached_listens_gateway(
+            listens_gateway,
+            cache_clock,
+            now_utc=datetime(2018, 11, 13, 15, 30)
+        )
+
+        # When we fetch a listen that doesn't exist twice, and again after the not found ttl
+        for now in (0.0, 1.0, CachedListensGateway.not_found_ttl + 1):
+            cache_clock.now = now
+            with pytest.raises(ListenNotFoundError):
+                cached_listens_gateway.fetch_listen('2')
+
+        # Then the listen is only fetched the first and last times
+        assert listens_gateway.listen_requests == ['2', '2']
+
+    def test_fetches_uncached_listens_by_ids(self) -> None:
+        # Given a cached listens gateway that knows listen 2 doesn't exist
+        listens_gateway = FakeListensGateway()
+        cached_listens_gateway = make_cached_listens_gateway(
+            listens_gateway,
+            FakeClock(),
+            now_utc=datetime(2018, 11, 13, 15, 30)
+        )
+        with pytest.raises(ListenNotFoundError):
+            cached_listens_gateway.fetch_listen('2')
+
+        # When we fetch listens 1, 2 and 1 again by their ids
+        listens = cached_listens_gateway.fetch_listens_by_ids(['1', '2', '1'])
+
+        # Then only listen 1 is fetched, once
+        assert listens[0] == listens[2] == LISTEN
+        assert isinstance(listens[1], ListenNotFoundError)
+        assert listens_gateway.listen_requests == ['2', '1']
+
+
+class TestSubmitListen:
+
+    def test_clears_the_feed_cache(self) -> None:
+        # Given a cached listens gateway that has cached the feed at 1am in new york
+        listens_gateway = FakeListensGateway()
+        cached_listens_gateway = make_cached_listens_gateway(
+            listens_gateway,
+            FakeClock(),
+            now_utc=datetime(2018, 11, 13, 6, 0)
+        )
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+
+        # When a listen is submitted and we fetch the feed again
+        cached_listens_gateway.submit_listen(LISTEN_INPUT)
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+
+        # Then the feed is fetched again
+        assert listens_gateway.requests == [(None, None), (None, None)]
+
+
+class TestSubmitListens:
+
+    def test_clears_the_feed_cache_and_caches_submitted_listens(self) -> None:
+        # Given a cached listens gateway that has cached the feed at 1am in new york
+        listens_gateway = FakeListensGateway()
+        cached_listens_gateway = make_cached_listens_gateway(
+            listens_gateway,
+            FakeClock(),
+            now_utc=datetime(2018, 11, 13, 6, 0)
+        )
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+
+        # When listens are submitted, and we fetch the feed and a submitted listen
+        listens = cached_listens_gateway.submit_listens([LISTEN_INPUT, LISTEN_INPUT])
+        cached_listens_gateway.fetch_listens(limit=10, sort_order=SortOrder.DESCENDING)
+        listen = cached_listens_gateway.fetch_listen(LISTEN.id)
+
+        # Then the feed is fetched again, but the submitted listen is served from cache
+        assert listens == [LISTEN, LISTEN]
+        assert listens_gateway.requests == [(None, None), (None, None)]
+        assert listen == LISTEN
+        assert listens_gateway.listen_requests == []
@@ -1,35 +1,63 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar, Union
 
 import requests
 
 from front.definitions import Listen, ListenInput, MusicProvider, SortOrder
-from front.definitions.exceptions import ListensError
+from front.definitions.exceptions import ListenNotFoundError, ListensError
 from front.gateways.listens import ListensGatewayABC
+from front.gateways.listens.abc import as_listens_error, distinct_ids
+from front.gateways.transport import HttpTransport, default_transport
+
+
+T = TypeVar('T')
+
+_thread_pools: Dict[int, ThreadPoolExecutor] = {}
+_thread_pools_lock = threading.Lock()
 
 
 class ListensServiceGateway(ListensGatewayABC):
     endpoint = 'https://micro.morningcd.com/listens'
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, transport: HttpTransport = default_transport) -> None:
         self.api_key = api_key
+        self.transport = transport
 
     def fetch_listen(self, listen_id: str) -> Listen:
-        r = requests.get(f'{self.endpoint}/{listen_id}', headers={'x-api-key': self.api_key})
+        r = self.transport.get(f'{self.endpoint}/{listen_id}', headers={'x-api-key': self.api_key})
 
         if not r.status_code == requests.codes.ok:
             message = r.json().get('message', '')
+            if r.status_code == requests.codes.not_found:
+                raise ListenNotFoundError(message)
             raise ListensError(message)
 
         return _pluck_listen(r.json())
 
+    def fetch_listens_by_ids(self,
+                             listen_ids: Sequence[str]) -> List[Union[Listen, ListensError]]:
+        """The listens service has no bulk endpoint, so distinct ids are fetched concurrently, as
+        many at a time as the transport has sessions for the listens service.
+        """
+        unique_ids = distinct_ids(listen_ids)
+        listens = _map_concurrently(
+            self.fetch_listen,
+            unique_ids,
+            self.transport.pool_size_per_host
+        )
+
+        listen_by_id = dict(zip(unique_ids, listens))
+        return [listen_by_id[listen_id] for listen_id in listen_ids]
+
     def fetch_listens(self,
                       limit: int,
                       sort_order: SortOrder,
                       before_utc: Optional[datetime] = None,
                       after_utc: Optional[datetime] = None) -> List[Listen]:
         params = _build_fetch_listens_params(limit, sort_order, before_utc, after_utc)
-        r = requests.get(self.endpoint, params=params, headers={'x-api-key': self.api_key})
+        r = self.transport.get(self.endpoint, params=params, headers={'x-api-key': self.api_key})
 
         if not r.status_code == requests.codes.ok:
             message = r.json().get('message', '')
@@ -39,7 +67,7 @@ class ListensServiceGateway(ListensGatewayABC):
 
     def submit_listen(self, listen_input: ListenInput) -> Listen:
         body = _build_submit_listen_body(listen_input)
-        r = requests.post(self.endpoint, json=body, headers={'x-api-key': self.api_key})
+        r = self.transport.post(self.endpoint, json=body, headers={'x-api-key': self.api_key})
 
         if not r.status_code == requests.codes.ok:
             message = r.json().get('message', '')
@@ -47,6 +75,46 @@ class ListensServiceGateway(ListensGatewayABC):
 
         return _pluck_listen(r.json())
 
+    def submit_listens(self,
+                       listen_inputs: Sequence[ListenInput]) -> List[Union[Listen, ListensError]]:
+        """Listens are submitted concurrently like `fetch_listens_by_ids`, so the service may
+        timestamp them in a different order than `listen_inputs`.
+        """
+        return _map_concurrently(
+            self.submit_listen,
+            listen_inputs,
+            self.transport.pool_size_per_host
+        )
+
+
+def _map_concurrently(fn: Callable[[T], Listen],
+                      items: Sequence[T],
+                      max_workers: int) -> List[Union[Listen, ListensError]]:
+    """Call `fn` with each of `items` on a shared pool of `max_workers` threads, returning each
+    listen or the error raised getting it as a `ListensError`, in order.
+    """
+    def listen_or_error(item: T) -> Union[Listen, ListensError]:
+        try:
+            return fn(item)
+        except Exception as e:
+            return as_listens_error(e)
+
+    if len(items) <= 1:
+        return [listen_or_error(item) for item in items]
+
+    return list(_thread_pool(max_workers).map(listen_or_error, items))
+
+
+def _thread_pool(size: int) -> ThreadPoolExecutor:
+    """Thread pools are shared by every listens service gateway in the process, so a warm lambda
+    container reuses its threads across invocations rather than starting new ones for each batch.
+    """
+    with _thread_pools_lock:
+        if size not in _thread_pools:
+            _thread_pools[size] = ThreadPoolExecutor(size, thread_name_prefix='listens')
+
+        return _thread_pools[size]
+
 
 def _build_submit_listen_body(listen_input: ListenInput) -> Dict:
     return {
@@ -1,5 +1,9 @@
+import asyncio
 import os
+import threading
+import time
 from datetime import datetime
+from typing import Set
 
 from faaspact_maker import (
     Interaction,
@@ -13,7 +17,8 @@ from faaspact_maker import (
 import pytest
 
 from front.definitions import Listen, ListenInput, MusicProvider, SortOrder, exceptions
-from front.gateways.listens import ListensServiceGateway
+from front.gateways.listens import AsyncListensServiceGateway, ListensServiceGateway
+from front.gateways.transport import HttpTransport
 
 
 PACT_DIRECTORY = os.environ.get('PACT_DIRECTORY', 'pacts')
@@ -97,10 +102,72 @@ class TestFetchListen:
 
         # When we request a listen from the listens service
         with pact.start_mocking():
-            with pytest.raises(exceptions.ListensError):
+            with pytest.raises(exceptions.ListenNotFoundError):
                 listens_service_gateway.fetch_listen('1')
 
 
+class TestFetchListensByIds:
+
+    def test_fetches_each_distinct_listen_or_its_error(self) -> None:
+        # Given a listens service gateway
+        listens_service_gateway = ListensServiceGateway(api_key='xyz')
+
+        # And this pact with the listens service
+        listen_fields = {
+            'id': '1',
+            'song_id': '58yFroDNbzHpYzvicaC0de',
+            'song_provider': 'SPOTIFY',
+            'listener_name': 'Andre 3',
+            'listen_time_utc': '2018-12-07T21:35:46',
+            'iana_timezone': 'America/New_York',
+            'note': 'I like this song!'
+        }
+        pact = PactMaker(
+            'front', 'listens', 'https://micro.morningcd.com',
+            pact_directory=PACT_DIRECTORY
+        )
+        pact.add_interaction(Interaction(
+            description='a request for a listen',
+            provider_states=(ProviderState(
+                name='a listen exists with the fields',
+                params={'fields': listen_fields}),
+            ),
+            request=RequestWithMatchers(
+                method='GET',
+                path='/listens/1',
+            ),
+            response=ResponseWithMatchers(
+                status=200,
+                body=listen_fields
+            )
+        ))
+        pact.add_interaction(Interaction(
+            description='a request for a listen that does not exist',
+            provider_states=(ProviderState(
+                name='a listen exists with the fields',
+                params={'fields': listen_fields}),
+            ),
+            request=RequestWithMatchers(
+                method='GET',
+                path='/listens/2'
+            ),
+            response=ResponseWithMatchers(
+                status=404,
+                body={'message': matchers.Like('No listen exists with id 2')}
+            )
+        ))
+
+        # When we request listens 1, 2 and 1 again from the listens service
+        with pact.start_mocking():
+            listens = listens_service_gateway.fetch_listens_by_ids(['1', '2', '1'])
+
+        # Then we get listen 1 twice, and an error for listen 2
+        first_listen, missing_listen, second_listen = listens
+        assert isinstance(first_listen, Listen) and first_listen.id == '1'
+        assert isinstance(missing_listen, exceptions.ListenNotFoundError)
+        assert second_listen == first_listen
+
+
 class TestFetchListens:
 
     def test_fetches_listen_in_range(self) -> None:
@@ -355,3 +422,100 @@ class TestSubmitListen:
                     note='I like this song!',
                     iana_timezone='America/New_York'
                 ))
+
+
+LISTEN_INPUTS = [
+    ListenInput(
+        song_id='abcde',
+        song_provider=MusicProvider.SPOTIFY,
+        listener_name=listener_name,
+        note='I like this song!',
+        iana_timezone='America/New_York'
+    )
+    for listener_name in ['Zach', 'Broken', 'Sam']
+]
+
+
+def listen_of(listen_input: ListenInput) -> Listen:
+    if listen_input.listener_name == 'Broken':
+        raise KeyError('iana_timezone')
+
+    return Listen(
+        id=listen_input.listener_name,
+        listen_time_utc=datetime(2018, 11, 14, 16, 0, 0),
+        song_id=listen_input.song_id,
+        song_provider=listen_input.song_provider,
+        listener_name=listen_input.listener_name,
+        note=listen_input.note,
+        iana_timezone=listen_input.iana_timezone
+    )
+
+
+class UnreliableListensServiceGateway(ListensServiceGateway):
+
+    def submit_listen(self, listen_input: ListenInput) -> Listen:
+        return listen_of(listen_input)
+
+
+class AsyncUnreliableListensServiceGateway(AsyncListensServiceGateway):
+
+    async def submit_listen(self, listen_input: ListenInput) -> Listen:
+        return listen_of(listen_input)
+
+
+class ThreadRecordingListensServiceGateway(ListensServiceGateway):
+
+    def __init__(self, api_key: str) -> None:
+        super().__init__(api_key, HttpTransport(pool_size_per_host=3))
+        self.threads: Set[threading.Thread] = set()
+
+    def submit_listen(self, listen_input: ListenInput) -> Listen:
+        self.threads.add(threading.current_thread())
+        time.sleep(0.01)
+        return listen_of(listen_input)
+
+
+class TestSubmitListens:
+
+    def test_reuses_its_threads_across_calls(self) -> None:
+        # Given a listens service gateway whose transport allows three concurrent requests
+        listens_service_gateway = ThreadRecordingListensServiceGateway(api_key='xyz')
+
+        # When we submit six listens, twice
+        listen_inputs = [LISTEN_INPUTS[0]._replace(listener_name=str(i)) for i in range(6)]
+        for _ in range(2):
+            listens = listens_service_gateway.submit_listens(listen_inputs)
+            assert [listen.id for listen in listens if isinstance(listen, Listen)] == [
+                str(i) for i in range(6)
+            ]
+
+        # Then every listen is submitted on the same three threads
+        assert len(listens_service_gateway.threads) == 3
+
+    def test_an_unexpected_error_only_fails_its_own_listen(self) -> None:
+        # Given a listens service gateway that fails unexpectedly submitting one listen
+        listens_service_gateway = UnreliableListensServiceGateway(api_key='xyz')
+
+        # When we submit three listens
+        listens = listens_service_gateway.submit_listens(LISTEN_INPUTS)
+
+        # Then the failed listen is a listens error, and the others are submitted
+        first_listen, failed_listen, third_listen = listens
+        assert isinstance(first_listen, Listen) and first_listen.id == 'Zach'
+        assert isinstance(failed_listen, exceptions.ListensError)
+        assert isinstance(third_listen, Listen) and third_listen.id == 'Sam'
+
+    def test_an_unexpected_async_error_only_fails_its_own_listen(self) -> None:
+        # Given an async listens service gateway that fails unexpectedly submitting one listen
+        listens_service_gateway = AsyncUnreliableListensServiceGateway(api_key='xyz')
+
+        # When we submit three listens
+        listens = asyncio.get_event_loop().run_until_complete(
+            listens_service_gateway.submit_listens(LISTEN_INPUTS)
+        )
+
+        # Then the failed listen is a listens error, and the others are submitted
+        first_listen, failed_listen, third_listen = listens
+        assert isinstance(first_listen, Listen) and first_listen.id == 'Zach'
+        assert isinstance(failed_listen, exceptions.ListensError)
+        assert isinstance(third_listen, Listen) and third_listen.id == 'Sam'
@@ -0,0 +1,187 @@
+"""Clients page through listens with overlapping `before` and `after` cursors, so caching pages by
+their exact bounds rarely hits. `TimelineListensGateway` instead answers each page from the
+segments of a `ListensTimeline` it has already fetched, and only asks the listens service for the
+gaps between them.
+
+The listens service treats `before_utc` and `after_utc` as exclusive bounds, and timestamps
+listens to the microsecond, so a page `(after_utc, before_utc)` covers the inclusive segment
+`[after_utc + 1µs, before_utc - 1µs]`.
+"""
+from datetime import datetime
+from typing import Callable, Generator, List, NamedTuple, Optional, Sequence, Union
+
+from front.cache import ListensTimeline
+from front.cache.listens_timeline import ONE_MICROSECOND
+from front.definitions import Listen, ListenInput, SortOrder
+from front.definitions.exceptions import ListensError
+from front.gateways.listens import AsyncListensGatewayABC, ListensGatewayABC
+from front.gateways.listens.cached_listens_gateway import SUBMISSION_MARGIN, _naive_utc
+
+
+class FetchListensArgs(NamedTuple):
+    limit: int
+    sort_order: SortOrder
+    before_utc: Optional[datetime]
+    after_utc: Optional[datetime]
+
+
+# a plan yields the pages it needs from the listens service, is sent each page, and returns the
+# listens it was asked for.
+FetchListensPlan = Generator[FetchListensArgs, List[Listen], List[Listen]]
+
+
+class TimelineListensGateway(ListensGatewayABC):
+    """Serves pages of listens from `timeline`, fetching only the gaps in it from another listens
+    gateway. Listens from the last `SUBMISSION_MARGIN` are never added to the timeline, as listens
+    still being submitted may yet show up among them.
+    """
+
+    def __init__(self,
+                 listens_gateway: ListensGatewayABC,
+                 timeline: ListensTimeline,
+                 clock: Callable[[], datetime] = datetime.utcnow) -> None:
+        self.listens_gateway = listens_gateway
+        self.timeline = timeline
+        self._clock = clock
+
+    def fetch_listen(self, listen_id: str) -> Listen:
+        return self.listens_gateway.fetch_listen(listen_id)
+
+    def fetch_listens_by_ids(self,
+                             listen_ids: Sequence[str]) -> List[Union[Listen, ListensError]]:
+        return self.listens_gateway.fetch_listens_by_ids(listen_ids)
+
+    def fetch_listens(self,
+                      limit: int,
+                      sort_order: SortOrder,
+                      before_utc: Optional[datetime] = None,
+                      after_utc: Optional[datetime] = None) -> List[Listen]:
+        plan = plan_fetch_listens(
+            self.timeline,
+            FetchListensArgs(limit, sort_order, before_utc, after_utc),
+            self._clock()
+        )
+        try:
+            args = next(plan)
+            while True:
+                args = plan.send(self.listens_gateway.fetch_listens(**args._asdict()))
+        except StopIteration as done:
+            listens: List[Listen] = done.value
+            return listens
+
+    def submit_listen(self, listen_input: ListenInput) -> Listen:
+        return self.listens_gateway.submit_listen(listen_input)
+
+    def submit_listens(self,
+                       listen_inputs: Sequence[ListenInput]) -> List[Union[Listen, ListensError]]:
+        return self.listens_gateway.submit_listens(listen_inputs)
+
+
+class AsyncTimelineListensGateway(AsyncListensGatewayABC):
+    """The async counterpart of `TimelineListensGateway`. Both can share a single timeline."""
+
+    def __init__(self,
+                 listens_gateway: AsyncListensGatewayABC,
+                 timeline: ListensTimeline,
+                 clock: Callable[[], datetime] = datetime.utcnow) -> None:
+        self.listens_gateway = listens_gateway
+        self.timeline = timeline
+        self._clock = clock
+
+    async def fetch_listen(self, listen_id: str) -> Listen:
+        return await self.listens_gateway.fetch_listen(listen_id)
+
+    async def fetch_listens_by_ids(self,
+                                   listen_ids: Sequence[str]) -> List[Union[Listen, ListensError]]:
+        return await self.listens_gateway.fetch_listens_by_ids(listen_ids)
+
+    async def fetch_listens(self,
+                            limit: int,
+                            sort_order: SortOrder,
+                            before_utc: Optional[datetime] = None,
+                            after_utc: Optional[datetime] = None) -> List[Listen]:
+        plan = plan_fetch_listens(
+            self.timeline,
+            FetchListensArgs(limit, sort_order, before_utc, after_utc),
+            self._clock()
+        )
+        try:
+            args = next(plan)
+            while True:
+                args = plan.send(await self.listens_gateway.fetch_listens(**args._asdict()))
+        except StopIteration as done:
+            listens: List[Listen] = done.value
+            return listens
+
+    async def submit_listen(self, listen_input: ListenInput) -> Listen:
+        return await self.listens_gateway.submit_listen(listen_input)
+
+    async def submit_listens(self,
+                             listen_inputs: Sequence[ListenInput]
+                             ) -> List[Union[Listen, ListensError]]:
+        return await self.listens_gateway.submit_listens(listen_inputs)
+
+
+def plan_fetch_listens(timeline: ListensTimeline,
+                       args: FetchListensArgs,
+                       now_utc: datetime) -> FetchListensPlan:
+    """Walk from one end of the requested page towards the other in `args.sort_order`, taking
+    listens from the timeline's segments and fetching the gaps between them, until the page is
+    full or there's nothing left to walk. Each fetched gap is added to the timeline.
+    """
+    ascending = args.sort_order == SortOrder.ASCENDING
+    after_utc, before_utc = _naive_utc(args.after_utc), _naive_utc(args.before_utc)
+    first = after_utc + ONE_MICROSECOND if after_utc else datetime.min
+    last = before_utc - ONE_MICROSECOND if before_utc else datetime.max
+    settled = now_utc - SUBMISSION_MARGIN
+
+    listens: List[Listen] = []
+    cursor: Optional[datetime] = first if ascending else last
+
+    while cursor is not None and first <= cursor <= last and len(listens) < args.limit:
+        remaining = args.limit - len(listens)
+        bound = last if ascending else first
+
+        covered = timeline.covered_listens(cursor, bound, ascending, remaining)
+        if covered is not None:
+            covered_listens, edge = covered
+            listens += covered_listens
+            cursor = _step(edge, ascending)
+            continue
+
+        gap_edge = timeline.gap_edge(cursor, ascending)
+        if ascending:
+            gap_start, gap_end = cursor, min(gap_edge or last, last)
+        else:
+            gap_start, gap_end = max(gap_edge or first, first), cursor
+
+        fetched = yield FetchListensArgs(
+            limit=remaining,
+            sort_order=args.sort_order,
+            before_utc=None if gap_end == datetime.max else gap_end + ONE_MICROSECOND,
+            after_utc=None if gap_start == datetime.min else gap_start - ONE_MICROSECOND
+        )
+        listens += fetched
+        cursor = _step(gap_end if ascending else gap_start, ascending)
+
+        if len(fetched) == remaining:
+            # the gap may hold more listens than we fetched, so we only know of every listen up
+            # to (but not including) the last one's time.
+            if ascending:
+                gap_end = fetched[-1].listen_time_utc - ONE_MICROSECOND
+            else:
+                gap_start = fetched[-1].listen_time_utc + ONE_MICROSECOND
+
+        gap_end = min(gap_end, settled)
+        if gap_start <= gap_end:
+            timeline.add(gap_start, gap_end, fetched)
+
+    return listens[:args.limit]
+
+
+def _step(edge: datetime, ascending: bool) -> Optional[datetime]:
+    """The moment just beyond `edge` in the direction we're walking, if there is one."""
+    if ascending:
+        return edge + ONE_MICROSECOND if edge < datetime.max else None
+
+    return edge - ONE_MICROSECOND if edge > datetime.min else None
@@ -0,0 +1,120 @@
+import random
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from front.cache import ListensTimeline
+from front.definitions import Listen, ListenInput, MusicProvider, SortOrder
+from front.gateways.listens import ListensGatewayABC, TimelineListensGateway
+
+
+NOW_UTC = datetime(2018, 11, 13, 15, 30)
+
+
+def make_listen(listen_time_utc: datetime) -> Listen:
+    return Listen(
+        id=listen_time_utc.isoformat(),
+        song_id='58yFroDNbzHpYzvicaC0de',
+        song_provider=MusicProvider.SPOTIFY,
+        listener_name='Andre 3',
+        listen_time_utc=listen_time_utc,
+        iana_timezone='America/New_York'
+    )
+
+
+class FakeListensGateway(ListensGatewayABC):
+    """A listens service with an hourly listen, which treats its bounds as exclusive."""
+
+    def __init__(self) -> None:
+        self.listens = [make_listen(NOW_UTC - timedelta(hours=hours)) for hours in range(100)]
+        self.requests: List[Tuple[int, Optional[datetime], Optional[datetime]]] = []
+
+    def fetch_listen(self, listen_id: str) -> Listen:
+        raise NotImplementedError
+
+    def fetch_listens(self,
+                      limit: int,
+                      sort_order: SortOrder,
+                      before_utc: Optional[datetime] = None,
+                      after_utc: Optional[datetime] = None) -> List[Listen]:
+        self.requests.append((limit, before_utc, after_utc))
+        listens = sorted(
+            (listen for listen in self.listens
+             if (before_utc is None or listen.listen_time_utc < before_utc)
+             and (after_utc is None or listen.listen_time_utc > after_utc)),
+            key=lambda listen: listen.listen_time_utc,
+            reverse=sort_order == SortOrder.DESCENDING
+        )
+        return listens[:limit]
+
+    def submit_listen(self, listen_input: ListenInput) -> Listen:
+        raise NotImplementedError
+
+
+class TestFetchListens:
+
+    def test_only_fetches_the_gaps_between_fetched_segments(self) -> None:
+        # Given a timeline listens gateway that has fetched two days ago's listens
+        listens_gateway = FakeListensGateway()
+        timeline_listens_gateway = TimelineListensGateway(
+            listens_gateway,
+            ListensTimeline(max_listens=100),
+            clock=lambda: NOW_UTC
+        )
+        two_days_ago = NOW_UTC - timedelta(days=2)
+        timeline_listens_gateway.fetch_listens(
+            limit=100,
+            sort_order=SortOrder.ASCENDING,
+            after_utc=two_days_ago - timedelta(days=1),
+            before_utc=two_days_ago
+        )
+
+        # When we fetch a page of listens that overlaps it
+        listens = timeline_listens_gateway.fetch_listens(
+            limit=30,
+            sort_order=SortOrder.DESCENDING,
+            before_utc=two_days_ago + timedelta(hours=6)
+        )
+
+        # Then only the gaps on either side of the fetched listens are fetched
+        assert listens_gateway.requests[1:] == [
+            (30, two_days_ago + timedelta(hours=6), two_days_ago - timedelta(microseconds=1)),
+            (1, two_days_ago - timedelta(days=1) + timedelta(microseconds=1), None)
+        ]
+        assert listens == listens_gateway.fetch_listens(
+            limit=30,
+            sort_order=SortOrder.DESCENDING,
+            before_utc=two_days_ago + timedelta(hours=6)
+        )
+
+    def test_matches_the_listens_service(self) -> None:
+        # Given a timeline listens gateway with a small timeline
+        listens_gateway = FakeListensGateway()
+        timeline_listens_gateway = TimelineListensGateway(
+            listens_gateway,
+            ListensTimeline(max_listens=40),
+            clock=lambda: NOW_UTC
+        )
+
+        # When we fetch many random, overlapping pages of listens
+        # Then each page is the same as the one the listens service would return
+        moments: List[Optional[datetime]] = [None]
+        moments += [NOW_UTC - timedelta(minutes=minutes) for minutes in range(0, 6000, 20)]
+        choices = random.Random(12)
+        for _ in range(300):
+            limit = choices.randint(1, 20)
+            sort_order = choices.choice([SortOrder.ASCENDING, SortOrder.DESCENDING])
+            before_utc, after_utc = choices.choice(moments), choices.choice(moments)
+
+            listens = timeline_listens_gateway.fetch_listens(
+                limit,
+                sort_order,
+                before_utc,
+                after_utc
+            )
+
+            assert listens == listens_gateway.fetch_listens(
+                limit,
+                sort_order,
+                before_utc,
+                after_utc
+            )
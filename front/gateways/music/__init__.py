@@ -1,5 +1,7 @@
 # abc
-from .abc import MusicGatewayABC
+from .abc import AsyncMusicGatewayABC, MusicGatewayABC
 
 # implementations
+from .async_spotify_gateway import AsyncSpotifyGateway
+from .cached_music_gateway import AsyncCachedMusicGateway, CachedMusicGateway
 from .spotify_gateway import SpotifyGateway
@@ -1,10 +1,37 @@
 from abc import ABC, abstractmethod
+from typing import List, Sequence, Union
 
-from front.definitions import Listen, Song
+from front.definitions import Listen, MusicProvider, Song
+from front.definitions.exceptions import MusicError
 
 
 class MusicGatewayABC(ABC):
 
     @abstractmethod
+    def fetch_song(self, song_provider: MusicProvider, song_id: str) -> Song:
+        ...
+
     def fetch_song_of_listen(self, listen: Listen) -> Song:
+        return self.fetch_song(listen.song_provider, listen.song_id)
+
+    @abstractmethod
+    def fetch_songs(self, listens: Sequence[Listen]) -> List[Union[Song, MusicError]]:
+        """Fetch the song of each listen in `listens`. Results are returned in the same order as
+        `listens`, with a `MusicError` in place of any song that couldn't be fetched.
+        """
+        ...
+
+
+class AsyncMusicGatewayABC(ABC):
+
+    @abstractmethod
+    async def fetch_song(self, song_provider: MusicProvider, song_id: str) -> Song:
+        ...
+
+    async def fetch_song_of_listen(self, listen: Listen) -> Song:
+        return await self.fetch_song(listen.song_provider, listen.song_id)
+
+    @abstractmethod
+    async def fetch_songs(self, listens: Sequence[Listen]) -> List[Union[Song, MusicError]]:
+        """See `MusicGatewayABC.fetch_songs`."""
         ...
@@ -0,0 +1,97 @@
+import asyncio
+from typing import Dict, List, Optional, Sequence, Union
+
+import requests
+
+from front.definitions import Listen, MusicProvider, Song, exceptions
+from front.gateways.async_transport import (
+    AsyncHttpTransport,
+    HttpResponse,
+    default_async_transport
+)
+from front.gateways.music import AsyncMusicGatewayABC
+from front.gateways.music.spotify_gateway import (
+    SpotifyGateway,
+    _chunk,
+    _pluck_song,
+    _pluck_songs_by_id
+)
+from front.gateways.music.spotify_token_manager import get_token_manager
+
+
+class AsyncSpotifyGateway(AsyncMusicGatewayABC):
+    """Shares its bearer token with `SpotifyGateway` through the process-wide token manager."""
+    base_url = SpotifyGateway.base_url
+    max_tracks_per_request = SpotifyGateway.max_tracks_per_request
+
+    def __init__(self,
+                 client_id: str,
+                 client_secret: str,
+                 transport: AsyncHttpTransport = default_async_transport) -> None:
+        self.token_manager = get_token_manager(client_id, client_secret)
+        self.transport = transport
+
+    async def fetch_song(self, song_provider: MusicProvider, song_id: str) -> Song:
+        r = await self._get('/tracks/' + song_id)
+
+        if not r.status_code == requests.codes.ok:
+            raise exceptions.MusicError(_pluck_error_message(r))
+
+        return _pluck_song(r.json())
+
+    async def fetch_songs(self,
+                          listens: Sequence[Listen]) -> List[Union[Song, exceptions.MusicError]]:
+        song_ids = list(dict.fromkeys(listen.song_id for listen in listens))
+
+        song_by_id: Dict[str, Union[Song, exceptions.MusicError]] = {}
+        for songs_by_id in await asyncio.gather(*(
+            self._fetch_songs_by_id(chunk)
+            for chunk in _chunk(song_ids, self.max_tracks_per_request)
+        )):
+            song_by_id.update(songs_by_id)
+
+        return [song_by_id[listen.song_id] for listen in listens]
+
+    async def _fetch_songs_by_id(
+            self,
+            song_ids: List[str]) -> Dict[str, Union[Song, exceptions.MusicError]]:
+        r = await self._get('/tracks', params={'ids': ','.join(song_ids)})
+
+        if not r.status_code == requests.codes.ok:
+            error = exceptions.MusicError(_pluck_error_message(r))
+            return {song_id: error for song_id in song_ids}
+
+        return _pluck_songs_by_id(song_ids, r.json()['tracks'])
+
+    async def _get(self, path: str, params: Optional[Dict] = None) -> HttpResponse:
+        """See `SpotifyGateway._get`. The token manager may block on a token fetch, so it's run
+        off of the event loop.
+        """
+        loop = asyncio.get_event_loop()
+
+        bearer_token = await loop.run_in_executor(None, self.token_manager.get_token)
+        r = await self._get_with_bearer_token(path, params, bearer_token)
+
+        if r.status_code == requests.codes.unauthorized:
+            self.token_manager.invalidate(bearer_token)
+            bearer_token = await loop.run_in_executor(None, self.token_manager.get_token)
+            r = await self._get_with_bearer_token(path, params, bearer_token)
+
+        return r
+
+    async def _get_with_bearer_token(self,
+                                     path: str,
+                                     params: Optional[Dict],
+                                     bearer_token: str) -> HttpResponse:
+        return await self.transport.get(
+            self.base_url + path,
+            params=params,
+            headers={'Authorization': 'Bearer ' + bearer_token}
+        )
+
+
+def _pluck_error_message(r: HttpResponse) -> str:
+    try:
+        return str(r.json()['error']['message'])
+    except (KeyError, ValueError):
+        return ''
@@ -0,0 +1,108 @@
+from typing import Dict, List, Sequence, Tuple, Union
+
+from front.cache import LruCache
+from front.definitions import Listen, MusicProvider, Song
+from front.definitions.exceptions import MusicError
+from front.gateways.music import AsyncMusicGatewayABC, MusicGatewayABC
+
+
+SongKey = Tuple[MusicProvider, str]
+SongByKey = Dict[SongKey, Union[Song, MusicError]]
+
+
+class CachedMusicGateway(MusicGatewayABC):
+    """Serves songs from `song_cache` before falling back to another music gateway. Song metadata
+    almost never changes, so a long-lived cache (i.e. one created at module level, which survives
+    warm lambda invocations) spares us most music provider requests for the listens feed.
+    """
+
+    def __init__(self, music_gateway: MusicGatewayABC, song_cache: LruCache[SongKey, Song]) -> None:
+        self.music_gateway = music_gateway
+        self.song_cache = song_cache
+
+    def fetch_song(self, song_provider: MusicProvider, song_id: str) -> Song:
+        song = self.song_cache.get((song_provider, song_id))
+
+        if song is None:
+            song = self.music_gateway.fetch_song(song_provider, song_id)
+            self.song_cache.set((song_provider, song_id), song)
+
+        return song
+
+    def fetch_songs(self, listens: Sequence[Listen]) -> List[Union[Song, MusicError]]:
+        song_by_key, uncached_listens = _get_cached_songs(self.song_cache, listens)
+
+        if uncached_listens:
+            fetched_songs = self.music_gateway.fetch_songs(uncached_listens)
+            _cache_fetched_songs(self.song_cache, song_by_key, uncached_listens, fetched_songs)
+
+        return [song_by_key[_song_key(listen)] for listen in listens]
+
+
+class AsyncCachedMusicGateway(AsyncMusicGatewayABC):
+    """The async counterpart of `CachedMusicGateway`. Both can share a single song cache."""
+
+    def __init__(self,
+                 music_gateway: AsyncMusicGatewayABC,
+                 song_cache: LruCache[SongKey, Song]) -> None:
+        self.music_gateway = music_gateway
+        self.song_cache = song_cache
+
+    async def fetch_song(self, song_provider: MusicProvider, song_id: str) -> Song:
+        song = self.song_cache.get((song_provider, song_id))
+
+        if song is None:
+            song = await self.music_gateway.fetch_song(song_provider, song_id)
+            self.song_cache.set((song_provider, song_id), song)
+
+        return song
+
+    async def fetch_songs(self, listens: Sequence[Listen]) -> List[Union[Song, MusicError]]:
+        song_by_key, uncached_listens = _get_cached_songs(self.song_cache, listens)
+
+        if uncached_listens:
+            fetched_songs = await self.music_gateway.fetch_songs(uncached_listens)
+            _cache_fetched_songs(self.song_cache, song_by_key, uncached_listens, fetched_songs)
+
+        return [song_by_key[_song_key(listen)] for listen in listens]
+
+
+def song_disk_key(key: SongKey) -> str:
+    music_provider, song_id = key
+    return f'{music_provider.name}:{song_id}'
+
+
+def _get_cached_songs(song_cache: LruCache[SongKey, Song],
+                      listens: Sequence[Listen]) -> Tuple[SongByKey, List[Listen]]:
+    """Look up the song of each listen in `song_cache`. Returns the cached songs by key, along
+    with one listen for every song that isn't cached.
+    """
+    song_by_key: SongByKey = {}
+    uncached_listens: Dict[SongKey, Listen] = {}
+
+    for listen in listens:
+        key = _song_key(listen)
+        if key in song_by_key or key in uncached_listens:
+            continue
+
+        song = song_cache.get(key)
+        if song is None:
+            uncached_listens[key] = listen
+        else:
+            song_by_key[key] = song
+
+    return song_by_key, list(uncached_listens.values())
+
+
+def _cache_fetched_songs(song_cache: LruCache[SongKey, Song],
+                         song_by_key: SongByKey,
+                         listens: List[Listen],
+                         fetched_songs: List[Union[Song, MusicError]]) -> None:
+    for listen, fetched_song in zip(listens, fetched_songs):
+        song_by_key[_song_key(listen)] = fetched_song
+        if isinstance(fetched_song, Song):
+            song_cache.set(_song_key(listen), fetched_song)
+
+
+def _song_key(listen: Listen) -> SongKey:
+    return (listen.song_provider, listen.song_id)
@@ -0,0 +1,128 @@
+import asyncio
+from typing import List, Sequence, Tuple, Union
+
+from front.cache import LruCache
+from front.definitions import Listen, MusicProvider, Song
+from front.definitions.exceptions import MusicError
+from front.gateways.listens.cached_listens_gateway_test import LISTEN
+from front.gateways.music import AsyncMusicGatewayABC, MusicGatewayABC
+from front.gateways.music.cached_music_gateway import (
+    AsyncCachedMusicGateway,
+    CachedMusicGateway,
+    SongKey
+)
+
+
+def song_of(song_id: str) -> Song:
+    return Song(
+        id=song_id,
+        music_provider=MusicProvider.SPOTIFY,
+        name=f'Song {song_id}',
+        artist_name='DAP The Contract',
+        album_name='Everybody Falls in the Summer',
+        image_url_by_size={}
+    )
+
+
+def listen_of(song_id: str) -> Listen:
+    return LISTEN._replace(song_id=song_id)
+
+
+class FakeMusicGateway(MusicGatewayABC):
+    """Fails to fetch the song of listens of song 'missing'."""
+
+    def __init__(self) -> None:
+        self.song_requests: List[Tuple[MusicProvider, str]] = []
+        self.songs_requests: List[List[str]] = []
+
+    def fetch_song(self, song_provider: MusicProvider, song_id: str) -> Song:
+        self.song_requests.append((song_provider, song_id))
+        return song_of(song_id)
+
+    def fetch_songs(self, listens: Sequence[Listen]) -> List[Union[Song, MusicError]]:
+        self.songs_requests.append([listen.song_id for listen in listens])
+        return [MusicError('No such song.') if listen.song_id == 'missing'
+                else song_of(listen.song_id)
+                for listen in listens]
+
+
+class AsyncFakeMusicGateway(AsyncMusicGatewayABC):
+
+    def __init__(self) -> None:
+        self.music_gateway = FakeMusicGateway()
+
+    async def fetch_song(self, song_provider: MusicProvider, song_id: str) -> Song:
+        return self.music_gateway.fetch_song(song_provider, song_id)
+
+    async def fetch_songs(self, listens: Sequence[Listen]) -> List[Union[Song, MusicError]]:
+        return self.music_gateway.fetch_songs(listens)
+
+
+def make_song_cache() -> LruCache[SongKey, Song]:
+    return LruCache(max_size=10)
+
+
+class TestFetchSong:
+
+    def test_only_calls_through_on_a_miss(self) -> None:
+        # Given a cached music gateway
+        music_gateway = FakeMusicGateway()
+        cached_music_gateway = CachedMusicGateway(music_gateway, make_song_cache())
+
+        # When we fetch the same song twice
+        first_song = cached_music_gateway.fetch_song(MusicProvider.SPOTIFY, 'a')
+        second_song = cached_music_gateway.fetch_song(MusicProvider.SPOTIFY, 'a')
+
+        # Then it's only fetched from the music gateway once
+        assert first_song == second_song == song_of('a')
+        assert music_gateway.song_requests == [(MusicProvider.SPOTIFY, 'a')]
+
+
+class TestFetchSongs:
+
+    def test_only_calls_through_for_uncached_songs(self) -> None:
+        # Given a cached music gateway with song 'a' cached
+        music_gateway = FakeMusicGateway()
+        cached_music_gateway = CachedMusicGateway(music_gateway, make_song_cache())
+        cached_music_gateway.fetch_song(MusicProvider.SPOTIFY, 'a')
+
+        # When we fetch the songs of listens of songs 'a', 'b' and 'b' again
+        songs = cached_music_gateway.fetch_songs([listen_of('a'), listen_of('b'), listen_of('b')])
+
+        # Then only song 'b' is fetched, once
+        assert songs == [song_of('a'), song_of('b'), song_of('b')]
+        assert music_gateway.songs_requests == [['b']]
+
+        # And once it's cached, nothing is fetched
+        assert cached_music_gateway.fetch_songs([listen_of('b')]) == [song_of('b')]
+        assert music_gateway.songs_requests == [['b']]
+
+    def test_doesnt_cache_errors(self) -> None:
+        # Given a cached music gateway
+        music_gateway = FakeMusicGateway()
+        cached_music_gateway = CachedMusicGateway(music_gateway, make_song_cache())
+
+        # When we fetch the song of a listen of a missing song twice
+        first_songs = cached_music_gateway.fetch_songs([listen_of('missing')])
+        second_songs = cached_music_gateway.fetch_songs([listen_of('missing')])
+
+        # Then we get an error both times, and it's fetched both times
+        assert isinstance(first_songs[0], MusicError)
+        assert isinstance(second_songs[0], MusicError)
+        assert music_gateway.songs_requests == [['missing'], ['missing']]
+
+    def test_shares_its_cache_with_the_async_gateway(self) -> None:
+        # Given a sync and an async cached music gateway sharing a song cache
+        song_cache = make_song_cache()
+        CachedMusicGateway(FakeMusicGateway(), song_cache).fetch_song(MusicProvider.SPOTIFY, 'a')
+        async_music_gateway = AsyncFakeMusicGateway()
+        async_cached_music_gateway = AsyncCachedMusicGateway(async_music_gateway, song_cache)
+
+        # When the async gateway fetches the songs of listens of songs 'a' and 'b'
+        songs = asyncio.get_event_loop().run_until_complete(
+            async_cached_music_gateway.fetch_songs([listen_of('a'), listen_of('b')])
+        )
+
+        # Then it only calls through for song 'b'
+        assert songs == [song_of('a'), song_of('b')]
+        assert async_music_gateway.music_gateway.songs_requests == [['b']]
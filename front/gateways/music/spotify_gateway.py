@@ -1,49 +1,82 @@
-from typing import Dict, cast
+from typing import Dict, List, Optional, Sequence, Union, cast
 
 import requests
 
 from front.definitions import Listen, MusicProvider, Song, exceptions
 from front.gateways.music import MusicGatewayABC
+from front.gateways.music.spotify_token_manager import fetch_client_credentials, get_token_manager
+from front.gateways.transport import HttpTransport, default_transport
 
 
 class SpotifyGateway(MusicGatewayABC):
     base_url = 'https://api.spotify.com/v1'
-    auth_url = 'https://accounts.spotify.com/api/token'
 
-    def __init__(self, client_id: str, client_secret: str) -> None:
-        self.bearer_token = SpotifyGateway.fetch_bearer_token(client_id, client_secret)
+    # spotify's 'get several tracks' endpoint accepts at most 50 ids per request.
+    max_tracks_per_request = 50
 
-    def fetch_song_of_listen(self, listen: Listen) -> Song:
-        r = requests.get(
-            self.base_url + '/tracks/' + listen.song_id,
-            headers={'Authorization': 'Bearer ' + self.bearer_token}
-        )
+    def __init__(self,
+                 client_id: str,
+                 client_secret: str,
+                 transport: HttpTransport = default_transport) -> None:
+        self.token_manager = get_token_manager(client_id, client_secret, transport)
+        self.transport = transport
 
-        if not r.status_code == requests.codes.ok:
-            try:
-                message = r.json()['error']['message']
-            except (KeyError, ValueError):
-                message = ''
+    def fetch_song(self, song_provider: MusicProvider, song_id: str) -> Song:
+        r = self._get('/tracks/' + song_id)
 
-            raise exceptions.MusicError(message)
+        if not r.status_code == requests.codes.ok:
+            raise exceptions.MusicError(_pluck_error_message(r))
 
         else:
             return _pluck_song(r.json())
 
-    @staticmethod
-    def fetch_bearer_token(client_id: str, client_secret: str) -> str:
-        r = requests.post(
-            SpotifyGateway.auth_url,
-            auth=(client_id, client_secret),
-            data={'grant_type': 'client_credentials'}
-        )
+    def fetch_songs(self, listens: Sequence[Listen]) -> List[Union[Song, exceptions.MusicError]]:
+        song_ids = list(dict.fromkeys(listen.song_id for listen in listens))
+
+        song_by_id: Dict[str, Union[Song, exceptions.MusicError]] = {}
+        for chunk in _chunk(song_ids, self.max_tracks_per_request):
+            song_by_id.update(self._fetch_songs_by_id(chunk))
 
-        if not r.status_code == requests.codes.all_good:
-            raise exceptions.MusicError(
-                f'Unexpected error code from spotify. "{r.status_code}: {r.text}"'
-            )
+        return [song_by_id[listen.song_id] for listen in listens]
 
-        return cast(str, r.json()['access_token'])
+    def _fetch_songs_by_id(self,
+                           song_ids: List[str]) -> Dict[str, Union[Song, exceptions.MusicError]]:
+        r = self._get('/tracks', params={'ids': ','.join(song_ids)})
+
+        if not r.status_code == requests.codes.ok:
+            error = exceptions.MusicError(_pluck_error_message(r))
+            return {song_id: error for song_id in song_ids}
+
+        return _pluck_songs_by_id(song_ids, r.json()['tracks'])
+
+    def _get(self, path: str, params: Optional[Dict] = None) -> requests.Response:
+        """Make an authorized GET request to the spotify api. If spotify rejects our bearer token
+        (i.e. it was revoked before it expired) we retry once with a new token.
+        """
+        bearer_token = self.token_manager.get_token()
+        r = self._get_with_bearer_token(path, params, bearer_token)
+
+        if r.status_code == requests.codes.unauthorized:
+            self.token_manager.invalidate(bearer_token)
+            r = self._get_with_bearer_token(path, params, self.token_manager.get_token())
+
+        return r
+
+    def _get_with_bearer_token(self,
+                               path: str,
+                               params: Optional[Dict],
+                               bearer_token: str) -> requests.Response:
+        return self.transport.get(
+            self.base_url + path,
+            params=params,
+            headers={'Authorization': 'Bearer ' + bearer_token}
+        )
+
+    @staticmethod
+    def fetch_bearer_token(client_id: str,
+                           client_secret: str,
+                           transport: HttpTransport = default_transport) -> str:
+        return fetch_client_credentials(client_id, client_secret, transport).access_token
 
 
 def _pluck_song(raw_song: Dict) -> Song:
@@ -59,3 +92,37 @@ def _pluck_song(raw_song: Dict) -> Song:
         },
         music_provider=MusicProvider.SPOTIFY
     )
+
+
+def _pluck_songs_by_id(
+        song_ids: List[str],
+        raw_songs: List[Optional[Dict]]) -> Dict[str, Union[Song, exceptions.MusicError]]:
+    """Spotify returns tracks in the order they were requested, with `null` for any id that doesn't
+    match a track.
+    """
+    return {
+        song_id: (
+            _pluck_song(raw_song) if raw_song
+            else exceptions.MusicError(f'No spotify track exists with id {song_id}')
+        )
+        for song_id, raw_song in zip(song_ids, raw_songs)
+    }
+
+
+def _pluck_error_message(r: requests.Response) -> str:
+    try:
+        return cast(str, r.json()['error']['message'])
+    except (KeyError, ValueError):
+        return ''
+
+
+def _chunk(items: List[str], size: int) -> List[List[str]]:
+    """Split `items` into lists of at most `size` items.
+
+    >>> _chunk(['a', 'b', 'c', 'd', 'e'], 2)
+    [['a', 'b'], ['c', 'd'], ['e']]
+
+    >>> _chunk([], 2)
+    []
+    """
+    return [items[i:i + size] for i in range(0, len(items), size)]
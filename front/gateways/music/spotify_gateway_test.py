@@ -0,0 +1,145 @@
+import json
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+import responses
+
+from front.definitions import Listen, MusicProvider, Song, exceptions
+from front.gateways.music import SpotifyGateway, spotify_token_manager
+
+
+class TestFetchSongs:
+
+    def test_fetches_songs_in_chunks_of_fifty(self) -> None:
+        # Given 120 listens of 60 distinct songs
+        listens = [make_listen(f'song{i % 60}') for i in range(120)]
+
+        # And spotify has a track for every song
+        with responses.RequestsMock() as mock_responses:
+            mock_responses.add(make_post_client_credentials())
+            mock_responses.add_callback(
+                'GET', 'https://api.spotify.com/v1/tracks', callback=tracks_callback({})
+            )
+
+            # When we fetch the songs of the listens
+            songs = make_spotify_gateway().fetch_songs(listens)
+
+            requested_ids = [
+                parse_qs(urlparse(str(call.request.url)).query)['ids'][0].split(',')
+                for call in list(mock_responses.calls)[1:]
+            ]
+
+        # Then each distinct song is requested once, in chunks of at most 50
+        assert [len(ids) for ids in requested_ids] == [50, 10]
+
+        # And we get the song of each listen in order
+        assert [song.id for song in songs if isinstance(song, Song)] == [
+            listen.song_id for listen in listens
+        ]
+
+    def test_returns_error_for_missing_track(self) -> None:
+        # Given listens of an existing song and a missing song
+        listens = [make_listen('exists'), make_listen('missing'), make_listen('exists')]
+
+        # And spotify has no track for the missing song
+        with responses.RequestsMock() as mock_responses:
+            mock_responses.add(make_post_client_credentials())
+            mock_responses.add_callback(
+                'GET',
+                'https://api.spotify.com/v1/tracks',
+                callback=tracks_callback({'missing': None})
+            )
+
+            # When we fetch the songs of the listens
+            songs = make_spotify_gateway().fetch_songs(listens)
+
+        # Then the missing song comes back as an error in its position
+        assert isinstance(songs[0], Song)
+        assert isinstance(songs[1], exceptions.MusicError)
+        assert isinstance(songs[2], Song)
+
+
+class TestBearerToken:
+
+    def test_retries_once_with_a_new_token_if_spotify_rejects_the_token(self) -> None:
+        # Given a spotify gateway
+        spotify_gateway = make_spotify_gateway()
+
+        # And spotify revoked the token we have
+        with responses.RequestsMock() as mock_responses:
+            mock_responses.add(make_post_client_credentials('RevokedToken'))
+            mock_responses.add(make_post_client_credentials('NewToken'))
+            mock_responses.add(
+                'GET',
+                'https://api.spotify.com/v1/tracks',
+                json={'error': {'status': 401, 'message': 'The access token expired'}},
+                status=401
+            )
+            mock_responses.add_callback(
+                'GET', 'https://api.spotify.com/v1/tracks', callback=tracks_callback({})
+            )
+
+            # When we fetch a song
+            songs = spotify_gateway.fetch_songs([make_listen('song')])
+
+            authorization_headers = [
+                call.request.headers['Authorization'] for call in list(mock_responses.calls)
+                if call.request.method == 'GET'
+            ]
+
+        # Then we retry the request with a new token
+        assert authorization_headers == ['Bearer RevokedToken', 'Bearer NewToken']
+        assert isinstance(songs[0], Song)
+
+
+def make_spotify_gateway() -> SpotifyGateway:
+    # use a fresh token manager so that tests don't share bearer tokens
+    with mock.patch.dict(spotify_token_manager._token_managers, clear=True):
+        return SpotifyGateway(client_id='client id', client_secret='client secret')
+
+
+def make_listen(song_id: str) -> Listen:
+    return Listen(
+        id='1',
+        song_id=song_id,
+        song_provider=MusicProvider.SPOTIFY,
+        listener_name='Zach',
+        listen_time_utc=datetime(2018, 11, 12, 15, 30),
+        iana_timezone='America/New_York'
+    )
+
+
+def make_post_client_credentials(access_token: str = 'MockToken') -> responses.Response:
+    return responses.Response(
+        method='POST',
+        url='https://accounts.spotify.com/api/token',
+        json={'access_token': access_token, 'token_type': 'bearer', 'expires_in': 3600}
+    )
+
+
+TracksCallback = Callable[[requests.PreparedRequest], Tuple[int, Dict, str]]
+
+
+def tracks_callback(overrides: Dict) -> TracksCallback:
+    def callback(request: requests.PreparedRequest) -> Tuple[int, Dict, str]:
+        ids: List[str] = parse_qs(urlparse(str(request.url)).query)['ids'][0].split(',')
+        tracks = [overrides.get(song_id, make_raw_track(song_id)) for song_id in ids]
+        return (200, {}, json.dumps({'tracks': tracks}))
+
+    return callback
+
+
+def make_raw_track(song_id: str) -> Dict:
+    return {
+        'id': song_id,
+        'name': 'Whispers',
+        'artists': [{'name': 'DAP The Contract'}],
+        'album': {
+            'name': 'Everybody Falls in the Summer',
+            'images': [{'url': 'large'}, {'url': 'medium'}, {'url': 'small'}]
+        }
+    }
@@ -0,0 +1,119 @@
+"""Spotify client-credentials bearer tokens are valid for an hour and aren't tied to a user, so a
+single token can be shared by every `SpotifyGateway` in the process. Token managers live at module
+level, which means a warm lambda container (or the flask playground) reuses its token across
+invocations instead of fetching a new one per graphql request.
+"""
+import functools
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+import requests
+
+from front.definitions import exceptions
+from front.gateways.transport import HttpTransport, default_transport
+
+
+class BearerToken(NamedTuple):
+    access_token: str
+    expires_in: float
+
+
+class SpotifyTokenManager:
+    """Lazily fetches a bearer token on first use and keeps it fresh. Once a token is within
+    `refresh_margin` seconds of expiring, callers keep getting the current token while a new one is
+    fetched in the background. Only an expired (or invalidated) token blocks a caller on a fetch.
+    """
+    refresh_margin = 300.0
+
+    def __init__(self,
+                 fetch_token: Callable[[], BearerToken],
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self._fetch_token = fetch_token
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._access_token: Optional[str] = None
+        self._expires_at = 0.0
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def get_token(self) -> str:
+        with self._lock:
+            now = self._clock()
+
+            if self._access_token is None or now >= self._expires_at:
+                self._store(self._fetch_token(), fetched_at=now)
+
+            elif now >= self._expires_at - self.refresh_margin and not self._refreshing:
+                self._refresh_thread = threading.Thread(target=self._refresh, daemon=True)
+                self._refresh_thread.start()
+
+            assert self._access_token is not None
+            return self._access_token
+
+    def invalidate(self, access_token: str) -> None:
+        """Discard `access_token` (i.e. after spotify rejects it with a 401) so that the next call
+        to `get_token` fetches a new one. Does nothing if the token has already been replaced.
+        """
+        with self._lock:
+            if self._access_token == access_token:
+                self._access_token = None
+
+    @property
+    def _refreshing(self) -> bool:
+        return self._refresh_thread is not None and self._refresh_thread.is_alive()
+
+    def _refresh(self) -> None:
+        fetched_at = self._clock()
+        try:
+            bearer_token = self._fetch_token()
+        except (exceptions.MusicError, requests.RequestException):
+            # the current token is still valid. we'll try again on the next call to `get_token`.
+            return
+
+        with self._lock:
+            self._store(bearer_token, fetched_at)
+
+    def _store(self, bearer_token: BearerToken, fetched_at: float) -> None:
+        self._access_token = bearer_token.access_token
+        self._expires_at = fetched_at + bearer_token.expires_in
+
+
+auth_url = 'https://accounts.spotify.com/api/token'
+
+_token_managers: Dict[Tuple[str, str], SpotifyTokenManager] = {}
+_token_managers_lock = threading.Lock()
+
+
+def get_token_manager(client_id: str,
+                      client_secret: str,
+                      transport: HttpTransport = default_transport) -> SpotifyTokenManager:
+    """Get the process-wide token manager for a set of spotify client credentials."""
+    with _token_managers_lock:
+        key = (client_id, client_secret)
+        if key not in _token_managers:
+            _token_managers[key] = SpotifyTokenManager(
+                functools.partial(fetch_client_credentials, client_id, client_secret, transport)
+            )
+
+        return _token_managers[key]
+
+
+def fetch_client_credentials(client_id: str,
+                             client_secret: str,
+                             transport: HttpTransport = default_transport) -> BearerToken:
+    r = transport.post(
+        auth_url,
+        auth=(client_id, client_secret),
+        data={'grant_type': 'client_credentials'}
+    )
+
+    if not r.status_code == requests.codes.all_good:
+        raise exceptions.MusicError(
+            f'Unexpected error code from spotify. "{r.status_code}: {r.text}"'
+        )
+
+    raw_token = r.json()
+    return BearerToken(
+        access_token=raw_token['access_token'],
+        expires_in=float(raw_token['expires_in'])
+    )
@@ -0,0 +1,91 @@
+import threading
+from typing import List
+
+from front.gateways.music.spotify_token_manager import BearerToken, SpotifyTokenManager
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSpotify:
+
+    def __init__(self) -> None:
+        self.issued_tokens: List[str] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def fetch_token(self) -> BearerToken:
+        self.release.wait()
+        self.issued_tokens.append(f'token{len(self.issued_tokens)}')
+        return BearerToken(access_token=self.issued_tokens[-1], expires_in=3600)
+
+
+class TestGetToken:
+
+    def test_fetches_token_lazily_and_reuses_it(self) -> None:
+        # Given a token manager
+        spotify, clock = FakeSpotify(), FakeClock()
+        token_manager = SpotifyTokenManager(spotify.fetch_token, clock)
+
+        # Then no token is fetched until one is needed
+        assert spotify.issued_tokens == []
+
+        # When we get a token twice
+        first_token = token_manager.get_token()
+        clock.now = 60
+        second_token = token_manager.get_token()
+
+        # Then a single token is fetched and reused
+        assert first_token == second_token == 'token0'
+        assert spotify.issued_tokens == ['token0']
+
+    def test_refreshes_token_in_the_background_before_it_expires(self) -> None:
+        # Given a token manager with a token that's about to expire
+        spotify, clock = FakeSpotify(), FakeClock()
+        token_manager = SpotifyTokenManager(spotify.fetch_token, clock)
+        token_manager.get_token()
+        clock.now = 3600 - 60
+
+        # When we get a token while spotify is slow to issue a new one
+        spotify.release.clear()
+        token = token_manager.get_token()
+
+        # Then we get the current token without waiting
+        assert token == 'token0'
+
+        # And once the background refresh finishes we get the new token
+        spotify.release.set()
+        assert token_manager._refresh_thread is not None
+        token_manager._refresh_thread.join()
+        assert token_manager.get_token() == 'token1'
+
+    def test_fetches_new_token_once_expired(self) -> None:
+        # Given a token manager with an expired token
+        spotify, clock = FakeSpotify(), FakeClock()
+        token_manager = SpotifyTokenManager(spotify.fetch_token, clock)
+        token_manager.get_token()
+        clock.now = 3600
+
+        # When we get a token
+        token = token_manager.get_token()
+
+        # Then we get a new token
+        assert token == 'token1'
+
+    def test_fetches_new_token_after_invalidation(self) -> None:
+        # Given a token manager with a token
+        spotify, clock = FakeSpotify(), FakeClock()
+        token_manager = SpotifyTokenManager(spotify.fetch_token, clock)
+        token = token_manager.get_token()
+
+        # When the token is invalidated
+        token_manager.invalidate(token)
+
+        # Then we get a new token
+        assert token_manager.get_token() == 'token1'
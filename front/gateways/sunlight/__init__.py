@@ -1,5 +1,9 @@
 # abc
-from .abc import SunlightGatewayABC
+from .abc import AsyncSunlightGatewayABC, SunlightGatewayABC
 
 # implementations
+from .async_sunlight_service_gateway import AsyncSunlightServiceGateway
+from .cached_sunlight_gateway import AsyncCachedSunlightGateway, CachedSunlightGateway
+from .local_sunlight_gateway import AsyncLocalSunlightGateway, LocalSunlightGateway
 from .sunlight_service_gateway import SunlightServiceGateway
+from .table_sunlight_gateway import AsyncTableSunlightGateway, TableSunlightGateway
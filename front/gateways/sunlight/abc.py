@@ -1,5 +1,7 @@
+import asyncio
 from abc import ABC, abstractmethod
-from datetime import date
+from datetime import date, timedelta
+from typing import Iterator, List, Optional
 
 from front.definitions import SunlightWindow
 
@@ -9,3 +11,48 @@ class SunlightGatewayABC(ABC):
     @abstractmethod
     def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
         ...
+
+    def fetch_sunlight_windows(self,
+                               iana_timezone: str,
+                               from_date: date,
+                               to_date: date) -> List[SunlightWindow]:
+        """Fetch the sunlight windows of every date from `from_date` to `to_date`, inclusive.
+        Gateways that can fetch a range at once should override this, as by default each date is
+        fetched on its own.
+        """
+        return [self.fetch_sunlight_window(iana_timezone, on_date)
+                for on_date in date_range(from_date, to_date)]
+
+    def peek_sunlight_window(self, iana_timezone: str, on_date: date) -> Optional[SunlightWindow]:
+        """The sunlight window of `on_date` in `iana_timezone` if it's known without a network
+        call, otherwise None.
+        """
+        return None
+
+
+class AsyncSunlightGatewayABC(ABC):
+
+    @abstractmethod
+    async def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        ...
+
+    async def fetch_sunlight_windows(self,
+                                     iana_timezone: str,
+                                     from_date: date,
+                                     to_date: date) -> List[SunlightWindow]:
+        return list(await asyncio.gather(*(
+            self.fetch_sunlight_window(iana_timezone, on_date)
+            for on_date in date_range(from_date, to_date)
+        )))
+
+    def peek_sunlight_window(self, iana_timezone: str, on_date: date) -> Optional[SunlightWindow]:
+        return None
+
+
+def date_range(from_date: date, to_date: date) -> Iterator[date]:
+    """
+    >>> list(date_range(date(2018, 12, 31), date(2019, 1, 1)))
+    [datetime.date(2018, 12, 31), datetime.date(2019, 1, 1)]
+    """
+    for days in range((to_date - from_date).days + 1):
+        yield from_date + timedelta(days=days)
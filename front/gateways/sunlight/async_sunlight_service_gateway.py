@@ -0,0 +1,40 @@
+from datetime import date
+
+import requests
+
+from front.definitions import SunlightWindow, exceptions
+from front.gateways.async_transport import AsyncHttpTransport, default_async_transport
+from front.gateways.sunlight import AsyncSunlightGatewayABC
+from front.gateways.sunlight.sunlight_service_gateway import (
+    SunlightServiceGateway,
+    _pluck_sunlight_window
+)
+
+
+class AsyncSunlightServiceGateway(AsyncSunlightGatewayABC):
+    endpoint = SunlightServiceGateway.endpoint
+
+    def __init__(self,
+                 api_key: str,
+                 transport: AsyncHttpTransport = default_async_transport) -> None:
+        self.api_key = api_key
+        self.transport = transport
+
+    async def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        r = await self.transport.get(
+            self.endpoint,
+            params={
+                'iana_timezone': iana_timezone,
+                'on_date': on_date.isoformat()
+            },
+            headers={'x-api-key': self.api_key}
+        )
+
+        if not r.status_code == requests.codes.ok:
+            try:
+                message = r.json()['message']
+            except (KeyError, ValueError):
+                message = ''
+            raise exceptions.SunlightError(message)
+
+        return _pluck_sunlight_window(r.json())
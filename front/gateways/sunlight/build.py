@@ -0,0 +1,31 @@
+"""Build the sunlight table that `TableSunlightGateway` serves from.
+
+    python -m front.gateways.sunlight.build [--output PATH] [--from-date YYYY-MM-DD] [--days N]
+
+By default the table covers every zone with a bundled coordinate for two years from yesterday's
+utc date, and is written to `default_sunlight_table_path` so that it's packaged with `front/**`.
+"""
+import argparse
+from datetime import date, datetime, timedelta
+from typing import Optional, Sequence
+
+from front.gateways.sunlight.sunlight_table import build_sunlight_table, default_sunlight_table_path
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Build the precomputed sunlight table.')
+    parser.add_argument('--output', default=default_sunlight_table_path)
+    parser.add_argument(
+        '--from-date',
+        type=date.fromisoformat,
+        # the local date is a day behind the utc date in some timezones
+        default=datetime.utcnow().date() - timedelta(days=1)
+    )
+    parser.add_argument('--days', type=int, default=2 * 366)
+    args = parser.parse_args(argv)
+
+    build_sunlight_table(args.output, args.from_date, args.days)
+
+
+if __name__ == '__main__':
+    main()
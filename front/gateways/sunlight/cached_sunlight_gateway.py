@@ -0,0 +1,199 @@
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple, cast
+
+from front.cache import LruCache
+from front.definitions import SunlightWindow
+from front.gateways.sunlight import AsyncSunlightGatewayABC, SunlightGatewayABC
+from front.gateways.sunlight.abc import date_range
+from front.gateways.sunlight.timezones import canonical_timezone
+
+
+SunlightWindowKey = Tuple[str, date]
+
+
+class CachedSunlightGateway(SunlightGatewayABC):
+    """Serves sunlight windows from `sunlight_window_cache` before falling back to another sunlight
+    gateway. Timezones are canonicalized first, so `US/Eastern` and `America/New_York` share an
+    entry.
+
+    A sunlight window is a pure function of its timezone and date, so windows of past and present
+    dates never go stale. Windows of future dates expire after `future_ttl` seconds, as a change to
+    a timezone's rules (i.e. a country dropping daylight saving time) can move them.
+    """
+    future_ttl = 24 * 60 * 60.0
+
+    def __init__(self,
+                 sunlight_gateway: SunlightGatewayABC,
+                 sunlight_window_cache: LruCache[SunlightWindowKey, SunlightWindow],
+                 clock: Callable[[], datetime] = datetime.utcnow) -> None:
+        self.sunlight_gateway = sunlight_gateway
+        self.sunlight_window_cache = sunlight_window_cache
+        self._clock = clock
+
+    def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        iana_timezone = canonical_timezone(iana_timezone)
+        key = (iana_timezone, on_date)
+        sunlight_window = self.sunlight_window_cache.get(key)
+
+        if sunlight_window is None:
+            sunlight_window = self.sunlight_gateway.fetch_sunlight_window(iana_timezone, on_date)
+            self.sunlight_window_cache.set(
+                key,
+                sunlight_window,
+                _ttl(on_date, self._clock(), self.future_ttl)
+            )
+
+        return sunlight_window
+
+    def fetch_sunlight_windows(self,
+                               iana_timezone: str,
+                               from_date: date,
+                               to_date: date) -> List[SunlightWindow]:
+        """Dates that aren't cached are fetched with a single range fetch, from the first to the
+        last missing date.
+        """
+        iana_timezone = canonical_timezone(iana_timezone)
+        cached = _cached_sunlight_windows(
+            self.sunlight_window_cache,
+            iana_timezone,
+            from_date,
+            to_date
+        )
+        missing_dates = [on_date for on_date, sunlight_window in cached.items()
+                         if sunlight_window is None]
+
+        if missing_dates:
+            fetched = self.sunlight_gateway.fetch_sunlight_windows(
+                iana_timezone,
+                missing_dates[0],
+                missing_dates[-1]
+            )
+            cached.update(_cache_sunlight_windows(
+                self.sunlight_window_cache,
+                iana_timezone,
+                missing_dates[0],
+                fetched,
+                now_utc=self._clock(),
+                future_ttl=self.future_ttl
+            ))
+
+        return cast(List[SunlightWindow], list(cached.values()))
+
+    def peek_sunlight_window(self, iana_timezone: str, on_date: date) -> Optional[SunlightWindow]:
+        iana_timezone = canonical_timezone(iana_timezone)
+        return (self.sunlight_window_cache.peek((iana_timezone, on_date))
+                or self.sunlight_gateway.peek_sunlight_window(iana_timezone, on_date))
+
+
+class AsyncCachedSunlightGateway(AsyncSunlightGatewayABC):
+    """The async counterpart of `CachedSunlightGateway`. Both can share a single cache."""
+    future_ttl = CachedSunlightGateway.future_ttl
+
+    def __init__(self,
+                 sunlight_gateway: AsyncSunlightGatewayABC,
+                 sunlight_window_cache: LruCache[SunlightWindowKey, SunlightWindow],
+                 clock: Callable[[], datetime] = datetime.utcnow) -> None:
+        self.sunlight_gateway = sunlight_gateway
+        self.sunlight_window_cache = sunlight_window_cache
+        self._clock = clock
+
+    async def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        iana_timezone = canonical_timezone(iana_timezone)
+        key = (iana_timezone, on_date)
+        sunlight_window = self.sunlight_window_cache.get(key)
+
+        if sunlight_window is None:
+            sunlight_window = await self.sunlight_gateway.fetch_sunlight_window(
+                iana_timezone,
+                on_date
+            )
+            self.sunlight_window_cache.set(
+                key,
+                sunlight_window,
+                _ttl(on_date, self._clock(), self.future_ttl)
+            )
+
+        return sunlight_window
+
+    async def fetch_sunlight_windows(self,
+                                     iana_timezone: str,
+                                     from_date: date,
+                                     to_date: date) -> List[SunlightWindow]:
+        iana_timezone = canonical_timezone(iana_timezone)
+        cached = _cached_sunlight_windows(
+            self.sunlight_window_cache,
+            iana_timezone,
+            from_date,
+            to_date
+        )
+        missing_dates = [on_date for on_date, sunlight_window in cached.items()
+                         if sunlight_window is None]
+
+        if missing_dates:
+            fetched = await self.sunlight_gateway.fetch_sunlight_windows(
+                iana_timezone,
+                missing_dates[0],
+                missing_dates[-1]
+            )
+            cached.update(_cache_sunlight_windows(
+                self.sunlight_window_cache,
+                iana_timezone,
+                missing_dates[0],
+                fetched,
+                now_utc=self._clock(),
+                future_ttl=self.future_ttl
+            ))
+
+        return cast(List[SunlightWindow], list(cached.values()))
+
+    def peek_sunlight_window(self, iana_timezone: str, on_date: date) -> Optional[SunlightWindow]:
+        iana_timezone = canonical_timezone(iana_timezone)
+        return (self.sunlight_window_cache.peek((iana_timezone, on_date))
+                or self.sunlight_gateway.peek_sunlight_window(iana_timezone, on_date))
+
+
+def sunlight_window_disk_key(key: SunlightWindowKey) -> str:
+    iana_timezone, on_date = key
+    return f'{iana_timezone}:{on_date.isoformat()}'
+
+
+def _cached_sunlight_windows(sunlight_window_cache: LruCache[SunlightWindowKey, SunlightWindow],
+                             iana_timezone: str,
+                             from_date: date,
+                             to_date: date) -> Dict[date, Optional[SunlightWindow]]:
+    return {on_date: sunlight_window_cache.get((iana_timezone, on_date))
+            for on_date in date_range(from_date, to_date)}
+
+
+def _cache_sunlight_windows(sunlight_window_cache: LruCache[SunlightWindowKey, SunlightWindow],
+                            iana_timezone: str,
+                            from_date: date,
+                            sunlight_windows: List[SunlightWindow],
+                            now_utc: datetime,
+                            future_ttl: float) -> Dict[date, Optional[SunlightWindow]]:
+    sunlight_windows_by_date: Dict[date, Optional[SunlightWindow]] = {}
+
+    for days, sunlight_window in enumerate(sunlight_windows):
+        on_date = from_date + timedelta(days=days)
+        sunlight_window_cache.set(
+            (iana_timezone, on_date),
+            sunlight_window,
+            _ttl(on_date, now_utc, future_ttl)
+        )
+        sunlight_windows_by_date[on_date] = sunlight_window
+
+    return sunlight_windows_by_date
+
+
+def _ttl(on_date: date, now_utc: datetime, future_ttl: float) -> Optional[float]:
+    """Today's date is a day ahead of utc's in some timezones, so dates up to a day after utc's
+    date are still 'present'.
+
+    >>> _ttl(date(2018, 11, 13), datetime(2018, 11, 12, 23, 0), future_ttl=60)
+    >>> _ttl(date(2018, 11, 14), datetime(2018, 11, 12, 23, 0), future_ttl=60)
+    60
+    """
+    if on_date > now_utc.date() + timedelta(days=1):
+        return future_ttl
+
+    return None
@@ -0,0 +1,159 @@
+from datetime import date, datetime
+from typing import List, Tuple
+
+from front.cache import CacheStats, LruCache
+from front.definitions import SunlightWindow
+from front.gateways.sunlight import CachedSunlightGateway, SunlightGatewayABC
+from front.gateways.sunlight.cached_sunlight_gateway import SunlightWindowKey
+
+
+SUNLIGHT_WINDOW = SunlightWindow(
+    sunrise_utc=datetime(2018, 11, 12, 11, 40, 4),
+    sunset_utc=datetime(2018, 11, 12, 21, 40, 26)
+)
+
+
+class FakeSunlightGateway(SunlightGatewayABC):
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[str, date]] = []
+        self.range_requests: List[Tuple[str, date, date]] = []
+
+    def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        self.requests.append((iana_timezone, on_date))
+        return SUNLIGHT_WINDOW
+
+    def fetch_sunlight_windows(self,
+                               iana_timezone: str,
+                               from_date: date,
+                               to_date: date) -> List[SunlightWindow]:
+        self.range_requests.append((iana_timezone, from_date, to_date))
+        return [SUNLIGHT_WINDOW] * ((to_date - from_date).days + 1)
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFetchSunlightWindow:
+
+    def test_timezone_aliases_share_a_cache_entry(self) -> None:
+        # Given a cached sunlight gateway
+        sunlight_gateway = FakeSunlightGateway()
+        cache: LruCache = LruCache(max_size=10)
+        cached_sunlight_gateway = CachedSunlightGateway(
+            sunlight_gateway,
+            cache,
+            clock=lambda: datetime(2018, 11, 12, 15, 30)
+        )
+
+        # When we fetch a sunlight window for a timezone and then for an alias of that timezone
+        today = date(2018, 11, 12)
+        first = cached_sunlight_gateway.fetch_sunlight_window('America/New_York', today)
+        second = cached_sunlight_gateway.fetch_sunlight_window('US/Eastern', today)
+
+        # Then the sunlight window is only fetched once
+        assert first == second == SUNLIGHT_WINDOW
+        assert sunlight_gateway.requests == [('America/New_York', today)]
+        assert cache.stats.hit_rate == 0.5
+
+    def test_future_sunlight_windows_expire(self) -> None:
+        # Given a cached sunlight gateway that has cached today's and next week's sunlight windows
+        today, next_week = date(2018, 11, 12), date(2018, 11, 19)
+        cache_clock = FakeClock()
+        sunlight_gateway = FakeSunlightGateway()
+        cached_sunlight_gateway = CachedSunlightGateway(
+            sunlight_gateway,
+            LruCache(max_size=10, clock=cache_clock),
+            clock=lambda: datetime(2018, 11, 12, 15, 30)
+        )
+        cached_sunlight_gateway.fetch_sunlight_window('America/New_York', today)
+        cached_sunlight_gateway.fetch_sunlight_window('America/New_York', next_week)
+
+        # When we fetch both sunlight windows again after the future ttl has passed
+        cache_clock.now = CachedSunlightGateway.future_ttl + 1
+        cached_sunlight_gateway.fetch_sunlight_window('America/New_York', today)
+        cached_sunlight_gateway.fetch_sunlight_window('America/New_York', next_week)
+
+        # Then only next week's sunlight window is fetched again
+        assert sunlight_gateway.requests == [
+            ('America/New_York', today),
+            ('America/New_York', next_week),
+            ('America/New_York', next_week)
+        ]
+
+
+class TestFetchSunlightWindows:
+
+    def test_only_fetches_the_dates_that_arent_cached(self) -> None:
+        # Given a cached sunlight gateway that has cached the sunlight windows of the 12th and 14th
+        sunlight_gateway = FakeSunlightGateway()
+        cached_sunlight_gateway = CachedSunlightGateway(
+            sunlight_gateway,
+            LruCache(max_size=10),
+            clock=lambda: datetime(2018, 11, 20, 15, 30)
+        )
+        cached_sunlight_gateway.fetch_sunlight_window('America/New_York', date(2018, 11, 12))
+        cached_sunlight_gateway.fetch_sunlight_window('America/New_York', date(2018, 11, 14))
+
+        # When we fetch the sunlight windows from the 12th to the 16th
+        sunlight_windows = cached_sunlight_gateway.fetch_sunlight_windows(
+            'US/Eastern',
+            date(2018, 11, 12),
+            date(2018, 11, 16)
+        )
+
+        # Then the dates from the first to the last missing date are fetched with one range fetch
+        assert sunlight_windows == [SUNLIGHT_WINDOW] * 5
+        assert sunlight_gateway.range_requests == [
+            ('America/New_York', date(2018, 11, 13), date(2018, 11, 16))
+        ]
+
+        # And then the whole range is cached
+        cached_sunlight_gateway.fetch_sunlight_windows(
+            'America/New_York',
+            date(2018, 11, 12),
+            date(2018, 11, 16)
+        )
+        assert len(sunlight_gateway.range_requests) == 1
+
+
+class TestPeekSunlightWindow:
+
+    def test_only_peeks_at_cached_sunlight_windows(self) -> None:
+        # Given a cached sunlight gateway that has cached today's sunlight window
+        today, tomorrow = date(2018, 11, 12), date(2018, 11, 13)
+        sunlight_gateway = FakeSunlightGateway()
+        cached_sunlight_gateway = CachedSunlightGateway(sunlight_gateway, LruCache(max_size=10))
+        cached_sunlight_gateway.fetch_sunlight_window('America/New_York', today)
+
+        # When we peek at today's and tomorrow's sunlight windows
+        peeked_today = cached_sunlight_gateway.peek_sunlight_window('US/Eastern', today)
+        peeked_tomorrow = cached_sunlight_gateway.peek_sunlight_window('US/Eastern', tomorrow)
+
+        # Then we only get today's sunlight window, and no sunlight window is fetched
+        assert peeked_today == SUNLIGHT_WINDOW
+        assert peeked_tomorrow is None
+        assert sunlight_gateway.requests == [('America/New_York', today)]
+
+    def test_doesnt_count_peeks_as_cache_lookups(self) -> None:
+        # Given a cached sunlight gateway that has cached today's sunlight window
+        today, tomorrow = date(2018, 11, 12), date(2018, 11, 13)
+        sunlight_window_cache: LruCache[SunlightWindowKey, SunlightWindow] = LruCache(max_size=10)
+        cached_sunlight_gateway = CachedSunlightGateway(
+            FakeSunlightGateway(),
+            sunlight_window_cache
+        )
+        cached_sunlight_gateway.fetch_sunlight_window('America/New_York', today)
+
+        # When we peek at today's and tomorrow's sunlight windows
+        cached_sunlight_gateway.peek_sunlight_window('America/New_York', today)
+        cached_sunlight_gateway.peek_sunlight_window('America/New_York', tomorrow)
+
+        # Then only the fetch is counted, as a miss
+        assert sunlight_window_cache.stats == CacheStats(hits=0, misses=1, evictions=0, size=1)
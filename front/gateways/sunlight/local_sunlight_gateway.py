@@ -0,0 +1,209 @@
+"""Sunrise and sunset are a function of a location and a date, so rather than asking the sunlight
+service we can compute them in-process with NOAA's solar position algorithm
+(https://gml.noaa.gov/grad/solcalc/calcdetails.html), at a representative coordinate of the
+timezone.
+"""
+import math
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from front.definitions import SunlightWindow, exceptions
+from front.gateways.sunlight import AsyncSunlightGatewayABC, SunlightGatewayABC
+from front.gateways.sunlight.abc import date_range
+from front.gateways.sunlight.timezones import canonical_timezone
+from front.gateways.sunlight.zone_coordinates import ZoneCoordinate, zone_coordinates
+
+
+class LocalSunlightGateway(SunlightGatewayABC):
+    """Computes sunlight windows locally. Timezones without a bundled coordinate (i.e. `Etc/UTC`)
+    and dates on which the sun doesn't rise or set (polar days and nights) are handed to
+    `fallback_gateway`, or raise a `SunlightError` if there isn't one.
+    """
+
+    def __init__(self, fallback_gateway: Optional[SunlightGatewayABC] = None) -> None:
+        self.fallback_gateway = fallback_gateway
+
+    def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        sunlight_window = compute_sunlight_window(iana_timezone, on_date)
+        if sunlight_window is not None:
+            return sunlight_window
+
+        if self.fallback_gateway is None:
+            raise _cannot_compute_error(iana_timezone, on_date)
+
+        return self.fallback_gateway.fetch_sunlight_window(iana_timezone, on_date)
+
+    def peek_sunlight_window(self, iana_timezone: str, on_date: date) -> Optional[SunlightWindow]:
+        return compute_sunlight_window(iana_timezone, on_date)
+
+    def fetch_sunlight_windows(self,
+                               iana_timezone: str,
+                               from_date: date,
+                               to_date: date) -> List[SunlightWindow]:
+        sunlight_windows = compute_sunlight_windows(iana_timezone, from_date, to_date)
+        return [
+            sunlight_window or self.fetch_sunlight_window(iana_timezone, on_date)
+            for on_date, sunlight_window in zip(date_range(from_date, to_date), sunlight_windows)
+        ]
+
+
+class AsyncLocalSunlightGateway(AsyncSunlightGatewayABC):
+    """The async counterpart of `LocalSunlightGateway`."""
+
+    def __init__(self, fallback_gateway: Optional[AsyncSunlightGatewayABC] = None) -> None:
+        self.fallback_gateway = fallback_gateway
+
+    async def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        sunlight_window = compute_sunlight_window(iana_timezone, on_date)
+        if sunlight_window is not None:
+            return sunlight_window
+
+        if self.fallback_gateway is None:
+            raise _cannot_compute_error(iana_timezone, on_date)
+
+        return await self.fallback_gateway.fetch_sunlight_window(iana_timezone, on_date)
+
+    def peek_sunlight_window(self, iana_timezone: str, on_date: date) -> Optional[SunlightWindow]:
+        return compute_sunlight_window(iana_timezone, on_date)
+
+    async def fetch_sunlight_windows(self,
+                                     iana_timezone: str,
+                                     from_date: date,
+                                     to_date: date) -> List[SunlightWindow]:
+        sunlight_windows = compute_sunlight_windows(iana_timezone, from_date, to_date)
+        return [
+            sunlight_window or await self.fetch_sunlight_window(iana_timezone, on_date)
+            for on_date, sunlight_window in zip(date_range(from_date, to_date), sunlight_windows)
+        ]
+
+
+def compute_sunlight_window(iana_timezone: str, on_date: date) -> Optional[SunlightWindow]:
+    """Compute the utc sunrise and sunset of `on_date` in `iana_timezone`, or None if we can't.
+
+    >>> compute_sunlight_window('America/New_York', date(2018, 11, 12))
+    SunlightWindow(sunrise_utc=datetime.datetime(2018, 11, 12, 11, 39, 17), \
+sunset_utc=datetime.datetime(2018, 11, 12, 21, 40, 35))
+    """
+    return compute_sunlight_windows(iana_timezone, on_date, on_date)[0]
+
+
+def compute_sunlight_windows(iana_timezone: str,
+                             from_date: date,
+                             to_date: date) -> List[Optional[SunlightWindow]]:
+    """Compute the sunlight windows of every date from `from_date` to `to_date`, inclusive, with
+    None for each date we can't compute. The timezone is only looked up once for the whole range.
+
+    >>> len(compute_sunlight_windows('America/New_York', date(2018, 1, 1), date(2018, 12, 31)))
+    365
+    >>> compute_sunlight_windows('Etc/UTC', date(2018, 1, 1), date(2018, 1, 2))
+    [None, None]
+    """
+    zone_coordinate = zone_coordinates.get(canonical_timezone(iana_timezone))
+    if zone_coordinate is None:
+        return [None for _ in date_range(from_date, to_date)]
+
+    return [_compute_sunlight_window(zone_coordinate, on_date)
+            for on_date in date_range(from_date, to_date)]
+
+
+def _compute_sunlight_window(zone_coordinate: ZoneCoordinate,
+                             on_date: date) -> Optional[SunlightWindow]:
+    solar_date = _solar_date(on_date, zone_coordinate)
+    latitude, longitude, _ = zone_coordinate
+
+    sunrise_minutes = _sunrise_or_sunset_minutes(True, solar_date, latitude, longitude)
+    sunset_minutes = _sunrise_or_sunset_minutes(False, solar_date, latitude, longitude)
+    if sunrise_minutes is None or sunset_minutes is None:
+        return None
+
+    midnight_utc = datetime.combine(solar_date, datetime.min.time())
+    return SunlightWindow(
+        sunrise_utc=midnight_utc + timedelta(seconds=round(sunrise_minutes * 60)),
+        sunset_utc=midnight_utc + timedelta(seconds=round(sunset_minutes * 60))
+    )
+
+
+def _solar_date(on_date: date, zone_coordinate: ZoneCoordinate) -> date:
+    """The utc date whose solar noon (at the zone's longitude) falls on `on_date` in the zone. This
+    is `on_date` itself unless a zone's clocks are far from its longitude's solar time, i.e. in
+    `Pacific/Kiritimati` (utc+14 at 157°W) local noon is around 22:00 utc of the day before.
+
+    >>> _solar_date(date(2018, 11, 12), (1.8667, -157.3333, 14.0))
+    datetime.date(2018, 11, 11)
+    """
+    _, longitude, utc_offset = zone_coordinate
+    solar_noon_minutes = 720 - 4 * longitude
+    local_noon_minutes = 720 - 60 * utc_offset
+    return on_date + timedelta(days=round((local_noon_minutes - solar_noon_minutes) / 1440))
+
+
+def _sunrise_or_sunset_minutes(sunrise: bool,
+                               on_date: date,
+                               latitude: float,
+                               longitude: float) -> Optional[float]:
+    """Minutes after midnight utc of `on_date` (possibly negative, or more than a day) at which the
+    sun rises or sets, refined with a second pass at the time of the first estimate.
+    """
+    julian_day = on_date.toordinal() + 1721424.5
+    estimate = _sunrise_or_sunset_utc(sunrise, julian_day, latitude, longitude)
+    if estimate is None:
+        return None
+
+    return _sunrise_or_sunset_utc(sunrise, julian_day + estimate / 1440, latitude, longitude)
+
+
+def _sunrise_or_sunset_utc(sunrise: bool,
+                           julian_day: float,
+                           latitude: float,
+                           longitude: float) -> Optional[float]:
+    t = (julian_day - 2451545.0) / 36525.0
+
+    mean_longitude = (280.46646 + t * (36000.76983 + t * 0.0003032)) % 360
+    mean_anomaly = math.radians(357.52911 + t * (35999.05029 - 0.0001537 * t))
+    eccentricity = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+
+    equation_of_center = (
+        math.sin(mean_anomaly) * (1.914602 - t * (0.004817 + 0.000014 * t))
+        + math.sin(2 * mean_anomaly) * (0.019993 - 0.000101 * t)
+        + math.sin(3 * mean_anomaly) * 0.000289
+    )
+    omega = math.radians(125.04 - 1934.136 * t)
+    apparent_longitude = math.radians(
+        mean_longitude + equation_of_center - 0.00569 - 0.00478 * math.sin(omega)
+    )
+
+    mean_obliquity = 23 + (26 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60) / 60
+    obliquity = math.radians(mean_obliquity + 0.00256 * math.cos(omega))
+    declination = math.asin(math.sin(obliquity) * math.sin(apparent_longitude))
+
+    y = math.tan(obliquity / 2) ** 2
+    l0 = math.radians(mean_longitude)
+    equation_of_time = 4 * math.degrees(
+        y * math.sin(2 * l0)
+        - 2 * eccentricity * math.sin(mean_anomaly)
+        + 4 * eccentricity * y * math.sin(mean_anomaly) * math.cos(2 * l0)
+        - 0.5 * y * y * math.sin(4 * l0)
+        - 1.25 * eccentricity * eccentricity * math.sin(2 * mean_anomaly)
+    )
+
+    # the sun's center is 0.833° below the horizon at sunrise and sunset, due to refraction and
+    # the radius of the sun's disc.
+    latitude_radians = math.radians(latitude)
+    cos_hour_angle = (
+        math.cos(math.radians(90.833)) / (math.cos(latitude_radians) * math.cos(declination))
+        - math.tan(latitude_radians) * math.tan(declination)
+    )
+    if not -1 <= cos_hour_angle <= 1:
+        return None  # the sun doesn't rise or set on this day
+
+    hour_angle = math.degrees(math.acos(cos_hour_angle))
+    if not sunrise:
+        hour_angle = -hour_angle
+
+    return 720 - 4 * (longitude + hour_angle) - equation_of_time
+
+
+def _cannot_compute_error(iana_timezone: str, on_date: date) -> exceptions.SunlightError:
+    return exceptions.SunlightError(
+        f'Cannot compute the sunlight window of {iana_timezone} on {on_date.isoformat()}'
+    )
@@ -0,0 +1,124 @@
+from datetime import date, datetime, timedelta
+from typing import List, Tuple
+
+import pytest
+
+from front.definitions import SunlightWindow, exceptions
+from front.gateways.sunlight import LocalSunlightGateway, SunlightGatewayABC
+
+
+# the sunlight windows computed locally may differ slightly from the sunlight service's, as we
+# don't know the exact coordinate the service uses for each timezone.
+TOLERANCE = timedelta(minutes=1)
+
+
+class FakeSunlightGateway(SunlightGatewayABC):
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[str, date]] = []
+
+    def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        self.requests.append((iana_timezone, on_date))
+        return SunlightWindow(
+            sunrise_utc=datetime.combine(on_date, datetime.min.time()),
+            sunset_utc=datetime.combine(on_date, datetime.min.time())
+        )
+
+
+class TestFetchSunlightWindow:
+
+    def test_matches_sunlight_service(self) -> None:
+        # Given a local sunlight gateway
+        sunlight_gateway = LocalSunlightGateway()
+
+        # When we fetch the sunlight window of new york on november 12th 2018
+        sunlight_window = sunlight_gateway.fetch_sunlight_window(
+            'America/New_York',
+            date(2018, 11, 12)
+        )
+
+        # Then we get the sunlight service's sunlight window for that day, give or take a minute
+        assert abs(sunlight_window.sunrise_utc - datetime(2018, 11, 12, 11, 40, 4)) < TOLERANCE
+        assert abs(sunlight_window.sunset_utc - datetime(2018, 11, 12, 21, 40, 26)) < TOLERANCE
+
+    def test_sunlight_window_is_of_the_local_date(self) -> None:
+        # Given a local sunlight gateway
+        sunlight_gateway = LocalSunlightGateway()
+
+        # When we fetch the sunlight window of tokyo (utc+9) on november 12th 2018
+        sunlight_window = sunlight_gateway.fetch_sunlight_window('Asia/Tokyo', date(2018, 11, 12))
+
+        # Then the sun rises at 6:13am and sets at 4:36pm in tokyo
+        assert abs(sunlight_window.sunrise_utc - datetime(2018, 11, 11, 21, 13)) < TOLERANCE
+        assert abs(sunlight_window.sunset_utc - datetime(2018, 11, 12, 7, 36)) < TOLERANCE
+
+    def test_falls_back_for_timezones_without_a_location(self) -> None:
+        # Given a local sunlight gateway with a fallback gateway
+        fallback_gateway = FakeSunlightGateway()
+        sunlight_gateway = LocalSunlightGateway(fallback_gateway)
+
+        # When we fetch the sunlight window of a timezone that isn't tied to a location
+        sunlight_gateway.fetch_sunlight_window('Etc/UTC', date(2018, 11, 12))
+
+        # Then it's fetched from the fallback gateway
+        assert fallback_gateway.requests == [('Etc/UTC', date(2018, 11, 12))]
+
+    def test_falls_back_during_polar_nights(self) -> None:
+        # Given a local sunlight gateway with a fallback gateway
+        fallback_gateway = FakeSunlightGateway()
+        sunlight_gateway = LocalSunlightGateway(fallback_gateway)
+
+        # When we fetch the sunlight window of svalbard on the winter solstice
+        sunlight_gateway.fetch_sunlight_window('Arctic/Longyearbyen', date(2018, 12, 21))
+
+        # Then it's fetched from the fallback gateway, as the sun doesn't rise
+        assert fallback_gateway.requests == [('Arctic/Longyearbyen', date(2018, 12, 21))]
+
+    def test_raises_sunlight_error_without_fallback(self) -> None:
+        # Given a local sunlight gateway without a fallback gateway
+        sunlight_gateway = LocalSunlightGateway()
+
+        # When we fetch a sunlight window that can't be computed locally
+        # Then a sunlight error is raised
+        with pytest.raises(exceptions.SunlightError):
+            sunlight_gateway.fetch_sunlight_window('Etc/UTC', date(2018, 11, 12))
+
+
+class TestFetchSunlightWindows:
+
+    def test_matches_fetching_each_date(self) -> None:
+        # Given a local sunlight gateway
+        sunlight_gateway = LocalSunlightGateway()
+
+        # When we fetch a year's worth of sunlight windows
+        sunlight_windows = sunlight_gateway.fetch_sunlight_windows(
+            'America/New_York',
+            date(2018, 1, 1),
+            date(2018, 12, 31)
+        )
+
+        # Then we get the same sunlight window for each date as we do fetching it on its own
+        assert len(sunlight_windows) == 365
+        assert sunlight_windows[315] == sunlight_gateway.fetch_sunlight_window(
+            'America/New_York',
+            date(2018, 11, 12)
+        )
+
+    def test_falls_back_for_the_dates_that_cannot_be_computed(self) -> None:
+        # Given a local sunlight gateway with a fallback gateway
+        fallback_gateway = FakeSunlightGateway()
+        sunlight_gateway = LocalSunlightGateway(fallback_gateway)
+
+        # When we fetch svalbard's sunlight windows around the start of its polar night
+        sunlight_windows = sunlight_gateway.fetch_sunlight_windows(
+            'Arctic/Longyearbyen',
+            date(2018, 10, 24),
+            date(2018, 10, 28)
+        )
+
+        # Then only the dates on which the sun doesn't rise are fetched from the fallback gateway
+        assert len(sunlight_windows) == 5
+        assert fallback_gateway.requests == [
+            ('Arctic/Longyearbyen', date(2018, 10, 27)),
+            ('Arctic/Longyearbyen', date(2018, 10, 28))
+        ]
@@ -1,20 +1,29 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Dict
+from typing import Dict, List
 
 import requests
 
 from front.definitions import SunlightWindow, exceptions
 from front.gateways.sunlight import SunlightGatewayABC
+from front.gateways.sunlight.abc import date_range
+from front.gateways.transport import HttpTransport, default_transport
+
+
+_thread_pools: Dict[int, ThreadPoolExecutor] = {}
+_thread_pools_lock = threading.Lock()
 
 
 class SunlightServiceGateway(SunlightGatewayABC):
     endpoint = 'https://micro.morningcd.com/sunlight'
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, transport: HttpTransport = default_transport) -> None:
         self.api_key = api_key
+        self.transport = transport
 
     def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
-        r = requests.get(
+        r = self.transport.get(
             self.endpoint,
             params={
                 'iana_timezone': iana_timezone,
@@ -32,6 +41,33 @@ class SunlightServiceGateway(SunlightGatewayABC):
 
         return _pluck_sunlight_window(r.json())
 
+    def fetch_sunlight_windows(self,
+                               iana_timezone: str,
+                               from_date: date,
+                               to_date: date) -> List[SunlightWindow]:
+        """Fetch each date's sunlight window on as many threads as the transport allows
+        concurrent requests to the sunlight service, rather than one date after another.
+        """
+        dates = list(date_range(from_date, to_date))
+        if len(dates) <= 1:
+            return [self.fetch_sunlight_window(iana_timezone, on_date) for on_date in dates]
+
+        return list(_thread_pool(self.transport.pool_size_per_host).map(
+            lambda on_date: self.fetch_sunlight_window(iana_timezone, on_date),
+            dates
+        ))
+
+
+def _thread_pool(size: int) -> ThreadPoolExecutor:
+    """Thread pools are shared by every sunlight service gateway in the process, so a warm lambda
+    container reuses its threads across invocations rather than starting new ones for each range.
+    """
+    with _thread_pools_lock:
+        if size not in _thread_pools:
+            _thread_pools[size] = ThreadPoolExecutor(size, thread_name_prefix='sunlight')
+
+        return _thread_pools[size]
+
 
 def _pluck_sunlight_window(raw_sunlight_window: Dict) -> SunlightWindow:
     return SunlightWindow(
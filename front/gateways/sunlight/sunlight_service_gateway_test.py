@@ -0,0 +1,86 @@
+import json
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, List, Set
+
+import requests
+
+from front.definitions import SunlightWindow
+from front.gateways.sunlight import SunlightServiceGateway
+from front.gateways.transport import HttpTransport
+
+
+class FakeTransport(HttpTransport):
+    """Answers every request with the same sunlight window after a short delay, recording the
+    dates requested, the threads they were requested on and the most requests ever in flight at
+    once.
+    """
+
+    def __init__(self, pool_size_per_host: int) -> None:
+        super().__init__(pool_size_per_host)
+        self.on_dates: List[str] = []
+        self.threads: Set[threading.Thread] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._in_flight_lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        with self._in_flight_lock:
+            self.on_dates.append(kwargs['params']['on_date'])
+            self.threads.add(threading.current_thread())
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self._in_flight_lock:
+            self.in_flight -= 1
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({
+            'sunrise_utc': '2018-11-12T11:40:04+00:00',
+            'sunset_utc': '2018-11-12T21:40:26+00:00'
+        }).encode()
+        return response
+
+
+class TestFetchSunlightWindows:
+
+    def test_fetches_dates_concurrently_up_to_the_pool_size(self) -> None:
+        # Given a sunlight service gateway whose transport allows two concurrent requests
+        transport = FakeTransport(pool_size_per_host=2)
+        sunlight_service_gateway = SunlightServiceGateway(api_key='xyz', transport=transport)
+
+        # When we fetch the sunlight windows of six dates
+        sunlight_windows = sunlight_service_gateway.fetch_sunlight_windows(
+            'America/New_York',
+            date(2018, 11, 12),
+            date(2018, 11, 17)
+        )
+
+        # Then each date is fetched once, two at a time
+        assert sorted(transport.on_dates) == [f'2018-11-{day}' for day in range(12, 18)]
+        assert transport.max_in_flight == 2
+
+        # And the windows come back in order
+        assert sunlight_windows == [SunlightWindow(
+            sunrise_utc=datetime(2018, 11, 12, 11, 40, 4),
+            sunset_utc=datetime(2018, 11, 12, 21, 40, 26)
+        )] * 6
+
+    def test_reuses_its_threads_across_calls(self) -> None:
+        # Given a sunlight service gateway whose transport allows three concurrent requests
+        transport = FakeTransport(pool_size_per_host=3)
+        sunlight_service_gateway = SunlightServiceGateway(api_key='xyz', transport=transport)
+
+        # When we fetch the sunlight windows of six dates, twice
+        for _ in range(2):
+            sunlight_service_gateway.fetch_sunlight_windows(
+                'America/New_York',
+                date(2018, 11, 12),
+                date(2018, 11, 17)
+            )
+
+        # Then every date is fetched on the same three threads
+        assert len(transport.on_dates) == 12
+        assert len(transport.threads) == 3
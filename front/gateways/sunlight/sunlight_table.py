@@ -0,0 +1,162 @@
+"""A precomputed table of sunlight windows, read with `mmap` so that a lookup is an index into the
+file rather than a computation or a request.
+
+The table is a fixed-width binary file:
+
+    header      magic (4 bytes), version (uint32), first date as an ordinal (int32),
+                days per zone (uint32), zone count (uint32)
+    zone index  for each zone, its name's utf-8 length (uint16) and its name, padded to 4 bytes
+    windows     for each zone, for each day, sunrise and sunset in utc epoch seconds (int32 pair)
+
+All integers are little-endian. Days on which a zone's sun doesn't rise or set are stored as a
+pair of `NO_SUNLIGHT_WINDOW`s.
+
+Build the table with `pipenv run build-sunlight-table` (see `front.gateways.sunlight.build`).
+"""
+import mmap
+import os
+import struct
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from front.definitions import SunlightWindow
+from front.gateways.sunlight.abc import date_range
+from front.gateways.sunlight.local_sunlight_gateway import compute_sunlight_windows
+from front.gateways.sunlight.timezones import canonical_timezone
+from front.gateways.sunlight.zone_coordinates import zone_coordinates
+
+
+MAGIC = b'SUNT'
+VERSION = 1
+NO_SUNLIGHT_WINDOW = -2 ** 31
+
+HEADER = struct.Struct('<4sIiII')
+ZONE_NAME_LENGTH = struct.Struct('<H')
+WINDOW = struct.Struct('<ii')
+
+EPOCH = datetime(1970, 1, 1)
+
+default_sunlight_table_path = os.path.join(os.path.dirname(__file__), 'sunlight_table.bin')
+
+
+class SunlightTable:
+    """A read-only, memory-mapped sunlight table. The zone index is read once when the table is
+    opened; lookups only unpack the windows they need.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, first_ordinal, days, zone_count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a version {VERSION} sunlight table')
+
+        self.from_date = date.fromordinal(first_ordinal)
+        self.days = days
+        self._row_by_timezone: Dict[str, int] = {}
+
+        offset = HEADER.size
+        for row in range(zone_count):
+            (name_length,) = ZONE_NAME_LENGTH.unpack_from(self._mmap, offset)
+            offset += ZONE_NAME_LENGTH.size
+            self._row_by_timezone[self._mmap[offset:offset + name_length].decode('utf-8')] = row
+            offset += name_length
+
+        self._windows_offset = _padded(offset)
+
+    @property
+    def timezones(self) -> List[str]:
+        return list(self._row_by_timezone)
+
+    def lookup(self, iana_timezone: str, on_date: date) -> Optional[SunlightWindow]:
+        """The sunlight window of `on_date` in `iana_timezone`, or None if it isn't in the table."""
+        return self.lookup_range(iana_timezone, on_date, on_date)[0]
+
+    def lookup_range(self,
+                     iana_timezone: str,
+                     from_date: date,
+                     to_date: date) -> List[Optional[SunlightWindow]]:
+        """The sunlight windows of every date from `from_date` to `to_date`, inclusive, with None
+        for each date that isn't in the table.
+        """
+        sunlight_windows: List[Optional[SunlightWindow]] = [
+            None for _ in date_range(from_date, to_date)
+        ]
+
+        row = self._row_by_timezone.get(canonical_timezone(iana_timezone))
+        if row is None:
+            return sunlight_windows
+
+        first_day = max((from_date - self.from_date).days, 0)
+        last_day = min((to_date - self.from_date).days, self.days - 1)
+        if first_day > last_day:
+            return sunlight_windows
+
+        seconds = struct.unpack_from(
+            f'<{2 * (last_day - first_day + 1)}i',
+            self._mmap,
+            self._windows_offset + (row * self.days + first_day) * WINDOW.size
+        )
+        skipped_days = (self.from_date - from_date).days + first_day
+        for day, (sunrise_seconds, sunset_seconds) in enumerate(zip(seconds[::2], seconds[1::2])):
+            if sunrise_seconds != NO_SUNLIGHT_WINDOW:
+                sunlight_windows[skipped_days + day] = SunlightWindow(
+                    sunrise_utc=EPOCH + timedelta(seconds=sunrise_seconds),
+                    sunset_utc=EPOCH + timedelta(seconds=sunset_seconds)
+                )
+
+        return sunlight_windows
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def build_sunlight_table(path: str,
+                         from_date: date,
+                         days: int,
+                         timezones: Optional[Iterable[str]] = None) -> None:
+    """Compute the sunlight windows of `days` days from `from_date` for each of `timezones` (by
+    default, every zone with a bundled coordinate) and write them to a sunlight table at `path`.
+
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'sunlight_table.bin')
+    >>> build_sunlight_table(path, date(2018, 11, 12), days=2, timezones=['America/New_York'])
+    >>> SunlightTable(path).lookup('US/Eastern', date(2018, 11, 12))
+    SunlightWindow(sunrise_utc=datetime.datetime(2018, 11, 12, 11, 39, 17), \
+sunset_utc=datetime.datetime(2018, 11, 12, 21, 40, 35))
+    """
+    timezones = sorted(timezones if timezones is not None else zone_coordinates)
+    to_date = from_date + timedelta(days=days - 1)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, from_date.toordinal(), days, len(timezones)))
+
+        zone_index = b''.join(
+            ZONE_NAME_LENGTH.pack(len(name)) + name
+            for name in (timezone.encode('utf-8') for timezone in timezones)
+        )
+        f.write(zone_index)
+        f.write(b'\0' * (_padded(HEADER.size + len(zone_index)) - HEADER.size - len(zone_index)))
+
+        for timezone in timezones:
+            f.write(b''.join(
+                WINDOW.pack(*_epoch_seconds(sunlight_window))
+                for sunlight_window in compute_sunlight_windows(timezone, from_date, to_date)
+            ))
+
+
+def _epoch_seconds(sunlight_window: Optional[SunlightWindow]) -> List[int]:
+    if sunlight_window is None:
+        return [NO_SUNLIGHT_WINDOW, NO_SUNLIGHT_WINDOW]
+
+    return [int((sunlight_window.sunrise_utc - EPOCH).total_seconds()),
+            int((sunlight_window.sunset_utc - EPOCH).total_seconds())]
+
+
+def _padded(offset: int) -> int:
+    """
+    >>> _padded(21), _padded(24)
+    (24, 24)
+    """
+    return (offset + 3) // 4 * 4
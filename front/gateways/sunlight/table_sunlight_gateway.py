@@ -0,0 +1,82 @@
+from datetime import date
+from typing import List, Optional
+
+from front.definitions import SunlightWindow, exceptions
+from front.gateways.sunlight import AsyncSunlightGatewayABC, SunlightGatewayABC
+from front.gateways.sunlight.abc import date_range
+from front.gateways.sunlight.sunlight_table import SunlightTable
+
+
+class TableSunlightGateway(SunlightGatewayABC):
+    """Looks sunlight windows up in a precomputed `SunlightTable`. Timezones and dates that aren't
+    in the table (or on which the sun doesn't rise or set) are handed to `fallback_gateway`, or
+    raise a `SunlightError` if there isn't one.
+    """
+
+    def __init__(self,
+                 sunlight_table: SunlightTable,
+                 fallback_gateway: Optional[SunlightGatewayABC] = None) -> None:
+        self.sunlight_table = sunlight_table
+        self.fallback_gateway = fallback_gateway
+
+    def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        sunlight_window = self.sunlight_table.lookup(iana_timezone, on_date)
+        if sunlight_window is not None:
+            return sunlight_window
+
+        if self.fallback_gateway is None:
+            raise _not_in_table_error(iana_timezone, on_date)
+
+        return self.fallback_gateway.fetch_sunlight_window(iana_timezone, on_date)
+
+    def peek_sunlight_window(self, iana_timezone: str, on_date: date) -> Optional[SunlightWindow]:
+        return self.sunlight_table.lookup(iana_timezone, on_date)
+
+    def fetch_sunlight_windows(self,
+                               iana_timezone: str,
+                               from_date: date,
+                               to_date: date) -> List[SunlightWindow]:
+        sunlight_windows = self.sunlight_table.lookup_range(iana_timezone, from_date, to_date)
+        return [
+            sunlight_window or self.fetch_sunlight_window(iana_timezone, on_date)
+            for on_date, sunlight_window in zip(date_range(from_date, to_date), sunlight_windows)
+        ]
+
+
+class AsyncTableSunlightGateway(AsyncSunlightGatewayABC):
+    """The async counterpart of `TableSunlightGateway`."""
+
+    def __init__(self,
+                 sunlight_table: SunlightTable,
+                 fallback_gateway: Optional[AsyncSunlightGatewayABC] = None) -> None:
+        self.sunlight_table = sunlight_table
+        self.fallback_gateway = fallback_gateway
+
+    async def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        sunlight_window = self.sunlight_table.lookup(iana_timezone, on_date)
+        if sunlight_window is not None:
+            return sunlight_window
+
+        if self.fallback_gateway is None:
+            raise _not_in_table_error(iana_timezone, on_date)
+
+        return await self.fallback_gateway.fetch_sunlight_window(iana_timezone, on_date)
+
+    def peek_sunlight_window(self, iana_timezone: str, on_date: date) -> Optional[SunlightWindow]:
+        return self.sunlight_table.lookup(iana_timezone, on_date)
+
+    async def fetch_sunlight_windows(self,
+                                     iana_timezone: str,
+                                     from_date: date,
+                                     to_date: date) -> List[SunlightWindow]:
+        sunlight_windows = self.sunlight_table.lookup_range(iana_timezone, from_date, to_date)
+        return [
+            sunlight_window or await self.fetch_sunlight_window(iana_timezone, on_date)
+            for on_date, sunlight_window in zip(date_range(from_date, to_date), sunlight_windows)
+        ]
+
+
+def _not_in_table_error(iana_timezone: str, on_date: date) -> exceptions.SunlightError:
+    return exceptions.SunlightError(
+        f'The sunlight window of {iana_timezone} on {on_date.isoformat()} is not in the table'
+    )
@@ -0,0 +1,107 @@
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from front.definitions import SunlightWindow, exceptions
+from front.gateways.sunlight import SunlightGatewayABC, TableSunlightGateway
+from front.gateways.sunlight.local_sunlight_gateway import compute_sunlight_window
+from front.gateways.sunlight.sunlight_table import SunlightTable, build_sunlight_table
+
+
+SUNLIGHT_WINDOW = SunlightWindow(
+    sunrise_utc=datetime(2018, 11, 12, 11, 40, 4),
+    sunset_utc=datetime(2018, 11, 12, 21, 40, 26)
+)
+
+
+class FakeSunlightGateway(SunlightGatewayABC):
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[str, date]] = []
+
+    def fetch_sunlight_window(self, iana_timezone: str, on_date: date) -> SunlightWindow:
+        self.requests.append((iana_timezone, on_date))
+        return SUNLIGHT_WINDOW
+
+
+def make_sunlight_table(tmp_path: Path) -> SunlightTable:
+    path = str(tmp_path / 'sunlight_table.bin')
+    build_sunlight_table(
+        path,
+        date(2018, 11, 1),
+        days=30,
+        timezones=['America/New_York', 'Arctic/Longyearbyen', 'Asia/Tokyo']
+    )
+    return SunlightTable(path)
+
+
+class TestFetchSunlightWindow:
+
+    def test_matches_computed_sunlight_window(self, tmp_path: Path) -> None:
+        # Given a table sunlight gateway
+        sunlight_gateway = TableSunlightGateway(make_sunlight_table(tmp_path))
+
+        # When we fetch sunlight windows that are in the table
+        new_york = sunlight_gateway.fetch_sunlight_window('US/Eastern', date(2018, 11, 12))
+        tokyo = sunlight_gateway.fetch_sunlight_window('Asia/Tokyo', date(2018, 11, 30))
+
+        # Then we get the same sunlight windows as computing them
+        assert new_york == compute_sunlight_window('America/New_York', date(2018, 11, 12))
+        assert tokyo == compute_sunlight_window('Asia/Tokyo', date(2018, 11, 30))
+
+    def test_falls_back_for_sunlight_windows_that_arent_in_the_table(self,
+                                                                     tmp_path: Path) -> None:
+        # Given a table sunlight gateway with a fallback gateway
+        fallback_gateway = FakeSunlightGateway()
+        sunlight_gateway = TableSunlightGateway(make_sunlight_table(tmp_path), fallback_gateway)
+
+        # When we fetch sunlight windows of a date after the table, a timezone that isn't in the
+        # table, and a polar night
+        sunlight_gateway.fetch_sunlight_window('America/New_York', date(2018, 12, 1))
+        sunlight_gateway.fetch_sunlight_window('Europe/Paris', date(2018, 11, 12))
+        sunlight_gateway.fetch_sunlight_window('Arctic/Longyearbyen', date(2018, 11, 12))
+
+        # Then they're fetched from the fallback gateway
+        assert fallback_gateway.requests == [
+            ('America/New_York', date(2018, 12, 1)),
+            ('Europe/Paris', date(2018, 11, 12)),
+            ('Arctic/Longyearbyen', date(2018, 11, 12))
+        ]
+
+    def test_raises_sunlight_error_without_fallback(self, tmp_path: Path) -> None:
+        # Given a table sunlight gateway without a fallback gateway
+        sunlight_gateway = TableSunlightGateway(make_sunlight_table(tmp_path))
+
+        # When we fetch a sunlight window that isn't in the table
+        # Then a sunlight error is raised
+        with pytest.raises(exceptions.SunlightError):
+            sunlight_gateway.fetch_sunlight_window('America/New_York', date(2018, 10, 31))
+
+
+class TestFetchSunlightWindows:
+
+    def test_fills_in_dates_outside_the_table_from_the_fallback(self, tmp_path: Path) -> None:
+        # Given a table sunlight gateway with a fallback gateway
+        fallback_gateway = FakeSunlightGateway()
+        sunlight_gateway = TableSunlightGateway(make_sunlight_table(tmp_path), fallback_gateway)
+
+        # When we fetch a range of sunlight windows that starts before the table
+        sunlight_windows = sunlight_gateway.fetch_sunlight_windows(
+            'America/New_York',
+            date(2018, 10, 30),
+            date(2018, 11, 2)
+        )
+
+        # Then the dates before the table are fetched from the fallback gateway
+        assert sunlight_windows == [
+            SUNLIGHT_WINDOW,
+            SUNLIGHT_WINDOW,
+            compute_sunlight_window('America/New_York', date(2018, 11, 1)),
+            compute_sunlight_window('America/New_York', date(2018, 11, 2))
+        ]
+        assert fallback_gateway.requests == [
+            ('America/New_York', date(2018, 10, 30)),
+            ('America/New_York', date(2018, 10, 31))
+        ]
@@ -0,0 +1,126 @@
+"""Canonical names of the iana timezones that are aliases of other timezones, i.e. `US/Eastern` is
+an alias of `America/New_York`. Generated from the link lines of tzdata 2025b.
+
+Only aliases that name the same place as their canonical timezone are included. Tzdata also
+links the timezones of different places that happen to share clocks (i.e. `Iceland` and
+`Africa/Abidjan`), and those places have different sunlight windows.
+"""
+from typing import Dict
+
+
+def canonical_timezone(iana_timezone: str) -> str:
+    """
+    >>> canonical_timezone('US/Eastern')
+    'America/New_York'
+    >>> canonical_timezone('America/New_York')
+    'America/New_York'
+    """
+    return _canonical_timezone_by_alias.get(iana_timezone, iana_timezone)
+
+
+_canonical_timezone_by_alias: Dict[str, str] = {
+    'America/Atka': 'America/Adak',
+    'America/Buenos_Aires': 'America/Argentina/Buenos_Aires',
+    'America/Catamarca': 'America/Argentina/Catamarca',
+    'America/Cordoba': 'America/Argentina/Cordoba',
+    'America/Godthab': 'America/Nuuk',
+    'America/Indianapolis': 'America/Indiana/Indianapolis',
+    'America/Jujuy': 'America/Argentina/Jujuy',
+    'America/Knox_IN': 'America/Indiana/Knox',
+    'America/Louisville': 'America/Kentucky/Louisville',
+    'America/Mendoza': 'America/Argentina/Mendoza',
+    'America/Porto_Acre': 'America/Rio_Branco',
+    'Asia/Ashkhabad': 'Asia/Ashgabat',
+    'Asia/Calcutta': 'Asia/Kolkata',
+    'Asia/Dacca': 'Asia/Dhaka',
+    'Asia/Istanbul': 'Europe/Istanbul',
+    'Asia/Katmandu': 'Asia/Kathmandu',
+    'Asia/Macao': 'Asia/Macau',
+    'Asia/Rangoon': 'Asia/Yangon',
+    'Asia/Saigon': 'Asia/Ho_Chi_Minh',
+    'Asia/Thimbu': 'Asia/Thimphu',
+    'Asia/Ujung_Pandang': 'Asia/Makassar',
+    'Asia/Ulan_Bator': 'Asia/Ulaanbaatar',
+    'Atlantic/Faeroe': 'Atlantic/Faroe',
+    'Australia/ACT': 'Australia/Sydney',
+    'Australia/LHI': 'Australia/Lord_Howe',
+    'Australia/NSW': 'Australia/Sydney',
+    'Australia/North': 'Australia/Darwin',
+    'Australia/Queensland': 'Australia/Brisbane',
+    'Australia/South': 'Australia/Adelaide',
+    'Australia/Tasmania': 'Australia/Hobart',
+    'Australia/Victoria': 'Australia/Melbourne',
+    'Australia/West': 'Australia/Perth',
+    'Australia/Yancowinna': 'Australia/Broken_Hill',
+    'Brazil/Acre': 'America/Rio_Branco',
+    'Brazil/DeNoronha': 'America/Noronha',
+    'Brazil/East': 'America/Sao_Paulo',
+    'Brazil/West': 'America/Manaus',
+    'Canada/Atlantic': 'America/Halifax',
+    'Canada/Central': 'America/Winnipeg',
+    'Canada/Eastern': 'America/Toronto',
+    'Canada/Mountain': 'America/Edmonton',
+    'Canada/Newfoundland': 'America/St_Johns',
+    'Canada/Pacific': 'America/Vancouver',
+    'Canada/Saskatchewan': 'America/Regina',
+    'Canada/Yukon': 'America/Whitehorse',
+    'Chile/Continental': 'America/Santiago',
+    'Chile/EasterIsland': 'Pacific/Easter',
+    'Cuba': 'America/Havana',
+    'Egypt': 'Africa/Cairo',
+    'Eire': 'Europe/Dublin',
+    'Etc/GMT+0': 'Etc/GMT',
+    'Etc/GMT-0': 'Etc/GMT',
+    'Etc/GMT0': 'Etc/GMT',
+    'Etc/Greenwich': 'Etc/GMT',
+    'Etc/UCT': 'Etc/UTC',
+    'Etc/Universal': 'Etc/UTC',
+    'Etc/Zulu': 'Etc/UTC',
+    'Europe/Kiev': 'Europe/Kyiv',
+    'Europe/Nicosia': 'Asia/Nicosia',
+    'GB': 'Europe/London',
+    'GB-Eire': 'Europe/London',
+    'GMT': 'Etc/GMT',
+    'GMT+0': 'Etc/GMT',
+    'GMT-0': 'Etc/GMT',
+    'GMT0': 'Etc/GMT',
+    'Greenwich': 'Etc/GMT',
+    'Hongkong': 'Asia/Hong_Kong',
+    'Iran': 'Asia/Tehran',
+    'Israel': 'Asia/Jerusalem',
+    'Jamaica': 'America/Jamaica',
+    'Japan': 'Asia/Tokyo',
+    'Kwajalein': 'Pacific/Kwajalein',
+    'Libya': 'Africa/Tripoli',
+    'Mexico/BajaNorte': 'America/Tijuana',
+    'Mexico/BajaSur': 'America/Mazatlan',
+    'Mexico/General': 'America/Mexico_City',
+    'NZ': 'Pacific/Auckland',
+    'NZ-CHAT': 'Pacific/Chatham',
+    'PRC': 'Asia/Shanghai',
+    'Pacific/Enderbury': 'Pacific/Kanton',
+    'Pacific/Samoa': 'Pacific/Pago_Pago',
+    'Poland': 'Europe/Warsaw',
+    'Portugal': 'Europe/Lisbon',
+    'ROC': 'Asia/Taipei',
+    'ROK': 'Asia/Seoul',
+    'Singapore': 'Asia/Singapore',
+    'Turkey': 'Europe/Istanbul',
+    'UCT': 'Etc/UTC',
+    'US/Alaska': 'America/Anchorage',
+    'US/Aleutian': 'America/Adak',
+    'US/Arizona': 'America/Phoenix',
+    'US/Central': 'America/Chicago',
+    'US/East-Indiana': 'America/Indiana/Indianapolis',
+    'US/Eastern': 'America/New_York',
+    'US/Hawaii': 'Pacific/Honolulu',
+    'US/Indiana-Starke': 'America/Indiana/Knox',
+    'US/Michigan': 'America/Detroit',
+    'US/Mountain': 'America/Denver',
+    'US/Pacific': 'America/Los_Angeles',
+    'US/Samoa': 'Pacific/Pago_Pago',
+    'UTC': 'Etc/UTC',
+    'Universal': 'Etc/UTC',
+    'W-SU': 'Europe/Moscow',
+    'Zulu': 'Etc/UTC'
+}
@@ -0,0 +1,429 @@
+"""A representative coordinate (the latitude and longitude of its principal location) and the
+standard utc offset (in hours) of every iana timezone. Generated from the zone.tab and
+zone1970.tab files of tzdata 2025b.
+"""
+from typing import Dict, Tuple
+
+
+ZoneCoordinate = Tuple[float, float, float]
+
+zone_coordinates: Dict[str, ZoneCoordinate] = {
+    'Africa/Abidjan': (5.3167, -4.0333, 0.0),
+    'Africa/Accra': (5.55, -0.2167, 0.0),
+    'Africa/Addis_Ababa': (9.0333, 38.7, 3.0),
+    'Africa/Algiers': (36.7833, 3.05, 1.0),
+    'Africa/Asmara': (15.3333, 38.8833, 3.0),
+    'Africa/Bamako': (12.65, -8.0, 0.0),
+    'Africa/Bangui': (4.3667, 18.5833, 1.0),
+    'Africa/Banjul': (13.4667, -16.65, 0.0),
+    'Africa/Bissau': (11.85, -15.5833, 0.0),
+    'Africa/Blantyre': (-15.7833, 35.0, 2.0),
+    'Africa/Brazzaville': (-4.2667, 15.2833, 1.0),
+    'Africa/Bujumbura': (-3.3833, 29.3667, 2.0),
+    'Africa/Cairo': (30.05, 31.25, 2.0),
+    'Africa/Casablanca': (33.65, -7.5833, 1.0),
+    'Africa/Ceuta': (35.8833, -5.3167, 1.0),
+    'Africa/Conakry': (9.5167, -13.7167, 0.0),
+    'Africa/Dakar': (14.6667, -17.4333, 0.0),
+    'Africa/Dar_es_Salaam': (-6.8, 39.2833, 3.0),
+    'Africa/Djibouti': (11.6, 43.15, 3.0),
+    'Africa/Douala': (4.05, 9.7, 1.0),
+    'Africa/El_Aaiun': (27.15, -13.2, 1.0),
+    'Africa/Freetown': (8.5, -13.25, 0.0),
+    'Africa/Gaborone': (-24.65, 25.9167, 2.0),
+    'Africa/Harare': (-17.8333, 31.05, 2.0),
+    'Africa/Johannesburg': (-26.25, 28.0, 2.0),
+    'Africa/Juba': (4.85, 31.6167, 2.0),
+    'Africa/Kampala': (0.3167, 32.4167, 3.0),
+    'Africa/Khartoum': (15.6, 32.5333, 2.0),
+    'Africa/Kigali': (-1.95, 30.0667, 2.0),
+    'Africa/Kinshasa': (-4.3, 15.3, 1.0),
+    'Africa/Lagos': (6.45, 3.4, 1.0),
+    'Africa/Libreville': (0.3833, 9.45, 1.0),
+    'Africa/Lome': (6.1333, 1.2167, 0.0),
+    'Africa/Luanda': (-8.8, 13.2333, 1.0),
+    'Africa/Lubumbashi': (-11.6667, 27.4667, 2.0),
+    'Africa/Lusaka': (-15.4167, 28.2833, 2.0),
+    'Africa/Malabo': (3.75, 8.7833, 1.0),
+    'Africa/Maputo': (-25.9667, 32.5833, 2.0),
+    'Africa/Maseru': (-29.4667, 27.5, 2.0),
+    'Africa/Mbabane': (-26.3, 31.1, 2.0),
+    'Africa/Mogadishu': (2.0667, 45.3667, 3.0),
+    'Africa/Monrovia': (6.3, -10.7833, 0.0),
+    'Africa/Nairobi': (-1.2833, 36.8167, 3.0),
+    'Africa/Ndjamena': (12.1167, 15.05, 1.0),
+    'Africa/Niamey': (13.5167, 2.1167, 1.0),
+    'Africa/Nouakchott': (18.1, -15.95, 0.0),
+    'Africa/Ouagadougou': (12.3667, -1.5167, 0.0),
+    'Africa/Porto-Novo': (6.4833, 2.6167, 1.0),
+    'Africa/Sao_Tome': (0.3333, 6.7333, 0.0),
+    'Africa/Tripoli': (32.9, 13.1833, 2.0),
+    'Africa/Tunis': (36.8, 10.1833, 1.0),
+    'Africa/Windhoek': (-22.5667, 17.1, 2.0),
+    'America/Adak': (51.88, -176.6581, -10.0),
+    'America/Anchorage': (61.2181, -149.9003, -9.0),
+    'America/Anguilla': (18.2, -63.0667, -4.0),
+    'America/Antigua': (17.05, -61.8, -4.0),
+    'America/Araguaina': (-7.2, -48.2, -3.0),
+    'America/Argentina/Buenos_Aires': (-34.6, -58.45, -3.0),
+    'America/Argentina/Catamarca': (-28.4667, -65.7833, -3.0),
+    'America/Argentina/Cordoba': (-31.4, -64.1833, -3.0),
+    'America/Argentina/Jujuy': (-24.1833, -65.3, -3.0),
+    'America/Argentina/La_Rioja': (-29.4333, -66.85, -3.0),
+    'America/Argentina/Mendoza': (-32.8833, -68.8167, -3.0),
+    'America/Argentina/Rio_Gallegos': (-51.6333, -69.2167, -3.0),
+    'America/Argentina/Salta': (-24.7833, -65.4167, -3.0),
+    'America/Argentina/San_Juan': (-31.5333, -68.5167, -3.0),
+    'America/Argentina/San_Luis': (-33.3167, -66.35, -3.0),
+    'America/Argentina/Tucuman': (-26.8167, -65.2167, -3.0),
+    'America/Argentina/Ushuaia': (-54.8, -68.3, -3.0),
+    'America/Aruba': (12.5, -69.9667, -4.0),
+    'America/Asuncion': (-25.2667, -57.6667, -3.0),
+    'America/Atikokan': (48.7586, -91.6217, -5.0),
+    'America/Bahia': (-12.9833, -38.5167, -3.0),
+    'America/Bahia_Banderas': (20.8, -105.25, -6.0),
+    'America/Barbados': (13.1, -59.6167, -4.0),
+    'America/Belem': (-1.45, -48.4833, -3.0),
+    'America/Belize': (17.5, -88.2, -6.0),
+    'America/Blanc-Sablon': (51.4167, -57.1167, -4.0),
+    'America/Boa_Vista': (2.8167, -60.6667, -4.0),
+    'America/Bogota': (4.6, -74.0833, -5.0),
+    'America/Boise': (43.6136, -116.2025, -7.0),
+    'America/Cambridge_Bay': (69.1139, -105.0528, -7.0),
+    'America/Campo_Grande': (-20.45, -54.6167, -4.0),
+    'America/Cancun': (21.0833, -86.7667, -5.0),
+    'America/Caracas': (10.5, -66.9333, -4.0),
+    'America/Cayenne': (4.9333, -52.3333, -3.0),
+    'America/Cayman': (19.3, -81.3833, -5.0),
+    'America/Chicago': (41.85, -87.65, -6.0),
+    'America/Chihuahua': (28.6333, -106.0833, -6.0),
+    'America/Ciudad_Juarez': (31.7333, -106.4833, -7.0),
+    'America/Costa_Rica': (9.9333, -84.0833, -6.0),
+    'America/Coyhaique': (-45.5667, -72.0667, -3.0),
+    'America/Creston': (49.1, -116.5167, -7.0),
+    'America/Cuiaba': (-15.5833, -56.0833, -4.0),
+    'America/Curacao': (12.1833, -69.0, -4.0),
+    'America/Danmarkshavn': (76.7667, -18.6667, 0.0),
+    'America/Dawson': (64.0667, -139.4167, -7.0),
+    'America/Dawson_Creek': (55.7667, -120.2333, -7.0),
+    'America/Denver': (39.7392, -104.9842, -7.0),
+    'America/Detroit': (42.3314, -83.0458, -5.0),
+    'America/Dominica': (15.3, -61.4, -4.0),
+    'America/Edmonton': (53.55, -113.4667, -7.0),
+    'America/Eirunepe': (-6.6667, -69.8667, -5.0),
+    'America/El_Salvador': (13.7, -89.2, -6.0),
+    'America/Fort_Nelson': (58.8, -122.7, -7.0),
+    'America/Fortaleza': (-3.7167, -38.5, -3.0),
+    'America/Glace_Bay': (46.2, -59.95, -4.0),
+    'America/Goose_Bay': (53.3333, -60.4167, -4.0),
+    'America/Grand_Turk': (21.4667, -71.1333, -5.0),
+    'America/Grenada': (12.05, -61.75, -4.0),
+    'America/Guadeloupe': (16.2333, -61.5333, -4.0),
+    'America/Guatemala': (14.6333, -90.5167, -6.0),
+    'America/Guayaquil': (-2.1667, -79.8333, -5.0),
+    'America/Guyana': (6.8, -58.1667, -4.0),
+    'America/Halifax': (44.65, -63.6, -4.0),
+    'America/Havana': (23.1333, -82.3667, -5.0),
+    'America/Hermosillo': (29.0667, -110.9667, -7.0),
+    'America/Indiana/Indianapolis': (39.7683, -86.1581, -5.0),
+    'America/Indiana/Knox': (41.2958, -86.625, -6.0),
+    'America/Indiana/Marengo': (38.3756, -86.3447, -5.0),
+    'America/Indiana/Petersburg': (38.4919, -87.2786, -5.0),
+    'America/Indiana/Tell_City': (37.9531, -86.7614, -6.0),
+    'America/Indiana/Vevay': (38.7478, -85.0672, -5.0),
+    'America/Indiana/Vincennes': (38.6772, -87.5286, -5.0),
+    'America/Indiana/Winamac': (41.0514, -86.6031, -5.0),
+    'America/Inuvik': (68.3497, -133.7167, -7.0),
+    'America/Iqaluit': (63.7333, -68.4667, -5.0),
+    'America/Jamaica': (17.9681, -76.7933, -5.0),
+    'America/Juneau': (58.3019, -134.4197, -9.0),
+    'America/Kentucky/Louisville': (38.2542, -85.7594, -5.0),
+    'America/Kentucky/Monticello': (36.8297, -84.8492, -5.0),
+    'America/Kralendijk': (12.1508, -68.2767, -4.0),
+    'America/La_Paz': (-16.5, -68.15, -4.0),
+    'America/Lima': (-12.05, -77.05, -5.0),
+    'America/Los_Angeles': (34.0522, -118.2428, -8.0),
+    'America/Lower_Princes': (18.0514, -63.0472, -4.0),
+    'America/Maceio': (-9.6667, -35.7167, -3.0),
+    'America/Managua': (12.15, -86.2833, -6.0),
+    'America/Manaus': (-3.1333, -60.0167, -4.0),
+    'America/Marigot': (18.0667, -63.0833, -4.0),
+    'America/Martinique': (14.6, -61.0833, -4.0),
+    'America/Matamoros': (25.8333, -97.5, -6.0),
+    'America/Mazatlan': (23.2167, -106.4167, -7.0),
+    'America/Menominee': (45.1078, -87.6142, -6.0),
+    'America/Merida': (20.9667, -89.6167, -6.0),
+    'America/Metlakatla': (55.1269, -131.5764, -9.0),
+    'America/Mexico_City': (19.4, -99.15, -6.0),
+    'America/Miquelon': (47.05, -56.3333, -3.0),
+    'America/Moncton': (46.1, -64.7833, -4.0),
+    'America/Monterrey': (25.6667, -100.3167, -6.0),
+    'America/Montevideo': (-34.9092, -56.2125, -3.0),
+    'America/Montserrat': (16.7167, -62.2167, -4.0),
+    'America/Nassau': (25.0833, -77.35, -5.0),
+    'America/New_York': (40.7142, -74.0064, -5.0),
+    'America/Nome': (64.5011, -165.4064, -9.0),
+    'America/Noronha': (-3.85, -32.4167, -2.0),
+    'America/North_Dakota/Beulah': (47.2642, -101.7778, -6.0),
+    'America/North_Dakota/Center': (47.1164, -101.2992, -6.0),
+    'America/North_Dakota/New_Salem': (46.845, -101.4108, -6.0),
+    'America/Nuuk': (64.1833, -51.7333, -2.0),
+    'America/Ojinaga': (29.5667, -104.4167, -6.0),
+    'America/Panama': (8.9667, -79.5333, -5.0),
+    'America/Paramaribo': (5.8333, -55.1667, -3.0),
+    'America/Phoenix': (33.4483, -112.0733, -7.0),
+    'America/Port-au-Prince': (18.5333, -72.3333, -5.0),
+    'America/Port_of_Spain': (10.65, -61.5167, -4.0),
+    'America/Porto_Velho': (-8.7667, -63.9, -4.0),
+    'America/Puerto_Rico': (18.4683, -66.1061, -4.0),
+    'America/Punta_Arenas': (-53.15, -70.9167, -3.0),
+    'America/Rankin_Inlet': (62.8167, -92.0831, -6.0),
+    'America/Recife': (-8.05, -34.9, -3.0),
+    'America/Regina': (50.4, -104.65, -6.0),
+    'America/Resolute': (74.6956, -94.8292, -6.0),
+    'America/Rio_Branco': (-9.9667, -67.8, -5.0),
+    'America/Santarem': (-2.4333, -54.8667, -3.0),
+    'America/Santiago': (-33.45, -70.6667, -4.0),
+    'America/Santo_Domingo': (18.4667, -69.9, -4.0),
+    'America/Sao_Paulo': (-23.5333, -46.6167, -3.0),
+    'America/Scoresbysund': (70.4833, -21.9667, -2.0),
+    'America/Sitka': (57.1764, -135.3019, -9.0),
+    'America/St_Barthelemy': (17.8833, -62.85, -4.0),
+    'America/St_Johns': (47.5667, -52.7167, -3.5),
+    'America/St_Kitts': (17.3, -62.7167, -4.0),
+    'America/St_Lucia': (14.0167, -61.0, -4.0),
+    'America/St_Thomas': (18.35, -64.9333, -4.0),
+    'America/St_Vincent': (13.15, -61.2333, -4.0),
+    'America/Swift_Current': (50.2833, -107.8333, -6.0),
+    'America/Tegucigalpa': (14.1, -87.2167, -6.0),
+    'America/Thule': (76.5667, -68.7833, -4.0),
+    'America/Tijuana': (32.5333, -117.0167, -8.0),
+    'America/Toronto': (43.65, -79.3833, -5.0),
+    'America/Tortola': (18.45, -64.6167, -4.0),
+    'America/Vancouver': (49.2667, -123.1167, -8.0),
+    'America/Whitehorse': (60.7167, -135.05, -7.0),
+    'America/Winnipeg': (49.8833, -97.15, -6.0),
+    'America/Yakutat': (59.5469, -139.7272, -9.0),
+    'Antarctica/Casey': (-66.2833, 110.5167, 8.0),
+    'Antarctica/Davis': (-68.5833, 77.9667, 7.0),
+    'Antarctica/DumontDUrville': (-66.6667, 140.0167, 10.0),
+    'Antarctica/Macquarie': (-54.5, 158.95, 10.0),
+    'Antarctica/Mawson': (-67.6, 62.8833, 5.0),
+    'Antarctica/McMurdo': (-77.8333, 166.6, 12.0),
+    'Antarctica/Palmer': (-64.8, -64.1, -3.0),
+    'Antarctica/Rothera': (-67.5667, -68.1333, -3.0),
+    'Antarctica/Syowa': (-69.0061, 39.59, 3.0),
+    'Antarctica/Troll': (-72.0114, 2.535, 0.0),
+    'Antarctica/Vostok': (-78.4, 106.9, 5.0),
+    'Arctic/Longyearbyen': (78.0, 16.0, 1.0),
+    'Asia/Aden': (12.75, 45.2, 3.0),
+    'Asia/Almaty': (43.25, 76.95, 5.0),
+    'Asia/Amman': (31.95, 35.9333, 3.0),
+    'Asia/Anadyr': (64.75, 177.4833, 12.0),
+    'Asia/Aqtau': (44.5167, 50.2667, 5.0),
+    'Asia/Aqtobe': (50.2833, 57.1667, 5.0),
+    'Asia/Ashgabat': (37.95, 58.3833, 5.0),
+    'Asia/Atyrau': (47.1167, 51.9333, 5.0),
+    'Asia/Baghdad': (33.35, 44.4167, 3.0),
+    'Asia/Bahrain': (26.3833, 50.5833, 3.0),
+    'Asia/Baku': (40.3833, 49.85, 4.0),
+    'Asia/Bangkok': (13.75, 100.5167, 7.0),
+    'Asia/Barnaul': (53.3667, 83.75, 7.0),
+    'Asia/Beirut': (33.8833, 35.5, 2.0),
+    'Asia/Bishkek': (42.9, 74.6, 6.0),
+    'Asia/Brunei': (4.9333, 114.9167, 8.0),
+    'Asia/Chita': (52.05, 113.4667, 9.0),
+    'Asia/Colombo': (6.9333, 79.85, 5.5),
+    'Asia/Damascus': (33.5, 36.3, 3.0),
+    'Asia/Dhaka': (23.7167, 90.4167, 6.0),
+    'Asia/Dili': (-8.55, 125.5833, 9.0),
+    'Asia/Dubai': (25.3, 55.3, 4.0),
+    'Asia/Dushanbe': (38.5833, 68.8, 5.0),
+    'Asia/Famagusta': (35.1167, 33.95, 2.0),
+    'Asia/Gaza': (31.5, 34.4667, 2.0),
+    'Asia/Hebron': (31.5333, 35.095, 2.0),
+    'Asia/Ho_Chi_Minh': (10.75, 106.6667, 7.0),
+    'Asia/Hong_Kong': (22.2833, 114.15, 8.0),
+    'Asia/Hovd': (48.0167, 91.65, 7.0),
+    'Asia/Irkutsk': (52.2667, 104.3333, 8.0),
+    'Asia/Jakarta': (-6.1667, 106.8, 7.0),
+    'Asia/Jayapura': (-2.5333, 140.7, 9.0),
+    'Asia/Jerusalem': (31.7806, 35.2239, 2.0),
+    'Asia/Kabul': (34.5167, 69.2, 4.5),
+    'Asia/Kamchatka': (53.0167, 158.65, 12.0),
+    'Asia/Karachi': (24.8667, 67.05, 5.0),
+    'Asia/Kathmandu': (27.7167, 85.3167, 5.75),
+    'Asia/Khandyga': (62.6564, 135.5539, 9.0),
+    'Asia/Kolkata': (22.5333, 88.3667, 5.5),
+    'Asia/Krasnoyarsk': (56.0167, 92.8333, 7.0),
+    'Asia/Kuala_Lumpur': (3.1667, 101.7, 8.0),
+    'Asia/Kuching': (1.55, 110.3333, 8.0),
+    'Asia/Kuwait': (29.3333, 47.9833, 3.0),
+    'Asia/Macau': (22.1972, 113.5417, 8.0),
+    'Asia/Magadan': (59.5667, 150.8, 11.0),
+    'Asia/Makassar': (-5.1167, 119.4, 8.0),
+    'Asia/Manila': (14.5867, 120.9678, 8.0),
+    'Asia/Muscat': (23.6, 58.5833, 4.0),
+    'Asia/Nicosia': (35.1667, 33.3667, 2.0),
+    'Asia/Novokuznetsk': (53.75, 87.1167, 7.0),
+    'Asia/Novosibirsk': (55.0333, 82.9167, 7.0),
+    'Asia/Omsk': (55.0, 73.4, 6.0),
+    'Asia/Oral': (51.2167, 51.35, 5.0),
+    'Asia/Phnom_Penh': (11.55, 104.9167, 7.0),
+    'Asia/Pontianak': (-0.0333, 109.3333, 7.0),
+    'Asia/Pyongyang': (39.0167, 125.75, 9.0),
+    'Asia/Qatar': (25.2833, 51.5333, 3.0),
+    'Asia/Qostanay': (53.2, 63.6167, 5.0),
+    'Asia/Qyzylorda': (44.8, 65.4667, 5.0),
+    'Asia/Riyadh': (24.6333, 46.7167, 3.0),
+    'Asia/Sakhalin': (46.9667, 142.7, 11.0),
+    'Asia/Samarkand': (39.6667, 66.8, 5.0),
+    'Asia/Seoul': (37.55, 126.9667, 9.0),
+    'Asia/Shanghai': (31.2333, 121.4667, 8.0),
+    'Asia/Singapore': (1.2833, 103.85, 8.0),
+    'Asia/Srednekolymsk': (67.4667, 153.7167, 11.0),
+    'Asia/Taipei': (25.05, 121.5, 8.0),
+    'Asia/Tashkent': (41.3333, 69.3, 5.0),
+    'Asia/Tbilisi': (41.7167, 44.8167, 4.0),
+    'Asia/Tehran': (35.6667, 51.4333, 3.5),
+    'Asia/Thimphu': (27.4667, 89.65, 6.0),
+    'Asia/Tokyo': (35.6544, 139.7447, 9.0),
+    'Asia/Tomsk': (56.5, 84.9667, 7.0),
+    'Asia/Ulaanbaatar': (47.9167, 106.8833, 8.0),
+    'Asia/Urumqi': (43.8, 87.5833, 6.0),
+    'Asia/Ust-Nera': (64.5603, 143.2267, 10.0),
+    'Asia/Vientiane': (17.9667, 102.6, 7.0),
+    'Asia/Vladivostok': (43.1667, 131.9333, 10.0),
+    'Asia/Yakutsk': (62.0, 129.6667, 9.0),
+    'Asia/Yangon': (16.7833, 96.1667, 6.5),
+    'Asia/Yekaterinburg': (56.85, 60.6, 5.0),
+    'Asia/Yerevan': (40.1833, 44.5, 4.0),
+    'Atlantic/Azores': (37.7333, -25.6667, -1.0),
+    'Atlantic/Bermuda': (32.2833, -64.7667, -4.0),
+    'Atlantic/Canary': (28.1, -15.4, 0.0),
+    'Atlantic/Cape_Verde': (14.9167, -23.5167, -1.0),
+    'Atlantic/Faroe': (62.0167, -6.7667, 0.0),
+    'Atlantic/Madeira': (32.6333, -16.9, 0.0),
+    'Atlantic/Reykjavik': (64.15, -21.85, 0.0),
+    'Atlantic/South_Georgia': (-54.2667, -36.5333, -2.0),
+    'Atlantic/St_Helena': (-15.9167, -5.7, 0.0),
+    'Atlantic/Stanley': (-51.7, -57.85, -3.0),
+    'Australia/Adelaide': (-34.9167, 138.5833, 9.5),
+    'Australia/Brisbane': (-27.4667, 153.0333, 10.0),
+    'Australia/Broken_Hill': (-31.95, 141.45, 9.5),
+    'Australia/Darwin': (-12.4667, 130.8333, 9.5),
+    'Australia/Eucla': (-31.7167, 128.8667, 8.75),
+    'Australia/Hobart': (-42.8833, 147.3167, 10.0),
+    'Australia/Lindeman': (-20.2667, 149.0, 10.0),
+    'Australia/Lord_Howe': (-31.55, 159.0833, 10.5),
+    'Australia/Melbourne': (-37.8167, 144.9667, 10.0),
+    'Australia/Perth': (-31.95, 115.85, 8.0),
+    'Australia/Sydney': (-33.8667, 151.2167, 10.0),
+    'Europe/Amsterdam': (52.3667, 4.9, 1.0),
+    'Europe/Andorra': (42.5, 1.5167, 1.0),
+    'Europe/Astrakhan': (46.35, 48.05, 4.0),
+    'Europe/Athens': (37.9667, 23.7167, 2.0),
+    'Europe/Belgrade': (44.8333, 20.5, 1.0),
+    'Europe/Berlin': (52.5, 13.3667, 1.0),
+    'Europe/Bratislava': (48.15, 17.1167, 1.0),
+    'Europe/Brussels': (50.8333, 4.3333, 1.0),
+    'Europe/Bucharest': (44.4333, 26.1, 2.0),
+    'Europe/Budapest': (47.5, 19.0833, 1.0),
+    'Europe/Busingen': (47.7, 8.6833, 1.0),
+    'Europe/Chisinau': (47.0, 28.8333, 2.0),
+    'Europe/Copenhagen': (55.6667, 12.5833, 1.0),
+    'Europe/Dublin': (53.3333, -6.25, 0.0),
+    'Europe/Gibraltar': (36.1333, -5.35, 1.0),
+    'Europe/Guernsey': (49.4547, -2.5361, 0.0),
+    'Europe/Helsinki': (60.1667, 24.9667, 2.0),
+    'Europe/Isle_of_Man': (54.15, -4.4667, 0.0),
+    'Europe/Istanbul': (41.0167, 28.9667, 3.0),
+    'Europe/Jersey': (49.1836, -2.1067, 0.0),
+    'Europe/Kaliningrad': (54.7167, 20.5, 2.0),
+    'Europe/Kirov': (58.6, 49.65, 3.0),
+    'Europe/Kyiv': (50.4333, 30.5167, 2.0),
+    'Europe/Lisbon': (38.7167, -9.1333, 0.0),
+    'Europe/Ljubljana': (46.05, 14.5167, 1.0),
+    'Europe/London': (51.5083, -0.1253, 0.0),
+    'Europe/Luxembourg': (49.6, 6.15, 1.0),
+    'Europe/Madrid': (40.4, -3.6833, 1.0),
+    'Europe/Malta': (35.9, 14.5167, 1.0),
+    'Europe/Mariehamn': (60.1, 19.95, 2.0),
+    'Europe/Minsk': (53.9, 27.5667, 3.0),
+    'Europe/Monaco': (43.7, 7.3833, 1.0),
+    'Europe/Moscow': (55.7558, 37.6178, 3.0),
+    'Europe/Oslo': (59.9167, 10.75, 1.0),
+    'Europe/Paris': (48.8667, 2.3333, 1.0),
+    'Europe/Podgorica': (42.4333, 19.2667, 1.0),
+    'Europe/Prague': (50.0833, 14.4333, 1.0),
+    'Europe/Riga': (56.95, 24.1, 2.0),
+    'Europe/Rome': (41.9, 12.4833, 1.0),
+    'Europe/Samara': (53.2, 50.15, 4.0),
+    'Europe/San_Marino': (43.9167, 12.4667, 1.0),
+    'Europe/Sarajevo': (43.8667, 18.4167, 1.0),
+    'Europe/Saratov': (51.5667, 46.0333, 4.0),
+    'Europe/Simferopol': (44.95, 34.1, 3.0),
+    'Europe/Skopje': (41.9833, 21.4333, 1.0),
+    'Europe/Sofia': (42.6833, 23.3167, 2.0),
+    'Europe/Stockholm': (59.3333, 18.05, 1.0),
+    'Europe/Tallinn': (59.4167, 24.75, 2.0),
+    'Europe/Tirane': (41.3333, 19.8333, 1.0),
+    'Europe/Ulyanovsk': (54.3333, 48.4, 4.0),
+    'Europe/Vaduz': (47.15, 9.5167, 1.0),
+    'Europe/Vatican': (41.9022, 12.4531, 1.0),
+    'Europe/Vienna': (48.2167, 16.3333, 1.0),
+    'Europe/Vilnius': (54.6833, 25.3167, 2.0),
+    'Europe/Volgograd': (48.7333, 44.4167, 3.0),
+    'Europe/Warsaw': (52.25, 21.0, 1.0),
+    'Europe/Zagreb': (45.8, 15.9667, 1.0),
+    'Europe/Zurich': (47.3833, 8.5333, 1.0),
+    'Indian/Antananarivo': (-18.9167, 47.5167, 3.0),
+    'Indian/Chagos': (-7.3333, 72.4167, 6.0),
+    'Indian/Christmas': (-10.4167, 105.7167, 7.0),
+    'Indian/Cocos': (-12.1667, 96.9167, 6.5),
+    'Indian/Comoro': (-11.6833, 43.2667, 3.0),
+    'Indian/Kerguelen': (-49.3528, 70.2175, 5.0),
+    'Indian/Mahe': (-4.6667, 55.4667, 4.0),
+    'Indian/Maldives': (4.1667, 73.5, 5.0),
+    'Indian/Mauritius': (-20.1667, 57.5, 4.0),
+    'Indian/Mayotte': (-12.7833, 45.2333, 3.0),
+    'Indian/Reunion': (-20.8667, 55.4667, 4.0),
+    'Pacific/Apia': (-13.8333, -171.7333, 13.0),
+    'Pacific/Auckland': (-36.8667, 174.7667, 12.0),
+    'Pacific/Bougainville': (-6.2167, 155.5667, 11.0),
+    'Pacific/Chatham': (-43.95, -176.55, 12.75),
+    'Pacific/Chuuk': (7.4167, 151.7833, 10.0),
+    'Pacific/Easter': (-27.15, -109.4333, -6.0),
+    'Pacific/Efate': (-17.6667, 168.4167, 11.0),
+    'Pacific/Fakaofo': (-9.3667, -171.2333, 13.0),
+    'Pacific/Fiji': (-18.1333, 178.4167, 12.0),
+    'Pacific/Funafuti': (-8.5167, 179.2167, 12.0),
+    'Pacific/Galapagos': (-0.9, -89.6, -6.0),
+    'Pacific/Gambier': (-23.1333, -134.95, -9.0),
+    'Pacific/Guadalcanal': (-9.5333, 160.2, 11.0),
+    'Pacific/Guam': (13.4667, 144.75, 10.0),
+    'Pacific/Honolulu': (21.3069, -157.8583, -10.0),
+    'Pacific/Kanton': (-2.7833, -171.7167, 13.0),
+    'Pacific/Kiritimati': (1.8667, -157.3333, 14.0),
+    'Pacific/Kosrae': (5.3167, 162.9833, 11.0),
+    'Pacific/Kwajalein': (9.0833, 167.3333, 12.0),
+    'Pacific/Majuro': (7.15, 171.2, 12.0),
+    'Pacific/Marquesas': (-9.0, -139.5, -9.5),
+    'Pacific/Midway': (28.2167, -177.3667, -11.0),
+    'Pacific/Nauru': (-0.5167, 166.9167, 12.0),
+    'Pacific/Niue': (-19.0167, -169.9167, -11.0),
+    'Pacific/Norfolk': (-29.05, 167.9667, 11.0),
+    'Pacific/Noumea': (-22.2667, 166.45, 11.0),
+    'Pacific/Pago_Pago': (-14.2667, -170.7, -11.0),
+    'Pacific/Palau': (7.3333, 134.4833, 9.0),
+    'Pacific/Pitcairn': (-25.0667, -130.0833, -8.0),
+    'Pacific/Pohnpei': (6.9667, 158.2167, 11.0),
+    'Pacific/Port_Moresby': (-9.5, 147.1667, 10.0),
+    'Pacific/Rarotonga': (-21.2333, -159.7667, -10.0),
+    'Pacific/Saipan': (15.2, 145.75, 10.0),
+    'Pacific/Tahiti': (-17.5333, -149.5667, -10.0),
+    'Pacific/Tarawa': (1.4167, 173.0, 12.0),
+    'Pacific/Tongatapu': (-21.1333, -175.2, 13.0),
+    'Pacific/Wake': (19.2833, 166.6167, 12.0),
+    'Pacific/Wallis': (-13.3, -176.1667, 12.0)
+}
@@ -0,0 +1,143 @@
+"""Every gateway makes its http requests through an `HttpTransport`, which keeps a pool of
+keep-alive `requests.Session`s per host. Reusing a session's connection spares each outbound call
+a tcp and tls handshake, and a module-level transport keeps those connections open across warm
+lambda invocations.
+"""
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+
+class HttpTransport:
+    """Pools up to `pool_size_per_host` sessions per host. A session is only used by one request
+    at a time, so `pool_size_per_host` also bounds the number of concurrent requests to a host;
+    extra requests wait for a session to be returned to the pool.
+
+    Requests time out after `connect_timeout` seconds waiting for a session or a connection and
+    `read_timeout` seconds waiting for a response, unless the caller passes its own `timeout`.
+    """
+
+    def __init__(self,
+                 pool_size_per_host: int = 4,
+                 connect_timeout: float = 3.05,
+                 read_timeout: float = 10.0) -> None:
+        self.pool_size_per_host = pool_size_per_host
+        self.timeout = (connect_timeout, read_timeout)
+        self._lock = threading.Lock()
+        self._pools: Dict[str, 'queue.LifoQueue[requests.Session]'] = {}
+        self._pool_sizes: Dict[str, int] = {}
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout)
+        with self._session(_host(url), _connect_timeout(kwargs['timeout'])) as session:
+            return session.request(method, url, **kwargs)
+
+    def preconnect(self, urls: Iterable[str]) -> None:
+        """Open a connection to the host of each of `urls` (in parallel) so that the first real
+        request to each host doesn't pay for the handshake, i.e. during a lambda's init phase.
+        Failures are logged and otherwise ignored.
+        """
+        threads = [
+            threading.Thread(target=self._preconnect, args=(url,), daemon=True)
+            for url in {f'{scheme}://{host}/' for scheme, host in map(_scheme_and_host, urls)}
+        ]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(timeout=sum(self.timeout))
+
+    def _preconnect(self, url: str) -> None:
+        try:
+            self.request('HEAD', url, allow_redirects=False)
+        except requests.RequestException:
+            logger.warning('Failed to preconnect to %s.', url, exc_info=True)
+
+    @contextmanager
+    def _session(self, host: str, timeout: Optional[float]) -> Iterator[requests.Session]:
+        pool = self._pool(host)
+
+        try:
+            session = pool.get_nowait()
+        except queue.Empty:
+            session = self._new_session(host) or self._wait_for_session(host, pool, timeout)
+
+        try:
+            yield session
+        finally:
+            pool.put(session)
+
+    def _pool(self, host: str) -> 'queue.LifoQueue[requests.Session]':
+        with self._lock:
+            if host not in self._pools:
+                self._pools[host] = queue.LifoQueue()
+                self._pool_sizes[host] = 0
+
+            return self._pools[host]
+
+    def _wait_for_session(self,
+                          host: str,
+                          pool: 'queue.LifoQueue[requests.Session]',
+                          timeout: Optional[float]) -> requests.Session:
+        try:
+            return pool.get(timeout=timeout)
+        except queue.Empty:
+            raise requests.exceptions.ConnectTimeout(
+                f'Timed out after {timeout} seconds waiting for a session to {host}.'
+            ) from None
+
+    def _new_session(self, host: str) -> Optional[requests.Session]:
+        """Create a new session for `host` if its pool isn't full, otherwise return None."""
+        with self._lock:
+            if self._pool_sizes[host] >= self.pool_size_per_host:
+                return None
+
+            self._pool_sizes[host] += 1
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+
+default_transport = HttpTransport()
+
+
+def _host(url: str) -> str:
+    """
+    >>> _host('https://micro.morningcd.com/listens/1')
+    'micro.morningcd.com'
+    """
+    return urlsplit(url).netloc
+
+
+def _connect_timeout(timeout: Union[None, float, Tuple[float, float]]) -> Optional[float]:
+    """The part of a requests `timeout` spent waiting to connect.
+
+    >>> _connect_timeout((3.05, 10.0))
+    3.05
+    >>> _connect_timeout(5.0)
+    5.0
+    """
+    return timeout[0] if isinstance(timeout, tuple) else timeout
+
+
+def _scheme_and_host(url: str) -> Tuple[str, str]:
+    split_url = urlsplit(url)
+    return split_url.scheme, split_url.netloc
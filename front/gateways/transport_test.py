@@ -0,0 +1,166 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+import pytest
+
+import requests
+
+from front.gateways.transport import HttpTransport
+
+
+class LocalServer:
+    """A local http/1.1 server that records the method, path and client port of each request, and
+    the most requests ever in flight at once. Requests to /slow wait for `unblock` first.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[str, str, int]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.unblock = threading.Event()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, args=(0.01,), daemon=True).start()
+        self.url = f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def __enter__(self) -> 'LocalServer':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.unblock.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self) -> None:
+                self._respond()
+
+            def do_HEAD(self) -> None:
+                self._respond()
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def _respond(self) -> None:
+                with server._lock:
+                    server.requests.append((self.command, self.path, self.client_address[1]))
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+
+                if self.path == '/slow':
+                    server.unblock.wait(timeout=5)
+                else:
+                    time.sleep(0.01)
+
+                with server._lock:
+                    server.in_flight -= 1
+
+                self.send_response(200)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+        return Handler
+
+
+class TestPooling:
+
+    def test_reuses_a_sessions_connection_across_requests(self) -> None:
+        with LocalServer() as server:
+            # Given a transport
+            transport = HttpTransport()
+
+            # When we make two requests to the same host, one after the other
+            transport.get(f'{server.url}/a')
+            transport.get(f'{server.url}/b')
+
+            # Then both are made on the same connection
+            assert [path for _, path, _ in server.requests] == ['/a', '/b']
+            assert len({port for _, _, port in server.requests}) == 1
+
+    def test_bounds_concurrent_requests_to_a_host_by_the_pool_size(self) -> None:
+        with LocalServer() as server:
+            # Given a transport with two sessions per host
+            transport = HttpTransport(pool_size_per_host=2)
+
+            # When we make six requests to the same host at once
+            threads = [threading.Thread(target=transport.get, args=(f'{server.url}/{i}',))
+                       for i in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            # Then every request is made, two at a time, on two connections
+            assert len(server.requests) == 6
+            assert server.max_in_flight == 2
+            assert len({port for _, _, port in server.requests}) == 2
+
+
+class TestTimeouts:
+
+    def test_times_out_waiting_for_a_session_from_a_full_pool(self) -> None:
+        with LocalServer() as server:
+            # Given a transport with one session per host, which is in use
+            transport = HttpTransport(pool_size_per_host=1, connect_timeout=0.05)
+            thread = threading.Thread(target=transport.get, args=(f'{server.url}/slow',))
+            thread.start()
+            while not server.requests:
+                time.sleep(0.01)
+
+            # When we make another request to the host, then it times out waiting for the session
+            with pytest.raises(requests.exceptions.ConnectTimeout):
+                transport.get(f'{server.url}/a')
+
+            # And once the session is returned to the pool, requests use it again
+            server.unblock.set()
+            thread.join()
+            transport.get(f'{server.url}/a')
+            assert [path for _, path, _ in server.requests] == ['/slow', '/a']
+
+    def test_times_out_waiting_for_a_response(self) -> None:
+        with LocalServer() as server:
+            # Given a transport
+            transport = HttpTransport(read_timeout=0.05)
+
+            # When we make a request that isn't answered in time, then it times out
+            with pytest.raises(requests.exceptions.ReadTimeout):
+                transport.get(f'{server.url}/slow')
+
+
+class TestPreconnect:
+
+    def test_opens_one_connection_per_host_for_the_first_request_to_use(self) -> None:
+        with LocalServer() as server:
+            # Given a transport
+            transport = HttpTransport()
+
+            # When we preconnect to two urls on the same host, then make a request to it
+            transport.preconnect([f'{server.url}/listens', f'{server.url}/songs'])
+            transport.get(f'{server.url}/listens')
+
+            # Then the host is preconnected to once, and the request uses that connection
+            assert [(method, path) for method, path, _ in server.requests] == [
+                ('HEAD', '/'),
+                ('GET', '/listens')
+            ]
+            assert len({port for _, _, port in server.requests}) == 1
+
+    def test_ignores_hosts_it_cant_connect_to(self) -> None:
+        # Given a transport, and a host that refuses connections
+        transport = HttpTransport(connect_timeout=0.05)
+        server = LocalServer()
+        server.close()
+
+        # When we preconnect to it, then nothing raises
+        transport.preconnect([f'{server.url}/listens'])
@@ -1,8 +1,21 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple, Union
 
-from front.context import Context
-from front.definitions import Listen, ListenInput, Song, SortOrder
+from front.context import AsyncContext, Context
+from front.definitions import Listen, ListenInput, MusicProvider, Song, SortOrder
+from front.definitions.exceptions import ListensError, MusicError
+from front.gateways.sunlight import AsyncSunlightGatewayABC, SunlightGatewayABC
+
+
+# listens within this margin of sunrise or sunset are left for the listens service to judge, as
+# the sunlight windows we know of may differ slightly from its own.
+NIGHTTIME_MARGIN = timedelta(minutes=5)
+
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+# the most listens that can be submitted in one `submit_listens`, to keep a single invocation well
+# within its timeout.
+MAX_LISTENS_PER_SUBMISSION = 100
 
 
 def get_listens(context: Context,
@@ -18,13 +31,220 @@ def get_listens(context: Context,
     )
 
 
+def has_listens_beyond(context: Context, cursor: datetime, sort_order: SortOrder) -> bool:
+    """Whether there's a listen at or beyond `cursor` in `sort_order`: at or after it if ascending,
+    at or before it otherwise. Fetching a single listen is cheap, and usually answered from cache.
+    """
+    before_utc, after_utc = _beyond(cursor, sort_order)
+    return bool(get_listens(context, 1, sort_order, before_utc, after_utc))
+
+
 def get_listen(context: Context, listen_id: str) -> Listen:
     return context.listens_gateway.fetch_listen(listen_id)
 
 
+def get_listens_by_ids(context: Context,
+                       listen_ids: Sequence[str]) -> List[Union[Listen, ListensError]]:
+    return context.listens_gateway.fetch_listens_by_ids(listen_ids)
+
+
 def get_song_of_listen(context: Context, listen: Listen) -> Song:
     return context.music_gateway.fetch_song_of_listen(listen)
 
 
+def get_song(context: Context, song_provider: MusicProvider, song_id: str) -> Song:
+    return context.music_gateway.fetch_song(song_provider, song_id)
+
+
+def get_songs_of_listens(context: Context,
+                         listens: Sequence[Listen]) -> List[Union[Song, MusicError]]:
+    return context.music_gateway.fetch_songs(listens)
+
+
+def reject_nighttime_listen(context: Union[Context, AsyncContext],
+                            listen_input: ListenInput) -> None:
+    """Raise the listens service's error for `listen_input` if it's clearly nighttime, without a
+    network call, so that callers can validate a listen before starting any work for it.
+    """
+    _reject_nighttime_listen(context.sunlight_gateway, listen_input, datetime.utcnow())
+
+
 def submit_listen(context: Context, listen_input: ListenInput) -> Listen:
+    reject_nighttime_listen(context, listen_input)
+    return submit_validated_listen(context, listen_input)
+
+
+def submit_validated_listen(context: Context, listen_input: ListenInput) -> Listen:
+    """Submit `listen_input` once the caller has checked it with `reject_nighttime_listen`."""
     return context.listens_gateway.submit_listen(listen_input)
+
+
+def submit_listens(context: Context,
+                   listen_inputs: Sequence[ListenInput]) -> List[Union[Listen, ListensError]]:
+    """Submit each of `listen_inputs`, returning the submitted listen or the error submitting it,
+    in order.
+    """
+    _validate_listen_inputs(listen_inputs)
+    rejections = _nighttime_rejections(context.sunlight_gateway, listen_inputs, datetime.utcnow())
+    submitted_listens = context.listens_gateway.submit_listens(
+        [listen_input for listen_input, rejection in zip(listen_inputs, rejections)
+         if rejection is None]
+    )
+    return _merge_rejections(rejections, submitted_listens)
+
+
+async def get_listens_async(context: AsyncContext,
+                            limit: int,
+                            sort_order: SortOrder,
+                            before_utc: Optional[datetime] = None,
+                            after_utc: Optional[datetime] = None) -> List[Listen]:
+    return await context.listens_gateway.fetch_listens(
+        before_utc=before_utc,
+        after_utc=after_utc,
+        sort_order=sort_order,
+        limit=limit
+    )
+
+
+async def has_listens_beyond_async(context: AsyncContext,
+                                   cursor: datetime,
+                                   sort_order: SortOrder) -> bool:
+    before_utc, after_utc = _beyond(cursor, sort_order)
+    return bool(await get_listens_async(context, 1, sort_order, before_utc, after_utc))
+
+
+async def get_listen_async(context: AsyncContext, listen_id: str) -> Listen:
+    return await context.listens_gateway.fetch_listen(listen_id)
+
+
+async def get_listens_by_ids_async(context: AsyncContext,
+                                   listen_ids: Sequence[str]) -> List[Union[Listen, ListensError]]:
+    return await context.listens_gateway.fetch_listens_by_ids(listen_ids)
+
+
+async def get_song_async(context: AsyncContext,
+                         song_provider: MusicProvider,
+                         song_id: str) -> Song:
+    return await context.music_gateway.fetch_song(song_provider, song_id)
+
+
+async def get_songs_of_listens_async(context: AsyncContext,
+                                     listens: Sequence[Listen]) -> List[Union[Song, MusicError]]:
+    return await context.music_gateway.fetch_songs(listens)
+
+
+async def submit_listen_async(context: AsyncContext, listen_input: ListenInput) -> Listen:
+    reject_nighttime_listen(context, listen_input)
+    return await submit_validated_listen_async(context, listen_input)
+
+
+async def submit_validated_listen_async(context: AsyncContext, listen_input: ListenInput) -> Listen:
+    return await context.listens_gateway.submit_listen(listen_input)
+
+
+async def submit_listens_async(context: AsyncContext,
+                               listen_inputs: Sequence[ListenInput]
+                               ) -> List[Union[Listen, ListensError]]:
+    _validate_listen_inputs(listen_inputs)
+    rejections = _nighttime_rejections(context.sunlight_gateway, listen_inputs, datetime.utcnow())
+    submitted_listens = await context.listens_gateway.submit_listens(
+        [listen_input for listen_input, rejection in zip(listen_inputs, rejections)
+         if rejection is None]
+    )
+    return _merge_rejections(rejections, submitted_listens)
+
+
+def _validate_listen_inputs(listen_inputs: Sequence[ListenInput]) -> None:
+    if len(listen_inputs) > MAX_LISTENS_PER_SUBMISSION:
+        raise ListensError(
+            f'Only up to {MAX_LISTENS_PER_SUBMISSION} listens can be submitted at a time'
+        )
+
+
+def _nighttime_rejections(sunlight_gateway: Union[SunlightGatewayABC, AsyncSunlightGatewayABC],
+                          listen_inputs: Sequence[ListenInput],
+                          now_utc: datetime) -> List[Optional[ListensError]]:
+    """The error rejecting each of `listen_inputs` as clearly submitted at night, if it is."""
+    rejections: List[Optional[ListensError]] = []
+    for listen_input in listen_inputs:
+        try:
+            _reject_nighttime_listen(sunlight_gateway, listen_input, now_utc)
+        except ListensError as e:
+            rejections.append(e)
+        else:
+            rejections.append(None)
+
+    return rejections
+
+
+def _merge_rejections(rejections: Sequence[Optional[ListensError]],
+                      submitted_listens: Sequence[Union[Listen, ListensError]]
+                      ) -> List[Union[Listen, ListensError]]:
+    """Put `submitted_listens`, the results of the listens that weren't rejected, back between the
+    rejections.
+
+    >>> _merge_rejections([None, ListensError('Night'), None], ['first', 'second'])
+    ['first', ListensError('Night'), 'second']
+    """
+    submitted = iter(submitted_listens)
+    return [rejection or next(submitted) for rejection in rejections]
+
+
+def _beyond(cursor: datetime,
+            sort_order: SortOrder) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """The `(before_utc, after_utc)` bounds of the listens at or beyond `cursor` in `sort_order`.
+    The listens service's bounds are exclusive, so the bound is a microsecond behind `cursor`.
+
+    >>> _beyond(datetime(2018, 11, 12, 15, 0), SortOrder.DESCENDING)
+    (datetime.datetime(2018, 11, 12, 15, 0, 0, 1), None)
+    >>> _beyond(datetime(2018, 11, 12, 15, 0), SortOrder.ASCENDING)
+    (None, datetime.datetime(2018, 11, 12, 14, 59, 59, 999999))
+    """
+    if sort_order == SortOrder.ASCENDING:
+        return None, cursor - ONE_MICROSECOND
+
+    return cursor + ONE_MICROSECOND, None
+
+
+def _reject_nighttime_listen(sunlight_gateway: Union[SunlightGatewayABC, AsyncSunlightGatewayABC],
+                             listen_input: ListenInput,
+                             now_utc: datetime) -> None:
+    """The listens service rejects listens submitted at night. When we can tell that it's night
+    without a network call, we reject the listen with the listens service's own error instead of
+    sending it.
+    """
+    if _is_clearly_nighttime(sunlight_gateway, listen_input.iana_timezone, now_utc):
+        raise ListensError('Listens can only be submitted during the day')
+
+
+def _is_clearly_nighttime(sunlight_gateway: Union[SunlightGatewayABC, AsyncSunlightGatewayABC],
+                          iana_timezone: str,
+                          now_utc: datetime) -> bool:
+    """Whether `now_utc` is more than `NIGHTTIME_MARGIN` outside of `iana_timezone`'s sunlight
+    windows. The timezone's local date is within a day of the utc date, so it's enough to check
+    the sunlight windows of the utc dates around `now_utc`. If any of those isn't known without a
+    network call, it isn't clearly nighttime.
+
+    >>> from front.gateways.sunlight import LocalSunlightGateway
+    >>> gateway = LocalSunlightGateway()  # sunset is at 21:40:35 utc
+    >>> _is_clearly_nighttime(gateway, 'America/New_York', datetime(2018, 11, 12, 23, 0))
+    True
+    >>> _is_clearly_nighttime(gateway, 'America/New_York', datetime(2018, 11, 12, 21, 44))
+    False
+    >>> _is_clearly_nighttime(gateway, 'Etc/UTC', datetime(2018, 11, 12, 23, 0))
+    False
+    """
+    for days in (-1, 0, 1):
+        sunlight_window = sunlight_gateway.peek_sunlight_window(
+            iana_timezone,
+            (now_utc + timedelta(days=days)).date()
+        )
+        if sunlight_window is None:
+            return False
+
+        sunrise_utc = sunlight_window.sunrise_utc - NIGHTTIME_MARGIN
+        sunset_utc = sunlight_window.sunset_utc + NIGHTTIME_MARGIN
+        if sunrise_utc <= now_utc <= sunset_utc:
+            return False
+
+    return True
@@ -1,7 +1,12 @@
 from datetime import date
+from typing import List
 
-from front.context import Context
-from front.definitions import SunlightWindow
+from front.context import AsyncContext, Context
+from front.definitions import SunlightWindow, exceptions
+
+
+# a year's worth, leap years included
+MAX_SUNLIGHT_WINDOWS = 366
 
 
 def get_sunlight_window(context: Context, iana_timezone: str, on_date: date) -> SunlightWindow:
@@ -9,3 +14,54 @@ def get_sunlight_window(context: Context, iana_timezone: str, on_date: date) ->
         iana_timezone,
         on_date
     )
+
+
+async def get_sunlight_window_async(context: AsyncContext,
+                                    iana_timezone: str,
+                                    on_date: date) -> SunlightWindow:
+    return await context.sunlight_gateway.fetch_sunlight_window(
+        iana_timezone,
+        on_date
+    )
+
+
+def get_sunlight_windows(context: Context,
+                         iana_timezone: str,
+                         from_date: date,
+                         to_date: date) -> List[SunlightWindow]:
+    _validate_date_range(from_date, to_date)
+    return context.sunlight_gateway.fetch_sunlight_windows(
+        iana_timezone,
+        from_date,
+        to_date
+    )
+
+
+async def get_sunlight_windows_async(context: AsyncContext,
+                                     iana_timezone: str,
+                                     from_date: date,
+                                     to_date: date) -> List[SunlightWindow]:
+    _validate_date_range(from_date, to_date)
+    return await context.sunlight_gateway.fetch_sunlight_windows(
+        iana_timezone,
+        from_date,
+        to_date
+    )
+
+
+def _validate_date_range(from_date: date, to_date: date) -> None:
+    """
+    >>> _validate_date_range(date(2018, 1, 1), date(2018, 12, 31))
+    >>> _validate_date_range(date(2018, 1, 1), date(2017, 12, 31))
+    Traceback (most recent call last):
+    ...
+    front.definitions.exceptions.SunlightError: toDate must not be before fromDate
+    """
+    if to_date < from_date:
+        raise exceptions.SunlightError('toDate must not be before fromDate')
+
+    if (to_date - from_date).days + 1 > MAX_SUNLIGHT_WINDOWS:
+        raise exceptions.SunlightError(
+            f'Sunlight windows can only be requested for up to {MAX_SUNLIGHT_WINDOWS} days at a '
+            'time'
+        )